@@ -22,8 +22,8 @@ TODO:
     [X] Update existing playlists only if new links are to be added/removed/reordered.
         Option to not reorder.
     [] GUI
-    [] Check all existing playlist for disc/file paths that no longer exists. Even if
-       they're not being updated.
+    [X] Check all existing playlist for disc/file paths that no longer exists. Even if
+        they're not being updated.
 
 '''
 
@@ -31,6 +31,14 @@ TODO:
 # Set this to False and this script will just run, create the playlists, and close.
 loop_script = True
 
+# Finish each directory's playlists and move its games out of memory (into a temporary file)
+# before searching the next directory. Only the names of the games are kept, so a game found
+# again in a later directory is brought back and can still be combined into a compilation
+# playlist. Memory use and the time each directory takes stay the same no matter how many
+# directories are searched in one run.
+# Note: Existing playlists are verified after each directory instead of at the end.
+evict_finished_roots = False
+
 # Playlists will only be overwritten if there are new disc paths to be added. However, if
 # you don't ever want existing playlist files overwritten, set this to False.
 # Note: When adding new disc paths to an existing playlist, old disc/file paths will be
@@ -40,8 +48,9 @@ overwrite_playlists = True
 # Confirm disc file paths in "all" playlists have working links. Disc paths will be removed if
 # if they no longer link to an existing file. And if a playlist has no existing disc file
 # paths, it too will be deleted.
-# Note: Overwriting of playlists must be enabled.
-verify_all_playlists = True ## TODO
+# Note: Overwriting of playlists must be enabled. All playlists found in the directories searched
+#       (and "save_all_playlists_in") are checked, after the new playlists have been created.
+verify_all_playlists = True
 
 # If your game's disc image format is not included below add it now.
 # 1. Image File Extension
@@ -53,6 +62,14 @@ disc_extensions = { '.chd' : ['CHD', True],  # A CHD image file (Compressed Hunk
                     '.mds' : ['MDS', False], # Used with MDF image files (Media Descriptor File/Sidecar)
                   }
 
+# Check that the track files (BIN, WAV, etc) each CUE sheet links to exist, so a missing track
+# doesn't go unnoticed until the emulator fails to load the disc. Only the file names already
+# found while searching are used, so no extra checks are made on the drive.
+# 'flag'    - Add CUE sheets with missing track files to the log.
+# 'exclude' - Add them to the log and leave them out of playlists.
+# 'off'     - Don't read CUE sheets.
+check_cue_sheets = 'flag'
+
 # Use relative disc paths in playlists instead of full absolute paths, for better portability.
 use_relative_paths = False
 
@@ -105,30 +122,138 @@ re_disc_number_group = 4
 re_disc_info_pattern = ( '(\s*)' + '(\(|\[)' + '(CD|Disc|Disk|DVD|Game|Game\s*Disc)' +
                          '\s*(\d+)\s*\w*\s*(\d*)*' + '(\)|\])' )
 
+# Number of directories searched at the same time. Searching is mostly spent waiting on the
+# drive (or network share), so using more workers than CPU cores is fine. Set to 1 to search
+# one directory at a time.
+scan_worker_count = 8
+
+# When more than one directory is given, search this many of them at the same time, each in
+# its own process. Best used when the directories are on different drives. Set to 1 to search
+# one directory after another.
+# Note: Playlists are still created in the same order, as if searched one after another.
+root_process_count = 1
+
+# Number of playlist files saved at the same time. Each playlist is first written to a temporary
+# file and then swapped in, so a playlist is never left half written if this script is closed.
+playlist_write_workers = 8
+
+# How files are read and written on the drive.
+# 'threads' - Each step uses its own pool of threads ("scan_worker_count", "playlist_write_workers").
+# 'asyncio' - All directory searches, file checks, playlist reads and writes are scheduled through
+#             one event loop, with up to "io_concurrency" waiting on the drive at the same time.
+#             Best for network shares (SMB/NFS) where every call waits on the network.
+io_backend = 'threads'
+io_concurrency = 32
+
+# Remember the disc images found in each directory between runs, saved in a cache file next
+# to the log file. Only directories that have been modified since the last run will be
+# searched again. Changing any of the regular expression patterns below or which disc
+# extensions are search enabled will automatically start a new cache.
+use_scan_cache = True
+
+# Instead of searching the directories, read the files in them from a list already made (a
+# manifest), e.g. "find . -type f" or "find . -type f -printf '%p\t%s\t%T@\n'" ran in the
+# directory. One file path per line (or separated by NUL characters, "-print0"), optionally
+# followed by a tab, the file size and a tab and the modified time (seconds). Relative paths
+# are joined to the directory given and paths outside it are skipped. When more than one
+# directory is given the manifest is only read once, each path is given to the directories it's
+# in. Use '-' to read the list from stdin. Leave blank to search the directories as usual.
+# Note: Each directory's files should be listed together (as "find" and "sort" do). The scan
+#       cache isn't used, and the sizes and modified times are only used when hashing.
+manifest_file_path = r''
+
+# Identify disc images by their SHA-1 hash using Redump/No-Intro DAT files (XML), not just by their
+# file names. Matched disc images are grouped using the game name in the DAT instead, so a badly
+# named disc image still gets the correct "Game Title", "Game Info" and disc number.
+# Note: CHD images are identified by the SHA-1 saved in their header, which only DATs listing CHD
+#       disks will have. All other disc images are fully read and hashed, "hash_process_count" at
+#       a time, and CUE sheets are matched by the track files they link. Hashes are remembered
+#       between runs in a cache file next to this script, so each file is only read again if it's
+#       modified.
+dat_file_paths = []
+hash_process_count = 4
+
+# Instead of closing when done, keep watching the searched directories and update the playlists
+# of any game that has disc images added, renamed or removed. On Linux changes are reported
+# right away (inotify), on other systems directories are checked every "watch_poll_interval".
+# Note: The playlists of each changed game are updated once no more changes have been made to its
+#       disc images for "watch_delay" seconds.
+watch_directories = False
+watch_delay = 5
+watch_poll_interval = 10
+
+# How much is shown while this script runs. Errors are always shown.
+# 'quiet'  - A single progress line while searching and the totals when done.
+# 'normal' - Also each directory searched and each step taken.
+# 'debug'  - Also every disc image found and how it was added to a playlist (slow on big libraries).
+console_output = 'quiet'
+
+# The time spent in each phase of a run (searching, grouping, saving, etc) is always shown at the
+# end and added to the log. To find out more about where the time or memory goes:
+# 'cprofile'    - Save a profile of each phase next to this script (view with "python -m pstats").
+# 'tracemalloc' - Record the memory used by each phase and save where the most was used.
+# Note: Both will slow this script down. Leave blank to turn off.
+profile_phases = ''
+
 # Create a log file that will record all the details of each playlist created, which includes
 # the full file paths of the playlists and the disc image files recorded within.
-# Note: Log file creation is always overwritten, not appended too.
+# Note: The log file is overwritten each time this script starts and added to while it runs.
 create_log_file = True
 
+# Log file format, either 'text' (easy to read) or 'jsonl' (JSON Lines, one record per playlist
+# for other programs to read). Each playlist is added to the log as soon as it's saved.
+# Note: The text format only lists playlists saved (or not saved due to errors) and is only
+#       created when something changed. The jsonl format has a record of every playlist, including
+#       those not overwritten or not updated, and the totals of every run.
+log_file_format = 'text'
+
+# Once the log file grows past this many bytes it's renamed (".1", ".2", etc) and a new log file
+# is started, keeping up to "log_file_backup_count" old log files. Set to 0 to never do this.
+log_file_max_size = 0
+log_file_backup_count = 3
+
 
 ### Don't Edit Below This Line ###
 
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait as waitForFutures
+import argparse
+import asyncio
+import collections
+import contextlib
+import cProfile
 from pathlib import Path, PurePath
-from os import startfile as OpenFile, walk as Search
+import ctypes
+import ctypes.util
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import os
 import re
+import pickle
+import select
+import struct
 import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+try:
+    from os import startfile as OpenFile
+except ImportError: # Windows only
+    OpenFile = None
+
+logger = logging.getLogger('auto_m3u_playlist_generator')
 
 FORMAT_NAME = 0
 SEARCHABLE = 1
-LOG_DATA = 137
 NOT_OVERWRITTEN = 0
 NOT_UPDATED = 1
 SAVED = 2
 UPDATED = 3
 ERROR_NOT_SAVED = 4
-GAME_INFO = 0
-GAME_TYPE = 0
-GAME_PATH_RELATIVE = 1 ## TODO: no longer needed, delete
 MULTI_DISC = 10
 COMPILATION = 11
 COMPILATION_UP_ONE = 12 ## TODO: no longer needed, delete
@@ -138,451 +263,2179 @@ UNKNOWN = 14
 re_game_title_compiled_pattern = None
 re_game_info_compiled_pattern = None
 re_disc_info_compiled_pattern = None
+searchable_disc_extensions = frozenset()
+searchable_disc_extension_lengths = ()
+compiled_pattern_settings = None # The settings the patterns above were compiled with
+parseDiscFileStem = None # Reads file names with the patterns above (see "readDiscFileStem")
+
+# The compiled patterns of each set of pattern settings used, and the disc image file names already
+# read with them. Swapping settings (each "PlaylistGenerator" run) only has to look them up again
+# and nothing already read is lost. {pattern settings : (the globals above set by "compileRE")}
+compiled_patterns = {}
+COMPILED_PATTERNS_KEPT = 8
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE |
+                 IN_DELETE_SELF | IN_MOVE_SELF)
+INOTIFY_EVENT = struct.Struct('iIII')
+
+GAME_INFO_LIST = 1
+PARSE_CACHE_SIZE = 131072
+
+# Settings a root directory search process needs, copied over from this process.
+ROOT_PROCESS_SETTINGS = ('disc_extensions', 're_game_title_pattern', 're_game_info_pattern',
+                         're_disc_number_group', 're_disc_info_pattern', 'scan_worker_count', 'use_scan_cache',
+                         'check_cue_sheets', 'io_backend', 'io_concurrency')
+
+CONSOLE_OUTPUT_LEVELS = { 'quiet' : logging.WARNING, 'normal' : logging.INFO, 'debug' : logging.DEBUG }
+PROGRESS_INTERVAL = 0.5 # Seconds between progress line updates
+
+IO_THREADS = 'threads'
+IO_ASYNCIO = 'asyncio'
+
+CUE_SHEET_CHECKS = ('flag', 'exclude', 'off')
+CUE_SHEET_EXCLUDE = 'exclude'
+CUE_SHEET_OFF = 'off'
+CUE_SHEET_MAX_SIZE = 1048576 # Anything bigger isn't a CUE sheet
+CUE_FILE_PATTERN = re.compile(r'^[ \t]*FILE[ \t]+(?:"([^"\r\n]*)"|(\S+))', re.IGNORECASE | re.MULTILINE)
+
+MANIFEST_CHUNK_SIZE = 1048576
+MANIFEST_STDIN = '-'
+
+HASH_CACHE_VERSION = 2
+HASH_CHUNK_SIZE = 1048576
+HASH_LOOKAHEAD = 16 # Directories searched ahead so disc images are hashed while others are grouped
+CHD_MAGIC = b'MComprHD'
+CHD_SHA1_OFFSETS = { 3 : 80, 4 : 48, 5 : 84 } # CHD header version : Offset of the SHA-1
+
+PROFILE_CPROFILE = 'cprofile'
+PROFILE_TRACEMALLOC = 'tracemalloc'
+PHASE_NAMES = {
+    'scan' : 'Searching Directories',
+    'group' : 'Grouping Discs Into Games',
+    'compilation_check' : 'Checking For Compilation Games',
+    'dupe_merge' : 'Merging Same Name Games',
+    'identify' : 'Identifying Discs By Hash',
+    'cue_check' : 'Checking CUE Sheets',
+    'create_playlists' : 'Creating Playlists',
+    'read_playlists' : 'Reading Existing Playlists',
+    'write_playlists' : 'Saving Playlists',
+    'verify' : 'Verifying Existing Playlists',
+}
+
+LOG_TEXT = 'text'
+LOG_JSONL = 'jsonl'
+PLAYLIST_CREATION_NAMES = ['not_overwritten', 'not_updated', 'saved', 'updated']
+GAME_TYPE_NAMES = { MULTI_DISC : 'multi_disc', COMPILATION : 'compilation', COMPILATION_UP_ONE : 'compilation',
+                    DIFF_VERSION : 'different_version', UNKNOWN : 'unknown' }
+GAME_TYPE_TITLES = { MULTI_DISC : 'Multi-Disc Game Title', COMPILATION : 'Compilation Game Title',
+                     COMPILATION_UP_ONE : 'Compilation Game Title', DIFF_VERSION : 'Different Game Version Title',
+                     UNKNOWN : 'Game Title' }
+
+# Exit codes returned by "main"
+EXIT_SUCCESS = 0
+EXIT_ERRORS = 1 # Playlists couldn't be saved or a directory doesn't exist
+EXIT_USAGE = 2 # Same as argparse uses for bad arguments
+
+# Settings a "PlaylistGenerator" is given in its GeneratorConfig. Everything that only makes sense
+# when this script is ran by itself (prompts, console output and watching directories) is left out.
+GENERATOR_SETTINGS = ('evict_finished_roots', 'overwrite_playlists', 'verify_all_playlists', 'disc_extensions',
+                      'check_cue_sheets', 'use_relative_paths', 'keep_existing_playlist_disc_order',
+                      'force_combine_disc_formats', 'ignore_compilation_discs', 'save_playlists_in_common_directory',
+                      'save_all_playlists_in', 're_game_title_pattern', 're_game_info_pattern', 're_disc_number_group',
+                      're_disc_info_pattern', 'scan_worker_count', 'root_process_count', 'playlist_write_workers',
+                      'io_backend', 'io_concurrency', 'use_scan_cache', 'manifest_file_path', 'dat_file_paths',
+                      'hash_process_count', 'profile_phases', 'create_log_file', 'log_file_format',
+                      'log_file_max_size', 'log_file_backup_count')
+
+# What a "PlaylistGenerator" keeps between runs, and what's started fresh for each run.
+GENERATOR_WARM_STATE = ('scan_cache', 'dat_index', 'hash_cache')
+GENERATOR_RUN_STATE = ('directory_listings', 'cue_sheet_tracks', 'manifest_file_stats', 'run_log', 'phase_stack',
+                       'phase_profiles', 'phase_memory_snapshots')
+
+# Settings that can be changed from the command line, {setting: help text}
+COMMAND_LINE_SETTINGS = {
+    'loop_script' : 'keep asking for more directories to search when done',
+    'evict_finished_roots' : 'move each directory\'s games out of memory once its playlists are done',
+    'overwrite_playlists' : 'update existing playlists with new disc paths',
+    'use_relative_paths' : 'save relative disc paths in playlists',
+    'keep_existing_playlist_disc_order' : 'append new disc paths to existing playlists without reordering',
+    'force_combine_disc_formats' : 'place all disc formats of a game in the same playlist',
+    'ignore_compilation_discs' : 'don\'t create playlists for compilation games',
+    'save_playlists_in_common_directory' : 'save compilation playlists in a directory common to all discs',
+    'use_scan_cache' : 'remember disc images found in each directory between runs',
+    'watch_directories' : 'keep watching searched directories and update playlists when they change',
+    'create_log_file' : 'create a log file of all playlists created',
+}
+SCAN_CACHE_VERSION = 4
+DIR_MTIME = 0
+DIR_INODE = 1
+DIR_SUB_DIRS = 2
+DIR_DISC_FILES = 3
+DIR_PLAYLISTS = 4
+DIR_TRACK_FILES = 5 # Other file names, only kept in directories with CUE sheets
+DIR_CUE_SHEETS = 6 # CUE sheet file name : [Track file names]
+DIR_CUE_SHEET_STATS = 7 # CUE sheet file name : [Size, Modified time], to know when a sheet was edited
+scan_cache = None
+
+# The game names in the DAT files indexed by SHA-1 hash, and the hashes of each disc image file
+# read before (see "identifyDiscFiles").
+dat_index = {}
+hash_cache = None
+
+# The size and modified time (ns) of disc image files listed in a manifest, used instead of
+# checking them on the drive when they're hashed {absolute file path : (size, modified time)}
+manifest_file_stats = {}
 
+# Each phase currently being timed [phase, start time, time spent in phases within it], and the
+# profiles of each phase when "profile_phases" is in use (see "startPhase").
+phase_stack = []
+phase_profiles = {}
+phase_memory_snapshots = {}
 
-### Compile the Regular Expression patterns for the "Game Title", "Game Info", "Disc Info".
+# The log of this run, started when the first record is added (see "getRunLog").
+run_log = None
+
+# The disc image and playlist file names found in each directory searched this run, used to
+# check if those files exist without having to ask the drive (or network share) again.
+directory_listings = {}
+
+# The track files linked in each CUE sheet found this run, by directory (see "readCueSheet").
+cue_sheet_tracks = {}
+
+# The event loop all file I/O is scheduled through when "io_backend" is 'asyncio'.
+async_io_loop = None
+async_io_loop_lock = threading.Lock()
+
+# Show the progress of each search in the terminal (see "ProgressLine"). Turned off while a
+# "PlaylistGenerator" runs, so nothing is written to the console of the program using it.
+show_progress = True
+
+# Held for the length of every run: the command line run ("main"), each update of the watched
+# directories ("watchDirectories") and each "PlaylistGenerator.run". A PlaylistGenerator swaps its
+# settings into the settings of this script while it runs, so runs are never made at the same time.
+generator_lock = threading.RLock()
+
+
+### Compile the Regular Expression patterns for the "Game Title", "Game Info", "Disc Info",
+### and get the search enabled disc extensions ready for matching file names. Patterns already
+### compiled with the same settings are used again, along with the file names they've read.
 ###     --> Returns a [None]
 def compileRE():
     global re_game_title_compiled_pattern
     global re_game_info_compiled_pattern
     global re_disc_info_compiled_pattern
-    re_game_title_compiled_pattern = re.compile(re_game_title_pattern, re.IGNORECASE)
-    re_game_info_compiled_pattern = re.compile(re_game_info_pattern, re.IGNORECASE)
-    re_disc_info_compiled_pattern = re.compile(re_disc_info_pattern, re.IGNORECASE)
+    global searchable_disc_extensions
+    global searchable_disc_extension_lengths
+    global compiled_pattern_settings
+    global parseDiscFileStem
+    pattern_settings = getPatternSettings()
+    patterns = compiled_patterns.get(pattern_settings)
+    
+    if patterns is None:
+        searchable_exts = frozenset(pattern_settings[-1])
+        patterns = (re.compile(re_game_title_pattern, re.IGNORECASE),
+                    re.compile(re_game_info_pattern, re.IGNORECASE),
+                    re.compile(re_disc_info_pattern, re.IGNORECASE),
+                    searchable_exts,
+                    tuple(sorted(set(len(ext) for ext in searchable_exts))),
+                    functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(readDiscFileStem))
+        if len(compiled_patterns) >= COMPILED_PATTERNS_KEPT:
+            del compiled_patterns[next(iter(compiled_patterns))] # Oldest
+        compiled_patterns[pattern_settings] = patterns
+    
+    (re_game_title_compiled_pattern, re_game_info_compiled_pattern, re_disc_info_compiled_pattern,
+     searchable_disc_extensions, searchable_disc_extension_lengths, parseDiscFileStem) = patterns
+    compiled_pattern_settings = pattern_settings
     return None
 
 
-### Find multi disc games and get their file paths and create a file name for the playlist.
-###     (dir_path) Path to a directory.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     --> Returns a [Dictionary] and [Integer]
-def findMultiDiscGames(dir_path, multi_disc_games_found):
-    possible_compilation_disc_paths = []
-    playlist_count = 0
-    seperate_disc_formats = False
+### Get the settings the regular expression patterns and the disc file names parsed depend on.
+###     --> Returns a [Tuple]
+def getPatternSettings():
+    searchable_exts = tuple(sorted(ext.casefold() for ext, ext_info in disc_extensions.items() if ext_info[SEARCHABLE]))
+    return (re_game_title_pattern, re_game_info_pattern, re_disc_info_pattern, re_disc_number_group, searchable_exts)
+
+
+### Check if a file name ends with a search enabled disc extension, using only the end of the
+### file name string. This is checked for every file found, so nothing else is created here.
+###     (file_name) Name of a file.
+###     --> Returns a [Boolean]
+def isSearchableDiscFile(file_name):
+    for ext_length in searchable_disc_extension_lengths:
+        # The file name must be more than just the extension, same as "os.path.splitext".
+        if len(file_name) > ext_length and file_name[-ext_length:].casefold() in searchable_disc_extensions:
+            return True
+    return False
+
+
+### Read a disc image file name (without extension). Only called through "parseDiscFileStem",
+### which remembers the results, so no matter how many times the same name is checked the
+### patterns are only ever run once. The disc info is found and removed in the same pass and the
+### "Game Info" is taken from what's left, so a disc number is never mistaken for "Game Info".
+###     (file_stem) File name without the extension.
+###     --> Returns a [Tuple] of the "Game Title", a [Tuple] of "Game Info", the disc number
+###         (None if no disc number) and the file name without the disc info.
+def readDiscFileStem(file_stem):
+    game_title = re_game_title_compiled_pattern.match(file_stem).group().strip()
     
-    print('\n--------------------------------------------------------------------------')
-    print(f'Searching Directory For Multi-Disc Games: {dir_path}')
-    print('--------------------------------------------------------------------------\n')
+    disc_number = None
+    name_parts = []
+    name_position = 0
+    for disc_info in re_disc_info_compiled_pattern.finditer(file_stem):
+        if disc_number is None:
+            disc_number = int(disc_info.group(re_disc_number_group))
+        name_parts.append(file_stem[name_position:disc_info.start()])
+        name_position = disc_info.end()
+    if name_parts:
+        name_parts.append(file_stem[name_position:])
+        file_stem = ''.join(name_parts)
     
-    previous_game, possible_compilation_game, game = '','',''
-    previous_playlist_file_name, previous_file_ext = '',''
+    game_info_list = tuple(re_game_info_compiled_pattern.findall(file_stem))
     
-    for root, dirs, files in Search(dir_path):
-        
-        previous_disc_number = 0
-        
-        for file in files:
-            
-            file_path = Path(PurePath().joinpath(root, file))
-            file_ext = file_path.suffix.casefold()
-            #print(f'File: {file_path}')
-            
-            # Only discs images that are search enabled
-            if disc_extensions.get(file_ext, ['',False])[SEARCHABLE]:
-                
-                game_title = re_game_title_compiled_pattern.match(file_path.stem).group().strip()
-                # "Path" will be use to differentiate between games with the same name. Not an actual path.
-                game = Path(PurePath().joinpath(root, game_title))
-                is_multidisc_game = re_disc_info_compiled_pattern.search(file_path.stem)
-                
-                # Group disc paths with the same "Game Title" to later check if it could be a compilation game.
-                # This game could be: a compilation or collection of game discs (most likely),
-                #                     a multi-disc game with disc titles instead of numbers, or
-                #                     a different version of the same game (i.e. patched/hack/etc).
-                # Note: Multi-disc games with only disc titles or versions will be ordered alphabetically, which
-                #       may be the incorrect order. No way for code to detect correct order.
-                ## TODO: Detect patched or hacked games? Probably not, not enough universal standards here. However...
-                ## If one disc has an extra "Game Info" then it's likely a different version. What if there're multiple different versions?
-                if not ignore_compilation_discs:
-                    
-                    if game == possible_compilation_game and not is_multidisc_game:
-                        possible_compilation_disc_paths.append(file_path) # 2+
-                    elif not possible_compilation_disc_paths and not is_multidisc_game:
-                        possible_compilation_disc_paths.append(file_path) # 1
-                    else:
-                        multi_disc_games_found, playlist_count = checkForCompilationGame(
-                            multi_disc_games_found, possible_compilation_game, possible_compilation_disc_paths, playlist_count
-                        )
-                        possible_compilation_disc_paths.clear() # 0
-                    
-                    possible_compilation_game = game
-                
-                if is_multidisc_game: # (Disc #)
-                    
-                    if game != previous_game:
-                        seperate_disc_formats = False
-                        print('--------------------------------------------------------------------------')
-                        print(f'-Multi-Disc Game Found: {game.name}')
-                        print('--------------------------------------------------------------------------')
-                    print(f'--File Name: "{file_path.name}"')
-                    
-                    if game in multi_disc_games_found.keys(): # Existing Game
-                        
-                        current_disc_number = int(re_disc_info_compiled_pattern.search(file_path.stem).group(re_disc_number_group))
-                        print(f'--Disc Number: {current_disc_number}')
-                        #print(f'--Prev Disc Number: {previous_disc_number}')
-                        
-                        if game == previous_game and file_ext != previous_file_ext and not force_combine_disc_formats:
-                            seperate_disc_formats = True
-                        
-                        # Make sure to create playlist_file_name using only common matching "Game Info".
-                        playlist_file_name = re_disc_info_compiled_pattern.sub('', file_path.stem)
-                        if (previous_playlist_file_name.find(game.name) > -1
-                            and playlist_file_name != previous_playlist_file_name
-                            and current_disc_number > previous_disc_number):
-                                
-                                # A multi-disc game with "Disc Titles" in "Game Info" detected. So changing name of playlist.
-                                current_game_info_list = re_game_info_compiled_pattern.findall(playlist_file_name)
-                                previous_game_info_list = re_game_info_compiled_pattern.findall(previous_playlist_file_name)
-                                matching_game_info_list = compareTwoGameInfoLists(current_game_info_list, previous_game_info_list)
-                                matching_game_info = ''.join(str(game_info) for game_info in matching_game_info_list)
-                                
-                                playlist_file_name = f'{game.name}{matching_game_info}'
-                                if seperate_disc_formats:
-                                    playlist_file_name = f'{playlist_file_name} ({disc_extensions.get(file_ext, [file_ext])[FORMAT_NAME]})'
-                                
-                                playlist_file_path = Path(PurePath().joinpath(root, f'{playlist_file_name}.m3u'))
-                                
-                                previous_playlist_file_path = Path(PurePath().joinpath(root, f'{previous_playlist_file_name}.m3u'))
-                                if (playlist_file_path not in multi_disc_games_found[game].keys()
-                                    and previous_playlist_file_path in multi_disc_games_found[game].keys()):
-                                        value = multi_disc_games_found[game].pop(previous_playlist_file_path)
-                                        multi_disc_games_found[game][playlist_file_path] = value
-                                        print(f'---Changing Existing Playlist Name From: "{previous_playlist_file_name}"')
-                                        print(f'                                     To: "{playlist_file_name}"')
-                        
-                        else:
-                            if seperate_disc_formats:
-                                playlist_file_name = f'{playlist_file_name} ({disc_extensions.get(file_ext, [file_ext])[FORMAT_NAME]})'
-                            playlist_file_path = Path(PurePath().joinpath(root, f'{playlist_file_name}.m3u'))
-                        
-                        # Now that playlist are being seperated, rename previous playlist using previous file extension.
-                        if seperate_disc_formats:
-                            previous_playlist_file_name_rename = f'{previous_playlist_file_name} ({disc_extensions.get(previous_file_ext, [previous_file_ext])[FORMAT_NAME]})'
-                            previous_playlist_file_path_rename = Path(PurePath().joinpath(root, f'{previous_playlist_file_name_rename}.m3u'))
-                            previous_playlist_file_path = Path(PurePath().joinpath(root, f'{previous_playlist_file_name}.m3u'))
-                            if (playlist_file_path not in multi_disc_games_found[game].keys()
-                                and previous_playlist_file_path in multi_disc_games_found[game].keys()):
-                                    value = multi_disc_games_found[game].pop(previous_playlist_file_path)
-                                    multi_disc_games_found[game][previous_playlist_file_path_rename] = value
-                                    print(f'---Changing Existing Playlist Name From: "{previous_playlist_file_name}"')
-                                    print(f'                                     To: "{previous_playlist_file_name_rename}"')
-                        
-                        # Check if playlist name has already been added and make sure it uses the same playlist path.
-                        playlist_file_path_exists = False
-                        for existing_playlist_file_path in multi_disc_games_found[game].keys():
-                            if (existing_playlist_file_path != LOG_DATA
-                                and playlist_file_path.name == existing_playlist_file_path.name):
-                                    playlist_file_path = existing_playlist_file_path
-                                    playlist_file_path_exists = True
-                                    break
-                        
-                        if playlist_file_path_exists:
-                            if file_path not in multi_disc_games_found[game][playlist_file_path]:
-                                multi_disc_games_found[game][playlist_file_path].append(file_path)
-                                print(f'---Adding File Path To Existing Playlist Named: "{playlist_file_name}"')
-                            else:
-                                print(f'---File Path Already In Existing Playlist Named: "{playlist_file_name}"')
-                                
-                                # Now check to see if a playlist had a name change (a Disc Title removed) and was re-added.
-                                # If so now remove that playlist... again.
-                                if previous_game == game and previous_playlist_file_name != playlist_file_name:
-                                    previous_playlist_file_path = Path(PurePath().joinpath(
-                                        root, f'{previous_playlist_file_name}.m3u'
-                                    ))
-                                    if (previous_playlist_file_path in multi_disc_games_found[game].keys()
-                                        and current_disc_number > previous_disc_number
-                                        and file_ext == previous_file_ext): # not seperate_disc_formats?
-                                            print(f'---Deleting Playlist: "{previous_playlist_file_path}"')
-                                            multi_disc_games_found[game].pop(previous_playlist_file_path)
-                                            playlist_count -= 1
-                        
-                        else:
-                            multi_disc_games_found[game][playlist_file_path] = [file_path]
-                            print(f'---Adding File Path To New Playlist Named: "{playlist_file_name}"')
-                            playlist_count += 1
-                    
-                    else: # New Game Found
-                        current_disc_number = int(re_disc_info_compiled_pattern.search(file_path.stem).group(re_disc_number_group))
-                        print(f'--Disc Number: {current_disc_number}')
-                        
-                        playlist_file_name = re_disc_info_compiled_pattern.sub('', file_path.stem)
-                        previous_playlist_file_name = playlist_file_name
-                        print(f'---Adding File Path To New Playlist Named: "{playlist_file_name}"')
-                        playlist_file_path = Path(PurePath().joinpath(root, f'{playlist_file_name}.m3u'))
-                        
-                        multi_disc_games_found[game] = { playlist_file_path : [file_path] }
-                        playlist_count += 1
-                        
-                        multi_disc_games_found = setMultDiscGameType(multi_disc_games_found, game, MULTI_DISC)
-                    
-                    previous_game = game
-                    previous_disc_number = current_disc_number
-                    previous_playlist_file_name = playlist_file_name
-                    previous_file_ext = file_ext
+    return game_title, game_info_list, disc_number, file_stem
+
+
+### Get all the details needed to group a disc image file from its file name.
+###     (file_name) Name of a disc image file.
+###     --> Returns a [List] of the file name, "Game Title", a [List] of "Game Info", disc number
+###         (None if no disc number), file name without the disc info and file extension.
+def parseDiscFileName(file_name):
+    file_stem, file_ext = os.path.splitext(file_name)
+    game_title, game_info_list, disc_number, file_stem = parseDiscFileStem(file_stem)
+    return [file_name, game_title, list(game_info_list), disc_number, file_stem, file_ext.casefold()]
+
+
+### Get the version of the scan cache. Any setting that changes what is found or how file
+### names are read will create a new version and the old cache will not be used.
+###     --> Returns a [String]
+def getScanCacheVersion():
+    searchable_exts = sorted(ext for ext, ext_info in disc_extensions.items() if ext_info[SEARCHABLE])
+    settings = [SCAN_CACHE_VERSION, re_game_title_pattern, re_game_info_pattern,
+                re_disc_info_pattern, re_disc_number_group, searchable_exts, check_cue_sheets != CUE_SHEET_OFF]
+    return hashlib.sha1(json.dumps(settings).encode('utf-8')).hexdigest()
+
+
+### Get the path of the scan cache file, saved in the same directory as the log file.
+###     --> Returns a [Path]
+def getScanCacheFilePath():
+    return Path(PurePath().joinpath(Path(__file__).parent, f'{Path(__file__).stem}__scan_cache.json'))
+
+
+### Load the scan cache file. If it doesn't exist, can't be read or is an older version an
+### empty cache will be used instead.
+###     (cache_file_path) Path of a scan cache file.
+###     --> Returns a [Dictionary]
+def loadScanCache(cache_file_path = None):
+    global scan_cache
+    cache_file_path = cache_file_path or getScanCacheFilePath()
+    version = getScanCacheVersion()
     
-    # Final multi-disc game checks and fixes.
-    multi_disc_games_found, playlist_count = checkForCompilationGame(
-        multi_disc_games_found, possible_compilation_game, possible_compilation_disc_paths, playlist_count
-    )
-    multi_disc_games_found, playlist_count = checkForDupeGames(multi_disc_games_found, playlist_count)
-    multi_disc_games_found, playlist_count = checkForSingleDiscPlaylists(multi_disc_games_found, playlist_count)
+    try:
+        scan_cache = json.loads(Path(cache_file_path).read_text(encoding='utf-8'))
+        if scan_cache.get('version') != version:
+            scan_cache = None
+    except (OSError, ValueError):
+        scan_cache = None
     
-    #print(f'\nmulti_disc_games_found: {multi_disc_games_found}')
+    if type(scan_cache) != dict or type(scan_cache.get('directories')) != dict:
+        scan_cache = { 'version' : version, 'directories' : {} }
     
-    return multi_disc_games_found, playlist_count
+    return scan_cache
 
 
-### Check for compilation games with disc titles instead of disk numbers.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     (possible_compilation_game) The game that was last detected as a possible compilation.
-###     (possible_compilation_disc_paths) A list of compilation disc paths.
-###     (playlist_count) Amount of new playlists to be created.
-###     --> Returns a [Dictionary] and [Integer]
-def checkForCompilationGame(multi_disc_games_found, possible_compilation_game, possible_compilation_disc_paths, playlist_count):
+### Save the scan cache file. The file is replaced in one step so a run that is stopped early
+### can't leave a half written cache behind.
+###     (cache_file_path) Path of a scan cache file.
+###     --> Returns a [Boolean]
+def saveScanCache(cache_file_path = None):
+    if scan_cache is None or not use_scan_cache:
+        return False
     
-    if len(possible_compilation_disc_paths) > 1:
-        all_game_info_list = []
-        matching_game_info_list = []
-        disc_count = len(possible_compilation_disc_paths)
-        disc_paths = []
-        disc_exts = []
-        seperate_disc_formats = False
-        
-        for disc_path in possible_compilation_disc_paths:
-            all_game_info_list.extend(re_game_info_compiled_pattern.findall(disc_path.stem))
-            disc_paths.append(disc_path) # copy
-            if disc_path.suffix not in disc_exts:
-                disc_exts.append(disc_path.suffix)
-        
-        if force_combine_disc_formats:
-            format_count = 1
-        else:
-            format_count = len(disc_exts)
-            if format_count > 1:
-                seperate_disc_formats = True
-                #disc_count /= len(disc_exts)
-        
-        # Get only matching Game Info
-        for gi in all_game_info_list:
-            if all_game_info_list.count(gi) >= disc_count / format_count:
-                if gi not in matching_game_info_list:
-                    matching_game_info_list.append(gi)
-        game_info = ''.join(matching_game_info_list)
-        
-        # If there's no matching Game Info then it's very likely this is the same game from different regions.
-        ## TODO: Games with a mixture of different regions, disc titles, and/or different versions will be cought in this.
-        ## TODO: Should there be an option to add all regions to a sigle compilation playlist?
-        if not game_info:
-            return multi_disc_games_found, playlist_count
-        
-        print('--------------------------------------------------------------------------')
-        print(f'-Compilation Game Found: {possible_compilation_game.name}')
-        print('--------------------------------------------------------------------------')
-        
-        # Create New Playlist (split if different disc formats)
-        playlists = {}
-        playlist_file_name = f'{possible_compilation_game.name}{game_info}'
-        for path in disc_paths:
-            if seperate_disc_formats:
-                playlist_file_name = f'{possible_compilation_game.name}{game_info} ({disc_extensions.get(path.suffix, [path.suffix])[FORMAT_NAME]})'
-            
-            playlist_file_path = Path(PurePath().joinpath(possible_compilation_game.parent, f'{playlist_file_name}.m3u'))
-            if playlist_file_path in playlists.keys():
-                playlists[playlist_file_path].append(path)
-            else:
-                playlists[playlist_file_path] = [path]
-        
-        file_names = '"\n              "'.join(disc.name for disc in disc_paths)
-        print(f'--File Names: "{file_names}"')
-        if seperate_disc_formats:
-            print(f'--Disc Count: {int(disc_count/format_count)} Discs Per Format')
-        else:
-            print(f'--Disc Count: {disc_count} Discs')
-        
-        # Add New Game
-        if possible_compilation_game not in multi_disc_games_found.keys():
-            multi_disc_games_found[possible_compilation_game] = {}
-        
-        for playlist, disc_paths in playlists.items():
-            
-            # Add New Playlist
-            if playlist not in multi_disc_games_found[possible_compilation_game].keys():
-                multi_disc_games_found[possible_compilation_game][playlist] = []
-                playlist_count += 1
-            
-            # Add New Disc Paths To Playlist
-            new_disc_paths_added = False
-            for path in disc_paths:
-                if path not in multi_disc_games_found[possible_compilation_game][playlist]:
-                    multi_disc_games_found[possible_compilation_game][playlist].append(path)
-                    new_disc_paths_added = True
-            
-            if new_disc_paths_added:
-                print(f'---Adding File Paths To New Playlist Named: "{playlist.name}"')
-            else:
-                print(f'---File Paths Already In Existing Playlist Named: "{playlist.name}"')
-                
-        multi_disc_games_found = setMultDiscGameType(multi_disc_games_found, possible_compilation_game, COMPILATION)
+    cache_file_path = Path(cache_file_path or getScanCacheFilePath())
+    temp_file_path = cache_file_path.with_name(f'{cache_file_path.name}.tmp')
+    try:
+        temp_file_path.write_text(json.dumps(scan_cache, separators=(',',':')), encoding='utf-8')
+        os.replace(temp_file_path, cache_file_path)
+    except Exception as error:
+        logger.error('\nCouldn\'t save scan cache file due to %s: %s', type(error).__name__, type(error).__doc__)
+        logger.error('%s\n', error)
+        return False
     
-    return multi_disc_games_found, playlist_count
+    return True
 
 
-### Check for duplicate games found in different directories that should be placed in one
-### compilation playlist.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     (playlist_count) Amount of new playlists to be created.
-###     --> Returns a [Dictionary] and [Integer]
-def checkForDupeGames(multi_disc_games_found, playlist_count):
-    
-    if ignore_compilation_discs:
-        return multi_disc_games_found, playlist_count
+### Check if a file name is a playlist.
+###     (file_name) Name of a file.
+###     --> Returns a [Boolean]
+def isPlaylistFile(file_name):
+    return len(file_name) > 4 and file_name[-4:].casefold() == '.m3u'
+
+
+### Record the disc images and playlists found in a directory so "pathExists" can answer
+### whether they exist without checking the drive again.
+###     (dir_path) Absolute path string to a directory.
+###     (disc_files) A List of parsed disc image files (see "parseDiscFileName").
+###     (playlist_names) A List of playlist file names.
+###     (track_names) A List of all other file names, only if the directory has CUE sheets.
+###     (cue_sheets) A Dictionary of CUE sheet file names and the track files linked in them.
+###     --> Returns a [None]
+def addDirectoryListing(dir_path, disc_files, playlist_names, track_names = (), cue_sheets = None):
+    file_names = set(disc_file[0] for disc_file in disc_files)
+    file_names.update(playlist_names)
+    file_names.update(track_names)
+    directory_listings[dir_path] = file_names
+    if cue_sheets:
+        cue_sheet_tracks[dir_path] = cue_sheets
+    else:
+        cue_sheet_tracks.pop(dir_path, None)
+    return None
+
+
+### Get the track file names linked in a CUE sheet ("FILE" lines).
+###     (file_path) Path to a CUE sheet file.
+###     --> Returns a [Tuple] of a [List] of track file names (as written) and a [List] of the size
+###         and modified time of the CUE sheet, or None and None if it couldn't be read.
+def readCueSheet(file_path):
+    try:
+        with open(file_path, 'rb') as file:
+            file_stat = os.fstat(file.fileno())
+            cue_sheet = file.read(CUE_SHEET_MAX_SIZE)
+    except OSError:
+        return None, None
     
-    multi_disc_games_found_copy = multi_disc_games_found.copy()
-    dupe_games_to_remove = []
+    try:
+        cue_sheet = cue_sheet.decode('utf-8-sig')
+    except UnicodeDecodeError: # Older CUE sheets are saved in the system's code page
+        cue_sheet = cue_sheet.decode('latin-1')
     
-    for game_one, all_playlist_one in multi_disc_games_found_copy.items():
-        if game_one == LOG_DATA: continue
-        for game_two, all_playlist_two in multi_disc_games_found_copy.items():
-            if game_two == LOG_DATA: continue
-            
-            if game_one != game_two and game_one.name == game_two.name: # Diff path, same name
-                
-                for playlist_path_one, game_disc_paths_one in all_playlist_one.copy().items():
-                    if playlist_path_one == LOG_DATA: continue
-                    for playlist_path_two, game_disc_paths_two in all_playlist_two.copy().items():
-                        if playlist_path_two == LOG_DATA: continue
-                        
-                        # If playlist names are the same then this is very likely a compilation game
-                        if playlist_path_one.name == playlist_path_two.name:
-                            
-                            # Combine playlists, but only paths that are new/different.
-                            disc_paths_combined = False
-                            for disc_path in game_disc_paths_two:
-                                if disc_path not in game_disc_paths_one:
-                                    multi_disc_games_found[game_one][playlist_path_one].append(disc_path)
-                                    disc_paths_combined = True
-                            
-                            # And since two playlist merged into one...
-                            multi_disc_games_found[game_two].pop(playlist_path_two)
-                            dupe_games_to_remove.append(game_two)
-                            playlist_count -= 1
-                            
-                            game_file_paths = '\n              '.join(
-                                [f'"{str(path)}"' for path in multi_disc_games_found[game_one][playlist_path_one]]
-                            )
-                            
-                            if save_playlists_in_common_directory:
-                                common_root_path = findCommonDirectoryPath(playlist_path_one, playlist_path_two)
-                                
-                                disc_list = multi_disc_games_found[game_one].pop(playlist_path_one)
-                                compilation_playlist_file_path = Path(PurePath().joinpath(
-                                    common_root_path, playlist_path_one.name
-                                ))
-                                multi_disc_games_found[game_one][compilation_playlist_file_path] = disc_list
-                                multi_disc_games_found = setMultDiscGameType(multi_disc_games_found, game_one, COMPILATION_UP_ONE)
-                            
-                            else:
-                                multi_disc_games_found = setMultDiscGameType(multi_disc_games_found, game_one, COMPILATION)
-                            
-                            print('--------------------------------------------------------------------------')
-                            print(f'-Multi-Disc Game Found To Be Compilation Game: {game_one.name}')
-                            print('--------------------------------------------------------------------------')
-                            #print(f'--File Names: "{game_file_names}"')
-                            print(f'--File Paths: {game_file_paths}')
-                            if disc_paths_combined:
-                                print(f'---Combining Playlists Into One Named: "{playlist_path_one.name}"')
-                            else:
-                                print(f'---File Paths Already In Existing Playlist Named: "{playlist_path_one.name}"')
+    track_names = []
+    for quoted_track_name, track_name in CUE_FILE_PATTERN.findall(cue_sheet):
+        track_name = quoted_track_name or track_name
+        if track_name not in track_names:
+            track_names.append(track_name)
+    return track_names, [file_stat.st_size, file_stat.st_mtime_ns]
+
+
+### Read the CUE sheets found in a directory.
+###     (dir_path) Path string to the directory.
+###     (disc_files) A List of parsed disc image files found in the directory.
+###     (cue_sheet_stats) A Dictionary to add the size and modified time of each CUE sheet read to.
+###     --> Returns a [Dictionary] of CUE sheet file names and a [List] of track file names.
+def readCueSheets(dir_path, disc_files, cue_sheet_stats = None):
+    cue_sheets = {}
+    for disc_file in disc_files:
+        if disc_file[-1] == '.cue':
+            track_names, file_stat = readCueSheet(os.path.join(dir_path, disc_file[0]))
+            if track_names is not None:
+                cue_sheets[disc_file[0]] = track_names
+                if cue_sheet_stats is not None:
+                    cue_sheet_stats[disc_file[0]] = file_stat
+    return cue_sheets
+
+
+### Read the CUE sheets of a cached directory again if they were edited since they were cached.
+### Editing a file doesn't change the modified time of its directory, so each CUE sheet is checked.
+###     (dir_path) Path string to the directory.
+###     (cached_dir) The scan cache entry of the directory, updated in place.
+###     --> Returns a [None]
+def refreshCachedCueSheets(dir_path, cached_dir):
+    cue_sheets = cached_dir[DIR_CUE_SHEETS]
+    cue_sheet_stats = cached_dir[DIR_CUE_SHEET_STATS]
+    for cue_sheet_name, cached_stat in list(cue_sheet_stats.items()):
+        cue_sheet_path = os.path.join(dir_path, cue_sheet_name)
+        try:
+            file_stat = os.stat(cue_sheet_path)
+            if [file_stat.st_size, file_stat.st_mtime_ns] == cached_stat:
+                continue
+        except OSError:
+            pass
+        
+        track_names, file_stat = readCueSheet(cue_sheet_path)
+        if track_names is None:
+            cue_sheets.pop(cue_sheet_name, None)
+            cue_sheet_stats.pop(cue_sheet_name)
+        else:
+            cue_sheets[cue_sheet_name] = track_names
+            cue_sheet_stats[cue_sheet_name] = file_stat
+    return None
+
+
+### Check if a track file linked in a CUE sheet exists. Directories with CUE sheets have all
+### their file names listed, so only tracks linked from other directories are checked on the drive.
+###     (dir_path) Absolute path string to the directory of the CUE sheet.
+###     (track_name) Track file name as written in the CUE sheet.
+###     (run_stats) RunStats to count the checks made on the drive.
+###     --> Returns a [Boolean]
+def trackFileExists(dir_path, track_name, run_stats = None):
+    if os.sep != '\\':
+        track_name = track_name.replace('\\', os.sep) # Saved on Windows
+    track_path = os.path.abspath(os.path.join(dir_path, track_name))
+    track_dir_path, track_file_name = os.path.split(track_path)
+    file_names = directory_listings.get(track_dir_path)
     
-    for game in dupe_games_to_remove:
-        multi_disc_games_found.pop(game)
+    if file_names is not None and track_dir_path in cue_sheet_tracks:
+        listed = isListedName(track_file_name, file_names)
+        if listed is not None:
+            return listed
+    elif file_names is not None and track_file_name in file_names:
+        return True
     
-    return multi_disc_games_found, playlist_count
+    if run_stats: run_stats.files_checked += 1
+    return os.path.exists(track_path)
 
 
-### Delete single game playlists that only have one disc. In some cases when searching
-### multiple times and formats are being separated there may be playlists that are re-added
-### with only one disc. So delete them now as they may cause issues later.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     (playlist_count) Amount of new playlists to be created.
-###     --> Returns a [Dictionary] and [Integer]
-def checkForSingleDiscPlaylists(multi_disc_games_found, playlist_count):
-    start_count = playlist_count
-    for game, all_playlists in multi_disc_games_found.copy().items():
-        if game == LOG_DATA: continue
-        for playlist_path, game_disc_paths in all_playlists.copy().items():
-            if playlist_path == LOG_DATA: continue
+### Check the CUE sheets found in each directory for missing track files and flag them in the
+### log, or leave them out if "check_cue_sheets" is set to 'exclude'.
+###     (disc_file_batches) The disc image files found in each directory (see "scanDirectoryTree").
+###     (run_stats) RunStats to count the CUE sheets checked.
+###     --> Yields a [Tuple] of a directory path and a [List] of parsed disc image files.
+def checkCueSheets(disc_file_batches, run_stats):
+    for root, disc_files in disc_file_batches:
+        with timePhase(run_stats, 'cue_check'):
+            dir_path = os.path.abspath(root)
+            cue_sheets = cue_sheet_tracks.get(dir_path)
+            broken_cue_sheets = set()
             
-            if len(game_disc_paths) <= 1:
-                if start_count == playlist_count:
-                    print('--------------------------------------------------------------------------')
-                    print('-Cleaning Up Single Disc Playlists:')
-                    print('--------------------------------------------------------------------------')
-                print(f'--Game Title: "{game.name}"')
-                print(f'---Deleting Playlist: "{playlist_path}"')
-                multi_disc_games_found[game].pop(playlist_path)
-                playlist_count -= 1
+            for cue_sheet_name, track_names in (cue_sheets.items() if cue_sheets else ()):
+                run_stats.cue_sheets_checked += 1
+                missing_track_names = [track_name for track_name in track_names
+                                       if not trackFileExists(dir_path, track_name, run_stats)]
+                if missing_track_names:
+                    broken_cue_sheets.add(cue_sheet_name)
+                    run_stats.cue_sheets_broken += 1
+                    cue_sheet_path = os.path.join(dir_path, cue_sheet_name)
+                    logger.info('\nCUE Sheet Missing Track Files: %s', cue_sheet_path)
+                    for track_name in missing_track_names:
+                        logger.info('--Missing: %s', track_name)
+                    if create_log_file:
+                        getRunLog().addCueSheet(cue_sheet_path, missing_track_names,
+                                                check_cue_sheets == CUE_SHEET_EXCLUDE)
+            
+            if broken_cue_sheets and check_cue_sheets == CUE_SHEET_EXCLUDE:
+                disc_files = [disc_file for disc_file in disc_files if disc_file[0] not in broken_cue_sheets]
+        yield root, disc_files
+
+
+### Check if a file exists. Disc images and playlists in directories already searched this run
+### are checked against what was found then, anything else is checked on the drive.
+###     (file_path) Path to a file.
+###     (run_stats) RunStats to count the checks made on the drive.
+###     --> Returns a [Boolean]
+def pathExists(file_path, run_stats = None):
+    file_path = os.path.abspath(file_path)
+    exists = isListedPath(file_path)
+    if exists is not None:
+        return exists
     
-    return multi_disc_games_found, playlist_count
+    if run_stats: run_stats.files_checked += 1
+    return os.path.exists(file_path)
 
 
-### Compare two list and return the common items in a new list.
-###     (game_info_list_one) Fist "Game Info" list.
-###     (game_info_list_two) Second "Game Info" list.
-###     --> Returns a [List]
-def compareTwoGameInfoLists(game_info_list_one, game_info_list_two):
-    all_game_info_list = []
-    matching_game_info_list = []
+### Check if a disc image or playlist exists using only the directories already searched this run.
+###     (file_path) Absolute path string to a file.
+###     --> Returns a [Boolean] or None if it's unknown and has to be checked on the drive.
+def isListedPath(file_path):
+    dir_path, file_name = os.path.split(file_path)
+    file_names = directory_listings.get(dir_path)
     
-    for game_info_list in [game_info_list_one,game_info_list_two]:
-        for game_info in game_info_list:
-            # To prevent dupe (extension) in game info when separating playlist when ran 2+ times.
-            ext_in_game_info = game_info.replace('(','').replace(')','').strip()
-            if game_info not in all_game_info_list or ext_in_game_info in disc_extensions.keys():
-                all_game_info_list.append(game_info)
-            else:
-                if game_info not in matching_game_info_list:
-                    matching_game_info_list.append(game_info)
+    if file_names is not None and (isSearchableDiscFile(file_name) or isPlaylistFile(file_name)):
+        return isListedName(file_name, file_names)
     
-    return matching_game_info_list
+    return None
 
 
-### Compare two file paths and return the common directory path between them.
-###     (path_one) First Path
-###     (path_two) Second Path
-###     --> Returns a [Path]
-def findCommonDirectoryPath(path_one, path_two):
-    common_path_found = None
-    for root_path_one in path_one.parents:
-        for root_path_two in path_two.parents:
-            if str(root_path_one) == str(root_path_two):
-                common_path_found = root_path_one
-                break
-        if common_path_found: break
-    
-    return common_path_found
-
-
-### Set a multi-disc game's disc type.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     (game) The game to update.
-###     (game_type) The type to update: MULTI_DISC, COMPILATION, DIFF_VERSION, UNKNOWN
+### Check if a file name is in a directory listing. A name that only matches a listed name with
+### different upper/lower case may still exist on drives that ignore case (vfat, SMB/CIFS shares
+### mounted on Linux), so it's left to be checked on the drive rather than reported missing.
+###     (file_name) File name string.
+###     (file_names) Set of the file names found in the directory.
+###     --> Returns a [Boolean] or None if it's unknown and has to be checked on the drive.
+def isListedName(file_name, file_names):
+    if file_name in file_names:
+        return True
+    if not sys.platform.startswith('linux'):
+        return None # Drives on Windows and macOS usually ignore case
+    
+    folded_name = file_name.casefold()
+    for listed_name in file_names:
+        if listed_name.casefold() == folded_name:
+            return None
+    
+    return False
+
+
+### Record that a file was just created or deleted, if its directory was searched this run.
+###     (file_path) Path to a file.
+###     (exists) If the file now exists.
+###     --> Returns a [None]
+def updateDirectoryListing(file_path, exists = True):
+    dir_path, file_name = os.path.split(os.path.abspath(file_path))
+    file_names = directory_listings.get(dir_path)
+    if file_names is not None:
+        if exists:
+            file_names.add(file_name)
+        else:
+            file_names.discard(file_name)
+    return None
+
+
+### An event loop running in its own thread that file I/O calls from any thread are scheduled
+### through, with at most "concurrency" calls waiting on the drive at the same time. Python has
+### no asynchronous file I/O, so each call is still made in a thread.
+###     (concurrency) Most calls made at the same time.
+class AsyncIOLoop:
+    __slots__ = ('concurrency', 'loop', 'semaphore', 'thread')
+    
+    def __init__(self, concurrency):
+        self.concurrency = max(1, concurrency)
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(ThreadPoolExecutor(max_workers=self.concurrency))
+        self.semaphore = None # Created in the event loop's thread, the first time it's needed
+        self.thread = threading.Thread(target=self.loop.run_forever, name='AsyncIOLoop', daemon=True)
+        self.thread.start()
+    
+    ### Make a file I/O call once there's room for it.
+    ###     (function) The Function to call.
+    ###     (args) A Tuple of arguments.
+    ###     --> Returns what the function returns
+    async def call(self, function, args):
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        async with self.semaphore:
+            return await self.loop.run_in_executor(None, function, *args)
+    
+    ### Schedule a file I/O call from any thread.
+    ###     (function) The Function to call.
+    ###     (args) Arguments.
+    ###     --> Returns a [Future]
+    def submit(self, function, *args):
+        return asyncio.run_coroutine_threadsafe(self.call(function, args), self.loop)
+
+
+### Get the event loop file I/O is scheduled through, starting it if needed.
+###     --> Returns an [AsyncIOLoop]
+def getAsyncIOLoop():
+    global async_io_loop
+    with async_io_loop_lock:
+        if async_io_loop is None:
+            async_io_loop = AsyncIOLoop(io_concurrency)
+    return async_io_loop
+
+
+### A pool of file I/O calls made through the event loop, used the same as a ThreadPoolExecutor.
+### All pools share the "io_concurrency" limit.
+class AsyncIOPool:
+    __slots__ = ('futures',)
+    
+    def __init__(self):
+        self.futures = set() # Calls not yet done
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
+        return False
+    
+    ### Schedule a file I/O call.
+    ###     (function) The Function to call.
+    ###     (args) Arguments.
+    ###     --> Returns a [Future]
+    def submit(self, function, *args):
+        future = getAsyncIOLoop().submit(function, *args)
+        self.futures.add(future)
+        future.add_done_callback(self.futures.discard)
+        return future
+    
+    ### Make a file I/O call for each item, all scheduled at once.
+    ###     (function) The Function to call.
+    ###     (iterables) Iterables of arguments.
+    ###     --> Returns an [Iterator] of the results, in order.
+    def map(self, function, *iterables):
+        futures = [self.submit(function, *args) for args in zip(*iterables)]
+        return (future.result() for future in futures)
+    
+    ### Wait for all calls scheduled to finish. The event loop keeps running for other pools.
+    ###     (wait) If False don't wait.
+    ###     --> Returns a [None]
+    def shutdown(self, wait = True):
+        if wait:
+            waitForFutures(list(self.futures))
+        return None
+
+
+### Get a pool to make file I/O calls with, depending on the "io_backend" in use.
+###     (worker_count) Number of threads when using 'threads'.
+###     --> Returns a [ThreadPoolExecutor] or [AsyncIOPool]
+def getIOPool(worker_count):
+    if io_backend == IO_ASYNCIO:
+        return AsyncIOPool()
+    return ThreadPoolExecutor(max_workers=max(1, worker_count))
+
+
+### Forget the file names found in a directory tree, once they're no longer needed.
+###     (root_path) Path to a root directory.
+###     --> Returns a [None]
+def removeDirectoryListings(root_path):
+    root_path = os.path.abspath(root_path)
+    for dir_path in [dir_path for dir_path in directory_listings if isInRootDirectory(dir_path, root_path)]:
+        directory_listings.pop(dir_path)
+        cue_sheet_tracks.pop(dir_path, None)
+    return None
+
+
+### Search a single directory and sort its entries into sub-directories and disc image files.
+### Only the search enabled disc images are kept and their file names read. If the directory
+### hasn't been modified since it was last cached, the cached results are used instead.
+###     (dir_path) Path string to a directory.
+###     --> Returns a [Tuple] of the directory path, a [List] of sub-directory paths, a [List]
+###         of parsed disc image files (see "parseDiscFileName") and the [Integer] amount of
+###         other files skipped.
+def scanDirectory(dir_path):
+    sub_dir_names = []
+    disc_files = []
+    playlist_names = []
+    track_names = []
+    files_skipped = 0
+    
+    cache_key = None
+    if scan_cache is not None:
+        try:
+            dir_stat = os.stat(dir_path)
+        except OSError:
+            return dir_path, [], [], 0
+        cache_key = os.path.abspath(dir_path)
+        cached_dir = scan_cache['directories'].get(cache_key)
+        if (cached_dir and cached_dir[DIR_MTIME] == dir_stat.st_mtime_ns
+            and cached_dir[DIR_INODE] == dir_stat.st_ino):
+                sub_dir_paths = [os.path.join(dir_path, name) for name in cached_dir[DIR_SUB_DIRS]]
+                if cached_dir[DIR_CUE_SHEET_STATS]:
+                    refreshCachedCueSheets(dir_path, cached_dir)
+                addDirectoryListing(cache_key, cached_dir[DIR_DISC_FILES], cached_dir[DIR_PLAYLISTS],
+                                    cached_dir[DIR_TRACK_FILES], cached_dir[DIR_CUE_SHEETS])
+                return dir_path, sub_dir_paths, cached_dir[DIR_DISC_FILES], 0
+    
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Same as "os.walk", linked directories are not followed.
+                    if not entry.is_symlink():
+                        sub_dir_names.append(entry.name)
+                elif isSearchableDiscFile(entry.name):
+                    disc_files.append(parseDiscFileName(entry.name))
+                else:
+                    if isPlaylistFile(entry.name):
+                        playlist_names.append(entry.name)
+                    else:
+                        track_names.append(entry.name)
+                    files_skipped += 1
+    except OSError:
+        return dir_path, [], [], 0 # Unreadable directories are skipped, same as "os.walk".
+    
+    cue_sheet_stats = {}
+    cue_sheets = readCueSheets(dir_path, disc_files, cue_sheet_stats) if check_cue_sheets != CUE_SHEET_OFF else {}
+    if not cue_sheets:
+        track_names = []
+    addDirectoryListing(cache_key or os.path.abspath(dir_path), disc_files, playlist_names, track_names, cue_sheets)
+    
+    # A directory modified within the last few seconds may still be changing, and some file
+    # systems only record modified times to the nearest 2 seconds, so don't cache it just yet.
+    if cache_key and time.time() - dir_stat.st_mtime > 2:
+        scan_cache['directories'][cache_key] = [
+            dir_stat.st_mtime_ns, dir_stat.st_ino, sub_dir_names, disc_files, playlist_names, track_names, cue_sheets,
+            cue_sheet_stats
+        ]
+    
+    return dir_path, [os.path.join(dir_path, name) for name in sub_dir_names], disc_files, files_skipped
+
+
+### Search a directory tree using multiple threads and get the disc image files found in each
+### directory. Directories are searched in parallel, but the results are returned top-down in
+### the same order "os.walk" would return them.
+###     (dir_path) Path to a root directory.
+###     (worker_count) Number of directories to search at the same time.
+###     (run_stats) RunStats to add the amount of files skipped to.
+###     --> Yields a [Tuple] of a directory path and a [List] of parsed disc image files.
+def scanDirectoryTree(dir_path, worker_count = None, run_stats = None):
+    root_path = os.fspath(dir_path)
+    worker_count = max(1, worker_count or scan_worker_count)
+    dirs_searched = []
+    
+    if worker_count == 1:
+        dir_paths = [root_path]
+        while dir_paths:
+            root, sub_dir_paths, disc_files, files_skipped = scanDirectory(dir_paths.pop())
+            dir_paths.extend(reversed(sub_dir_paths))
+            dirs_searched.append(root)
+            if run_stats: countDirectorySearched(run_stats, disc_files, files_skipped)
+            yield root, disc_files
+        removeDeletedDirectoriesFromScanCache(root_path, dirs_searched)
+        return
+    
+    pending_scans = {}
+    search_stopped = []
+    pool = getIOPool(worker_count)
+    
+    # Sub-directories are queued up as soon as their parent is searched, so the workers never
+    # have to wait on the order the results are being handed out in.
+    def scanAndQueue(path):
+        result = scanDirectory(path)
+        if not search_stopped:
+            for sub_dir_path in result[1]:
+                pending_scans[sub_dir_path] = pool.submit(scanAndQueue, sub_dir_path)
+        return result
+    
+    try:
+        pending_scans[root_path] = pool.submit(scanAndQueue, root_path)
+        dir_paths = [root_path]
+        while dir_paths:
+            root, sub_dir_paths, disc_files, files_skipped = pending_scans.pop(dir_paths.pop()).result()
+            dir_paths.extend(reversed(sub_dir_paths))
+            dirs_searched.append(root)
+            if run_stats: countDirectorySearched(run_stats, disc_files, files_skipped)
+            yield root, disc_files
+        removeDeletedDirectoriesFromScanCache(root_path, dirs_searched)
+    finally:
+        # Search ended early (or failed), don't bother finishing the rest of the tree.
+        search_stopped.append(True)
+        for pending_scan in list(pending_scans.values()):
+            pending_scan.cancel()
+        pool.shutdown(wait=True)
+
+
+### Count a directory searched and the files found in it.
+###     (run_stats) RunStats to add to.
+###     (disc_files) A List of parsed disc image files found.
+###     (files_skipped) Amount of other files skipped.
+###     --> Returns a [None]
+def countDirectorySearched(run_stats, disc_files, files_skipped):
+    run_stats.dirs_searched += 1
+    run_stats.disc_files_found += len(disc_files)
+    run_stats.files_found += len(disc_files) + files_skipped
+    run_stats.files_skipped += files_skipped
+    return None
+
+
+### Remove directories from the scan cache that were not found during a full search of a
+### directory tree, as they have been deleted or moved.
+###     (root_path) Path string to the root directory searched.
+###     (dirs_searched) A List of all directory path strings found under the root directory.
+###     --> Returns a [None]
+def removeDeletedDirectoriesFromScanCache(root_path, dirs_searched):
+    if scan_cache is None:
+        return None
+    
+    root_path = os.path.join(os.path.abspath(root_path), '')
+    dirs_searched = set(os.path.abspath(path) for path in dirs_searched)
+    cached_dirs = scan_cache['directories']
+    for cache_key in list(cached_dirs.keys()):
+        if cache_key.startswith(root_path) and cache_key not in dirs_searched:
+            cached_dirs.pop(cache_key)
+    
+    return None
+
+
+### Check if a directory path is or is inside a root directory path.
+###     (dir_path) Absolute path string to a directory.
+###     (root_path) Absolute path string to a root directory.
+###     --> Returns a [Boolean]
+def isInRootDirectory(dir_path, root_path):
+    return dir_path == root_path or dir_path.startswith(os.path.join(root_path, ''))
+
+
+### Get ready to search root directories in this process (see "scanRootDirectory").
+###     (settings) A Dictionary of the settings in "ROOT_PROCESS_SETTINGS".
+###     --> Returns a [None]
+def startRootProcess(settings):
+    global async_io_loop
+    globals().update(settings)
+    async_io_loop = None # The thread running the event loop isn't copied over
+    compileRE()
+    return None
+
+
+### Search a root directory tree in a separate process. Only the scan cache entries of this
+### root directory are sent over and back.
+###     (dir_path) Path to a root directory.
+###     (cached_dirs) A Dictionary of scan cache entries found in the root directory, or None
+###                   if the scan cache isn't being used.
+###     --> Returns a [Tuple] of a [List] of disc image files found in each directory (see
+###         "scanDirectoryTree"), the [Integer] amount of files skipped, a [Dictionary] of the
+###         updated scan cache entries, a [Dictionary] of directory listings and a [Dictionary]
+###         of CUE sheet tracks.
+def scanRootDirectory(dir_path, cached_dirs):
+    global scan_cache
+    global directory_listings
+    global cue_sheet_tracks
+    directory_listings = {}
+    cue_sheet_tracks = {}
+    scan_cache = None if cached_dirs is None else { 'version' : getScanCacheVersion(), 'directories' : cached_dirs }
+    
+    run_stats = RunStats()
+    disc_file_batches = list(scanDirectoryTree(dir_path, run_stats=run_stats))
+    
+    return disc_file_batches, run_stats.files_skipped, cached_dirs, directory_listings, cue_sheet_tracks
+
+
+### Return the results of a directory tree already searched, the same as "scanDirectoryTree" would.
+###     (disc_file_batches) A List of disc image files found in each directory.
+###     (files_skipped) Amount of files skipped during the search.
+###     (run_stats) RunStats to add the amount of files skipped to, once all results are returned.
+###     --> Yields a [Tuple] of a directory path and a [List] of parsed disc image files.
+def replayDirectoryTree(disc_file_batches, files_skipped, run_stats):
+    for root, disc_files in disc_file_batches:
+        countDirectorySearched(run_stats, disc_files, 0)
+        yield root, disc_files
+    run_stats.files_skipped += files_skipped
+    run_stats.files_found += files_skipped
+
+
+### Search multiple root directory trees at the same time, "root_process_count" at a time, each
+### in its own process. Results are returned in the same order as the directories given and
+### added to this process's scan cache and directory listings before being returned.
+###     (dir_paths) A List of Paths to root directories.
+###     (run_stats) RunStats to add the amount of files skipped to.
+###     --> Yields an [Iterator] of disc image files found in each directory (see "replayDirectoryTree")
+def scanRootDirectories(dir_paths, run_stats):
+    settings = { setting : globals()[setting] for setting in ROOT_PROCESS_SETTINGS }
+    
+    with ProcessPoolExecutor(max_workers=min(root_process_count, len(dir_paths)),
+                             initializer=startRootProcess, initargs=(settings,)) as pool:
+        root_scans = []
+        for dir_path in dir_paths:
+            root_path = os.path.abspath(dir_path)
+            cached_dirs = None
+            if scan_cache is not None:
+                cached_dirs = { cache_key : cached_dir for cache_key, cached_dir in scan_cache['directories'].items()
+                                if isInRootDirectory(cache_key, root_path) }
+            root_scans.append((dir_path, root_path, pool.submit(scanRootDirectory, dir_path, cached_dirs)))
+        
+        for dir_path, root_path, root_scan in root_scans:
+            try:
+                disc_file_batches, files_skipped, cached_dirs, listings, cue_sheets = root_scan.result()
+            except Exception as error:
+                logger.error('\nCouldn\'t search directory in a separate process due to %s: %s', type(error).__name__, type(error).__doc__)
+                logger.error('%s\n', error)
+                yield list(scanDirectoryTree(dir_path, run_stats=run_stats))
+                continue
+            
+            if cached_dirs is not None and scan_cache is not None:
+                cached_root_dirs = scan_cache['directories']
+                for cache_key in [key for key in cached_root_dirs if isInRootDirectory(key, root_path)]:
+                    cached_root_dirs.pop(cache_key)
+                cached_root_dirs.update(cached_dirs)
+            
+            # Directories also under an earlier root directory (overlapping roots) were already
+            # listed here, and those listings include any playlists saved since.
+            for listing_dir_path, file_names in listings.items():
+                if listing_dir_path not in directory_listings:
+                    directory_listings[listing_dir_path] = file_names
+                    if listing_dir_path in cue_sheets:
+                        cue_sheet_tracks[listing_dir_path] = cue_sheets[listing_dir_path]
+            
+            yield replayDirectoryTree(disc_file_batches, files_skipped, run_stats)
+
+
+### Read the file paths in a manifest one at a time, without loading the whole manifest. Paths
+### are separated by NUL characters if there are any in the start of the manifest, otherwise by
+### new lines.
+###     (manifest_path) Path to a manifest file, or "MANIFEST_STDIN" to read from stdin.
+###     --> Yields a [String] line of the manifest.
+def readManifestLines(manifest_path):
+    if os.fspath(manifest_path) == MANIFEST_STDIN:
+        manifest = contextlib.nullcontext(sys.stdin.buffer)
+    else:
+        manifest = open(manifest_path, 'rb')
+    
+    with manifest as file:
+        separator = None
+        leftover = b''
+        for chunk in iter(lambda: file.read(MANIFEST_CHUNK_SIZE), b''):
+            if separator is None:
+                separator = b'\0' if b'\0' in chunk else b'\n'
+            lines = (leftover + chunk).split(separator)
+            leftover = lines.pop()
+            for line in lines:
+                yield os.fsdecode(line.rstrip(b'\r') if separator == b'\n' else line)
+        if leftover:
+            yield os.fsdecode(leftover.rstrip(b'\r') if separator == b'\n' else leftover)
+
+
+### Get the file path, size and modified time listed in a line of a manifest.
+###     (line) A String line of a manifest, "path" or "path<tab>size<tab>modified time".
+###     --> Returns a [Tuple] of the file path and a [Tuple] of the size and modified time (ns),
+###         or None if not listed.
+def parseManifestLine(line):
+    file_stat = None
+    fields = line.rsplit('\t', 2) if '\t' in line else ()
+    if len(fields) == 3:
+        try:
+            seconds, _, fraction = fields[2].partition('.')
+            # Kept as text until here so nanoseconds aren't rounded off as a float.
+            file_stat = (int(fields[1]), int(seconds) * 1000000000 + int(fraction.ljust(9, '0')[:9] or 0))
+            line = fields[0]
+        except ValueError:
+            file_stat = None # Just a path with tabs in it
+    return line, file_stat
+
+
+### Sort the files listed for a directory in a manifest into disc image files and other files,
+### the same as "scanDirectory" would, and record them in the directory listings.
+###     (dir_path) Absolute path string to a directory.
+###     (file_names) A List of file names listed in the directory.
+###     (run_stats) RunStats to add the amount of files skipped to.
+###     --> Returns a [Tuple] of the directory path and a [List] of parsed disc image files.
+def listManifestDirectory(dir_path, file_names, run_stats):
+    disc_files = []
+    playlist_names = []
+    track_names = []
+    for file_name in file_names:
+        if isSearchableDiscFile(file_name):
+            disc_files.append(parseDiscFileName(file_name))
+        elif isPlaylistFile(file_name):
+            playlist_names.append(file_name)
+        else:
+            track_names.append(file_name)
+    
+    # A directory listed again later in the manifest keeps the files listed before.
+    listed_file_names = directory_listings.get(dir_path)
+    cue_sheets = readCueSheets(dir_path, disc_files) if check_cue_sheets != CUE_SHEET_OFF else {}
+    addDirectoryListing(dir_path, disc_files, playlist_names, track_names if cue_sheets else (), cue_sheets)
+    if listed_file_names:
+        directory_listings[dir_path].update(listed_file_names)
+    
+    countDirectorySearched(run_stats, disc_files, len(playlist_names) + len(track_names))
+    return dir_path, disc_files
+
+
+### Get the disc image files in each directory of a root directory from a manifest instead of
+### searching it. Only the directories the manifest is currently in (and the directories above
+### them) are kept in memory, each directory is returned as soon as the manifest moves past it.
+###     (manifest_path) Path to a manifest file, or "MANIFEST_STDIN" to read from stdin.
+###     (dir_path) Path to a root directory, relative paths in the manifest are joined to it.
+###     (run_stats) RunStats to add the amount of files skipped to.
+###     --> Returns an [Iterator] of a directory path and a [List] of parsed disc image files.
+def readManifest(manifest_path, dir_path, run_stats = None):
+    return listManifestRoot(readManifestLines(manifest_path), dir_path, run_stats)
+
+
+### Read a manifest once for all the root directories given, instead of once per root directory
+### (stdin can only be read once). The first root directory's files are read straight from the
+### manifest, while the lines of the root directories after it are kept until their turn.
+###     (manifest_path) Path to a manifest file, or "MANIFEST_STDIN" to read from stdin.
+###     (dir_paths) A List of Paths to root directories, in the order they're searched.
+###     (run_stats) RunStats to add the amount of files skipped to.
+###     --> Yields an [Iterator] of the disc image files found in each directory of each root
+###         directory (see "readManifest").
+def readManifestRoots(manifest_path, dir_paths, run_stats):
+    root_paths = [os.path.abspath(dir_path) for dir_path in dir_paths]
+    if not root_paths:
+        return
+    later_root_lines = collections.deque((root_path, []) for root_path in root_paths[1:])
+    
+    def routeManifestLines():
+        listed_dir_path = None
+        for line in readManifestLines(manifest_path):
+            line_dir_path = os.path.dirname(parseManifestLine(line)[0])
+            if line_dir_path != listed_dir_path:
+                listed_dir_path = line_dir_path
+                line_roots = [root_lines for root_path, root_lines in later_root_lines
+                              if isInRootDirectory(os.path.abspath(os.path.join(root_path, line_dir_path)), root_path)]
+            for root_lines in line_roots:
+                root_lines.append(line)
+            yield line
+    
+    manifest_lines = routeManifestLines()
+    yield listManifestRoot(manifest_lines, root_paths[0], run_stats)
+    collections.deque(manifest_lines, maxlen=0) # Whatever the first root directory didn't read
+    
+    while later_root_lines:
+        root_path, root_lines = later_root_lines.popleft()
+        yield listManifestRoot(root_lines, root_path, run_stats)
+
+
+### Get the disc image files in each directory of a root directory from the lines of a manifest
+### (see "readManifest").
+###     (manifest_lines) An Iterator of String lines of a manifest.
+###     (dir_path) Path to a root directory, relative paths in the manifest are joined to it.
+###     (run_stats) RunStats to add the amount of files skipped to.
+###     --> Yields a [Tuple] of a directory path and a [List] of parsed disc image files.
+def listManifestRoot(manifest_lines, dir_path, run_stats = None):
+    run_stats = run_stats or RunStats()
+    root_path = os.path.abspath(dir_path)
+    open_dirs = [] # [Directory path, [File names]] of the directory listed and those above it
+    listed_dir_path = None
+    
+    for line in manifest_lines:
+        file_path, file_stat = parseManifestLine(line)
+        split_at = file_path.rfind(os.sep)
+        if os.altsep:
+            split_at = max(split_at, file_path.rfind(os.altsep))
+        file_name = file_path[split_at + 1:]
+        if not file_name: # Directories listed too
+            continue
+        
+        # Files in the same directory are listed one after another, so the directory path is only
+        # worked out again when it changes.
+        line_dir_path = file_path[:split_at] if split_at > 0 else file_path[:split_at + 1]
+        if line_dir_path != listed_dir_path:
+            listed_dir_path = line_dir_path
+            file_dir_path = os.path.abspath(os.path.join(root_path, listed_dir_path))
+            in_root_dir = isInRootDirectory(file_dir_path, root_path)
+            if in_root_dir and (not open_dirs or open_dirs[-1][0] != file_dir_path):
+                while open_dirs and not isInRootDirectory(file_dir_path, open_dirs[-1][0]):
+                    yield listManifestDirectory(*open_dirs.pop(), run_stats)
+                if not open_dirs or open_dirs[-1][0] != file_dir_path:
+                    open_dirs.append((file_dir_path, []))
+        if not in_root_dir:
+            continue
+        open_dirs[-1][1].append(file_name)
+        
+        if file_stat and dat_index and isSearchableDiscFile(file_name):
+            manifest_file_stats[os.path.join(file_dir_path, file_name)] = file_stat
+    
+    while open_dirs:
+        yield listManifestDirectory(*open_dirs.pop(), run_stats)
+
+
+### Load the game names of each disc in Redump/No-Intro (Logiqx XML) DAT files, indexed by the
+### SHA-1 hash of each file ("rom") or CHD ("disk").
+###     (dat_file_paths) A List of Paths to DAT files.
+###     --> Returns a [Dictionary] of SHA-1 hashes and game names.
+def loadDatIndex(dat_file_paths):
+    dat_index.clear()
+    for dat_file_path in dat_file_paths:
+        try:
+            for event, element in ElementTree.iterparse(dat_file_path):
+                if element.tag not in ('game', 'machine'):
+                    continue
+                game_name = element.get('name')
+                if game_name:
+                    for disc in element:
+                        sha1 = disc.get('sha1')
+                        if sha1 and disc.tag in ('rom', 'disk'):
+                            dat_index.setdefault(sha1.casefold(), game_name)
+                element.clear()
+        except (OSError, ElementTree.ParseError) as error:
+            logger.error('\nCouldn\'t load DAT file due to %s: %s', type(error).__name__, type(error).__doc__)
+            logger.error('%s\n', error)
+    
+    logger.info('\nDAT Files Loaded: %s Disc Hashes', len(dat_index))
+    return dat_index
+
+
+### Get the path of the hash cache file, saved in the same directory as the log file.
+###     --> Returns a [Path]
+def getHashCacheFilePath():
+    return Path(PurePath().joinpath(Path(__file__).parent, f'{Path(__file__).stem}__hash_cache.json'))
+
+
+### Load the hash cache file. If it doesn't exist, can't be read or is an older version an
+### empty cache will be used instead.
+###     (cache_file_path) Path of a hash cache file.
 ###     --> Returns a [Dictionary]
-def setMultDiscGameType(multi_disc_games_found, game, game_type = MULTI_DISC):
-    if LOG_DATA not in multi_disc_games_found[game].keys():
-        #multi_disc_games_found[game][LOG_DATA] = [game_type]
-        multi_disc_games_found[game][LOG_DATA] = [[game_type, use_relative_paths]]
+def loadHashCache(cache_file_path = None):
+    global hash_cache
+    cache_file_path = cache_file_path or getHashCacheFilePath()
+    
+    try:
+        hash_cache = json.loads(Path(cache_file_path).read_text(encoding='utf-8'))
+        if hash_cache.get('version') != HASH_CACHE_VERSION:
+            hash_cache = None
+    except (OSError, ValueError):
+        hash_cache = None
+    
+    if type(hash_cache) != dict or type(hash_cache.get('files')) != dict:
+        hash_cache = { 'version' : HASH_CACHE_VERSION, 'files' : {} }
+    
+    return hash_cache
+
+
+### Save the hash cache file, replaced in one step the same as the scan cache.
+###     (cache_file_path) Path of a hash cache file.
+###     --> Returns a [Boolean]
+def saveHashCache(cache_file_path = None):
+    if hash_cache is None:
+        return False
+    
+    cache_file_path = Path(cache_file_path or getHashCacheFilePath())
+    temp_file_path = cache_file_path.with_name(f'{cache_file_path.name}.tmp')
+    try:
+        temp_file_path.write_text(json.dumps(hash_cache, separators=(',',':')), encoding='utf-8')
+        os.replace(temp_file_path, cache_file_path)
+    except Exception as error:
+        logger.error('\nCouldn\'t save hash cache file due to %s: %s', type(error).__name__, type(error).__doc__)
+        logger.error('%s\n', error)
+        return False
+    
+    return True
+
+
+### Get the SHA-1 hash saved in the header of a CHD image, without reading the rest of the file.
+###     (file_path) Path to a CHD image file.
+###     --> Returns a [String] or None if not a CHD image with a known header version.
+def readCHDHash(file_path):
+    try:
+        with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as header:
+            if header[:len(CHD_MAGIC)] != CHD_MAGIC:
+                return None
+            sha1_offset = CHD_SHA1_OFFSETS.get(int.from_bytes(header[12:16], 'big'))
+            if sha1_offset is None or len(header) < sha1_offset + 20:
+                return None
+            return header[sha1_offset:sha1_offset + 20].hex()
+    except (OSError, ValueError): # Empty files can't be mapped
+        return None
+
+
+### Read a whole disc image file and get its SHA-1 hash. Ran in a separate process.
+###     (file_path) Path to a disc image file.
+###     --> Returns a [String] or None if the file couldn't be read.
+def hashDiscFile(file_path):
+    sha1 = hashlib.sha1()
+    try:
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+                sha1.update(chunk)
+    except OSError:
+        return None
+    return sha1.hexdigest()
+
+
+### Get the hash of a file, either from the hash cache, a CHD header or by starting to hash the
+### file in the hash process pool.
+###     (file_path) Absolute path string to the file.
+###     (file_stat) The size and modified time of the file, or None to look them up.
+###     (hash_pools) A List holding the hash process pool, started when first needed.
+###     --> Returns a [Tuple] of the file path, size, modified time and hash (or a Future hash).
+def queueFileHash(file_path, file_stat, hash_pools):
+    if file_stat is None:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return file_path, None, None, None
+        file_stat = (file_stat.st_size, file_stat.st_mtime_ns)
+    file_size, file_mtime = file_stat
+    
+    cached_hash = hash_cache['files'].get(file_path)
+    if cached_hash and cached_hash[0] == file_size and cached_hash[1] == file_mtime:
+        file_hash = cached_hash[2]
+    elif file_path[-4:].casefold() == '.chd':
+        file_hash = readCHDHash(file_path)
+    elif hash_process_count > 1:
+        if not hash_pools:
+            hash_pools.append(ProcessPoolExecutor(max_workers=hash_process_count))
+        file_hash = hash_pools[0].submit(hashDiscFile, file_path)
     else:
-        multi_disc_games_found[game][LOG_DATA][GAME_INFO][GAME_TYPE] = game_type
+        file_hash = hashDiscFile(file_path)
+    return file_path, file_size, file_mtime, file_hash
+
+
+### Get the paths of the track files linked in a CUE sheet, using the CUE sheets already read
+### while searching if there are any.
+###     (dir_path) Absolute path string to the directory of the CUE sheet.
+###     (cue_sheet_name) File name of the CUE sheet.
+###     --> Returns a [List] of absolute path strings.
+def getCueSheetTrackPaths(dir_path, cue_sheet_name):
+    track_names = cue_sheet_tracks.get(dir_path, {}).get(cue_sheet_name)
+    if track_names is None:
+        track_names, file_stat = readCueSheet(os.path.join(dir_path, cue_sheet_name))
     
-    return multi_disc_games_found
+    track_paths = []
+    for track_name in track_names or ():
+        if os.sep != '\\':
+            track_name = track_name.replace('\\', os.sep) # Saved on Windows
+        track_paths.append(os.path.abspath(os.path.join(dir_path, track_name)))
+    return track_paths
+
+
+### Get the hashes of the disc image files in a directory (see "queueFileHash"). A CUE sheet is
+### only text that changes with its file names, so the track files it links are hashed instead.
+###     (root) Path of the directory.
+###     (disc_files) A List of parsed disc image files found in the directory.
+###     (hash_pools) A List holding the hash process pool, started when first needed.
+###     --> Returns a [Tuple] of the directory path, disc image files and a [List] of each disc
+###         image's file hashes, a [List] of [Tuples] (see "queueFileHash").
+def queueDiscFileHashes(root, disc_files, hash_pools):
+    dir_path = os.path.abspath(root)
+    disc_hashes = []
+    for disc_file in disc_files:
+        if disc_file[-1] == '.cue':
+            disc_hashes.append([queueFileHash(track_path, None, hash_pools)
+                                for track_path in getCueSheetTrackPaths(dir_path, disc_file[0])])
+        else:
+            file_path = os.path.join(dir_path, disc_file[0])
+            disc_hashes.append([queueFileHash(file_path, manifest_file_stats.pop(file_path, None), hash_pools)])
+    
+    return root, disc_files, disc_hashes
+
+
+### Use the game names of the disc image files found in the DAT files, once they're hashed.
+###     (root) Path of the directory.
+###     (disc_files) A List of parsed disc image files found in the directory.
+###     (disc_hashes) The file hashes of each disc image (see "queueDiscFileHashes").
+###     (run_stats) RunStats to add the amount of discs hashed and identified to.
+###     --> Returns a [Tuple] of the directory path and a [List] of parsed disc image files.
+def identifyDiscFileBatch(root, disc_files, disc_hashes, run_stats):
+    identified_disc_files = disc_files
+    for i, file_hashes in enumerate(disc_hashes):
+        game_name = None
+        disc_hashed = False
+        for file_path, file_size, file_mtime, file_hash in file_hashes:
+            if isinstance(file_hash, Future):
+                try:
+                    file_hash = file_hash.result()
+                except Exception: # The process pool stopped working
+                    file_hash = hashDiscFile(file_path)
+            
+            if file_hash is not None and hash_cache['files'].get(file_path) != [file_size, file_mtime, file_hash]:
+                hash_cache['files'][file_path] = [file_size, file_mtime, file_hash]
+                disc_hashed = True
+            # The first track of a CUE sheet found in the DAT names the disc.
+            game_name = game_name or dat_index.get(file_hash)
+        
+        if disc_hashed:
+            run_stats.discs_hashed += 1
+        if game_name:
+            # Copied first so the disc image files in the scan cache are left as they were found.
+            if identified_disc_files is disc_files:
+                identified_disc_files = list(disc_files)
+            file_name, file_ext = disc_files[i][0], disc_files[i][-1]
+            game_title, game_info_list, disc_number, file_stem = parseDiscFileStem(game_name)
+            identified_disc_files[i] = [file_name, game_title, list(game_info_list), disc_number, file_stem, file_ext]
+            run_stats.discs_identified += 1
+            logger.debug('--Identified By DAT: "%s" As "%s"', file_name, game_name)
+    
+    # Disc images are added to playlists in the order found, so put them in disc number order
+    # using the names from the DAT (file names of badly named discs may be in any order).
+    if identified_disc_files is not disc_files:
+        identified_disc_files.sort(key=lambda disc_file: (disc_file[4].casefold(), disc_file[3] or 0, disc_file[0]))
+    
+    return root, identified_disc_files
+
+
+### Identify the disc image files found in each directory using the DAT files. Disc images are
+### hashed a few directories ahead, while the directories before them are being grouped.
+###     (disc_file_batches) The disc image files found in each directory (see "scanDirectoryTree").
+###     (run_stats) RunStats to add the amount of discs hashed and identified to.
+###     --> Yields a [Tuple] of a directory path and a [List] of parsed disc image files.
+def identifyDiscFiles(disc_file_batches, run_stats):
+    if hash_cache is None:
+        loadHashCache()
+    disc_file_batches = iter(disc_file_batches)
+    pending_batches = collections.deque()
+    hash_pools = []
+    discs_hashed = run_stats.discs_hashed
+    batches_left = True
+    
+    try:
+        while True:
+            with timePhase(run_stats, 'identify'):
+                while batches_left and len(pending_batches) <= HASH_LOOKAHEAD:
+                    disc_file_batch = next(disc_file_batches, None)
+                    if disc_file_batch is None:
+                        batches_left = False
+                    else:
+                        pending_batches.append(queueDiscFileHashes(*disc_file_batch, hash_pools))
+                if not pending_batches:
+                    return
+                root, disc_files = identifyDiscFileBatch(*pending_batches.popleft(), run_stats)
+            yield root, disc_files
+    finally:
+        for root, disc_files, disc_hashes in pending_batches:
+            for file_hashes in disc_hashes:
+                for file_hash in file_hashes:
+                    if isinstance(file_hash[3], Future):
+                        file_hash[3].cancel()
+        for hash_pool in hash_pools:
+            hash_pool.shutdown(wait=True)
+        if run_stats.discs_hashed > discs_hashed:
+            saveHashCache()
+
+
+### A playlist to be created and the paths to each disc to be saved in it.
+###     (path) Path of the playlist file.
+###     (disc_paths) A List of Paths to disc files.
+class Playlist:
+    __slots__ = ('path', 'disc_paths', 'creation', 'output_path', 'output_disc_paths', 'existing_bytes')
+    
+    def __init__(self, path, disc_paths = None):
+        self.path = path
+        self.disc_paths = disc_paths if disc_paths is not None else []
+        # How the playlist was saved: NOT_OVERWRITTEN, NOT_UPDATED, SAVED, UPDATED or an error
+        # message. None until "createPlaylists" has attempted to save it.
+        self.creation = None
+        # Where the playlist was saved and the disc paths (relative or absolute) saved in it.
+        self.output_path = None
+        self.output_disc_paths = None
+        # The existing playlist file, if it was read and left as it was (see "verifyPlaylists").
+        self.existing_bytes = None
+    
+    def __repr__(self):
+        return f'Playlist({str(self.path)!r}, {[str(path) for path in self.disc_paths]!r})'
+    
+    ### Add a disc path to this playlist if it isn't already in it.
+    ###     (disc_path) Path to a disc file.
+    ###     --> Returns a [Boolean]
+    def addDiscPath(self, disc_path):
+        if disc_path in self.disc_paths:
+            return False
+        self.disc_paths.append(disc_path)
+        self.creation = None # Changed since last saved, so it will need to be saved again.
+        return True
+
+
+### A multi-disc game and all the playlists to be created for it.
+###     (path) "Path" used to differentiate between games with the same name, the directory
+###            the game was found in joined with the "Game Title". Not an actual path.
+###     (game_type) MULTI_DISC, COMPILATION, COMPILATION_UP_ONE, DIFF_VERSION, UNKNOWN
+class Game:
+    __slots__ = ('path', 'game_type', 'playlists', 'playlists_by_name')
+    
+    def __init__(self, path, game_type = MULTI_DISC):
+        self.path = path
+        self.game_type = game_type
+        # Only change these using the methods below, so the two always match. A game never has two
+        # playlists with the same file name, even when one was moved to another directory.
+        self.playlists = {} # Playlist Path : Playlist
+        self.playlists_by_name = {} # Playlist file name : Playlist
+    
+    def __repr__(self):
+        return f'Game({str(self.path)!r}, {list(self.playlists.values())!r})'
+    
+    @property
+    def name(self):
+        return self.path.name
+    
+    ### Get the playlist with a file name, wherever it's saved.
+    ###     (playlist_name) File name of the playlist.
+    ###     --> Returns a [Playlist] or None if there isn't one.
+    def getPlaylistNamed(self, playlist_name):
+        return self.playlists_by_name.get(playlist_name)
+    
+    ### Add a new playlist or get the existing playlist with the same file name, which may have
+    ### been moved to another directory (see "checkForDupeGames").
+    ###     (playlist_path) Path of the playlist file.
+    ###     (disc_paths) A List of Paths to disc files, only used for a new playlist.
+    ###     --> Returns a [Playlist]
+    def addPlaylist(self, playlist_path, disc_paths = None):
+        playlist = self.playlists_by_name.get(playlist_path.name)
+        if playlist is None:
+            playlist = Playlist(playlist_path, disc_paths)
+            self.playlists[playlist_path] = playlist
+            self.playlists_by_name[playlist_path.name] = playlist
+        return playlist
+    
+    ### Remove a playlist.
+    ###     (playlist_path) Path of the playlist file.
+    ###     --> Returns a [Playlist]
+    def removePlaylist(self, playlist_path):
+        playlist = self.playlists.pop(playlist_path)
+        del self.playlists_by_name[playlist_path.name]
+        return playlist
+    
+    ### Move a playlist to a new path. Nothing is changed if there's no playlist at the current path,
+    ### it's already at the new path or the new path or file name is used by another playlist.
+    ###     (playlist_path) Current Path of the playlist file.
+    ###     (new_playlist_path) New Path of the playlist file.
+    ###     --> Returns a [Playlist] or None if it wasn't moved.
+    def movePlaylist(self, playlist_path, new_playlist_path):
+        playlist = self.playlists.get(playlist_path)
+        if playlist is None or new_playlist_path == playlist_path:
+            return None
+        if (self.playlists.get(new_playlist_path, playlist) is not playlist
+            or self.playlists_by_name.get(new_playlist_path.name, playlist) is not playlist):
+                return None
+        
+        del self.playlists[playlist_path]
+        del self.playlists_by_name[playlist_path.name]
+        playlist.path = new_playlist_path
+        self.playlists[new_playlist_path] = playlist
+        self.playlists_by_name[new_playlist_path.name] = playlist
+        return playlist
+
+
+### Playlist creation totals for a run.
+class RunStats:
+    __slots__ = ('not_overwritten', 'not_updated', 'saved', 'updated', 'save_errors', 'files_skipped',
+                 'files_checked', 'verified', 'repaired', 'deleted', 'dirs_searched', 'files_found',
+                 'disc_files_found', 'names_parsed', 'discs_hashed', 'discs_identified', 'cue_sheets_checked',
+                 'cue_sheets_broken', 'playlists_read', 'playlists_written', 'phase_times', 'phase_memory')
+    
+    def __init__(self):
+        self.not_overwritten = 0
+        self.not_updated = 0
+        self.saved = 0
+        self.updated = 0
+        self.save_errors = 0
+        self.files_skipped = 0 # Not disc images, skipped using only their file names.
+        self.files_checked = 0 # Files that had to be checked on the drive to see if they exist.
+        self.verified = 0 # Existing playlists checked for disc paths that no longer exist.
+        self.repaired = 0 # Playlists saved again without the disc paths that no longer exist.
+        self.deleted = 0 # Playlists deleted as none of their disc paths exist.
+        self.dirs_searched = 0
+        self.files_found = 0 # Disc images and files skipped
+        self.disc_files_found = 0
+        self.names_parsed = 0 # Disc image file names read with the regular expression patterns
+        self.discs_hashed = 0 # Disc images read and hashed (not already in the hash cache)
+        self.discs_identified = 0 # Disc images found in a DAT file
+        self.cue_sheets_checked = 0
+        self.cue_sheets_broken = 0 # CUE sheets with missing track files
+        self.playlists_read = 0
+        self.playlists_written = 0 # Saved, updated or had missing discs removed
+        self.phase_times = {} # Phase : Seconds spent in the phase itself (not phases within it)
+        self.phase_memory = {} # Phase : Most memory used in bytes (only with 'tracemalloc' profiling)
+
+
+### All multi-disc games found, indexed by their game "Path" and by name so games with the
+### same name found in different directories can be quickly looked up. Games moved out of
+### memory are still part of the library (see "gamesInMemory" for only those still in memory).
+class GameLibrary:
+    __slots__ = ('games', 'games_by_name', 'stats', 'evicted_games_file', 'evicted_names',
+                 'evicted_game_count', 'evicted_bytes_restored')
+    
+    def __init__(self):
+        self.games = {} # Game Path : Game
+        self.games_by_name = {} # Game Name : [Game, ...]
+        self.stats = RunStats()
+        self.evicted_games_file = None # Games moved out of memory (see "evictGames")
+        self.evicted_names = {} # Game Name : (Position, Size) in the evicted games file
+        self.evicted_game_count = 0
+        self.evicted_bytes_restored = 0 # Bytes in the evicted games file no longer used
+    
+    def __contains__(self, game_path):
+        if self.evicted_names: self.restoreGames(game_path.name)
+        return game_path in self.games
+    
+    def __len__(self):
+        return len(self.games) + self.evicted_game_count
+    
+    def __iter__(self):
+        return self.allGames()
+    
+    def get(self, game_path):
+        if self.evicted_names: self.restoreGames(game_path.name)
+        return self.games.get(game_path)
+    
+    ### Add a new game, replacing any game already found with the same path.
+    ###     (game_path) "Path" of the game (see "Game").
+    ###     (game_type) The type of game.
+    ###     --> Returns a [Game]
+    def addGame(self, game_path, game_type = MULTI_DISC):
+        if game_path in self:
+            self.removeGame(game_path)
+        game = self.games[game_path] = Game(game_path, game_type)
+        self.games_by_name.setdefault(game.name, []).append(game)
+        return game
+    
+    ### Remove a game.
+    ###     (game_path) "Path" of the game.
+    ###     --> Returns a [Game]
+    def removeGame(self, game_path):
+        game = self.games.pop(game_path)
+        same_name_games = self.games_by_name[game.name]
+        same_name_games.remove(game)
+        if not same_name_games:
+            self.games_by_name.pop(game.name)
+        return game
+    
+    ### Move all games out of memory into a temporary file, keeping only their names and where
+    ### they were saved in the file. Any game with the same name as one found later is brought
+    ### back (see "restoreGames").
+    ###     --> Returns an [Integer] amount of games moved
+    def evictGames(self):
+        if self.evicted_games_file is None:
+            self.evicted_games_file = tempfile.TemporaryFile(prefix='auto_m3u_games_')
+        
+        self.evicted_games_file.seek(0, os.SEEK_END)
+        for name, same_name_games in self.games_by_name.items():
+            games_bytes = pickle.dumps(same_name_games, pickle.HIGHEST_PROTOCOL)
+            self.evicted_names[name] = (self.evicted_games_file.tell(), len(games_bytes))
+            self.evicted_games_file.write(games_bytes)
+        
+        game_count = len(self.games)
+        self.evicted_game_count += game_count
+        self.games.clear()
+        self.games_by_name.clear()
+        return game_count
+    
+    ### Bring back the games moved out of memory with this name, if any. The evicted games file
+    ### is emptied once every game is back, or rewritten once it's mostly games already brought back.
+    ###     (name) Name of the game.
+    ###     --> Returns a [None]
+    def restoreGames(self, name):
+        if name in self.evicted_names:
+            position, size = self.evicted_names.pop(name)
+            for game in self.readEvictedGames(position, size):
+                self.games[game.path] = game
+                self.games_by_name.setdefault(name, []).append(game)
+                self.evicted_game_count -= 1
+            
+            self.evicted_bytes_restored += size
+            if not self.evicted_names:
+                self.evicted_games_file.truncate(0)
+                self.evicted_bytes_restored = 0
+            elif self.evicted_bytes_restored > self.evicted_games_file.seek(0, os.SEEK_END) // 2:
+                self.compactEvictedGames()
+        return None
+    
+    ### Copy the games still moved out of memory to a new evicted games file, leaving out the
+    ### games that have been brought back.
+    ###     --> Returns a [None]
+    def compactEvictedGames(self):
+        old_games_file = self.evicted_games_file
+        self.evicted_games_file = tempfile.TemporaryFile(prefix='auto_m3u_games_')
+        for name, (position, size) in self.evicted_names.items():
+            old_games_file.seek(position)
+            self.evicted_names[name] = (self.evicted_games_file.tell(), size)
+            self.evicted_games_file.write(old_games_file.read(size))
+        old_games_file.close()
+        self.evicted_bytes_restored = 0
+        return None
+    
+    ### Read games moved out of memory.
+    ###     (position) Position in the evicted games file.
+    ###     (size) Size in bytes.
+    ###     --> Returns a [List] of Games
+    def readEvictedGames(self, position, size):
+        self.evicted_games_file.seek(position)
+        return pickle.loads(self.evicted_games_file.read(size))
+    
+    ### Get every game, including those moved out of memory (which are left there).
+    ###     --> Yields a [Game]
+    def allGames(self):
+        yield from self.games.values()
+        for position, size in list(self.evicted_names.values()):
+            yield from self.readEvictedGames(position, size)
+    
+    ### Get only the games still in memory, those found since games were last moved out of memory.
+    ###     --> Returns an [Iterator] of Games
+    def gamesInMemory(self):
+        return iter(self.games.values())
+    
+    ### Delete the temporary file of games moved out of memory.
+    ###     --> Returns a [None]
+    def close(self):
+        if self.evicted_games_file is not None:
+            self.evicted_games_file.close()
+            self.evicted_games_file = None
+            self.evicted_names.clear()
+            self.evicted_game_count = 0
+            self.evicted_bytes_restored = 0
+        return None
+
+
+### Start timing a phase of a run. Phases can be within other phases, the time spent in a phase
+### doesn't include the time spent in phases within it. Only phases not within another phase
+### are profiled (see "profile_phases").
+###     (run_stats) RunStats to add the time spent to.
+###     (phase) Name of the phase (see "PHASE_NAMES").
+###     --> Returns a [None]
+def startPhase(run_stats, phase):
+    if not phase_stack:
+        if profile_phases == PROFILE_CPROFILE:
+            if phase not in phase_profiles:
+                phase_profiles[phase] = cProfile.Profile()
+            phase_profiles[phase].enable()
+        elif profile_phases == PROFILE_TRACEMALLOC:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if hasattr(tracemalloc, 'reset_peak'): # Python 3.9+
+                tracemalloc.reset_peak()
+    phase_stack.append([phase, time.perf_counter(), 0.0])
+    return None
+
+
+### Stop timing the last phase started.
+###     (run_stats) RunStats to add the time spent to.
+###     --> Returns a [None]
+def endPhase(run_stats):
+    phase, start_time, inner_phase_time = phase_stack.pop()
+    phase_time = time.perf_counter() - start_time
+    run_stats.phase_times[phase] = run_stats.phase_times.get(phase, 0) + phase_time - inner_phase_time
+    
+    if phase_stack:
+        phase_stack[-1][2] += phase_time
+    elif profile_phases == PROFILE_CPROFILE:
+        phase_profiles[phase].disable()
+    elif profile_phases == PROFILE_TRACEMALLOC and tracemalloc.is_tracing():
+        run_stats.phase_memory[phase] = max(run_stats.phase_memory.get(phase, 0), tracemalloc.get_traced_memory()[1])
+        phase_memory_snapshots[phase] = tracemalloc.take_snapshot()
+    return None
+
+
+### Time a phase of a run (see "startPhase").
+###     (run_stats) RunStats to add the time spent to.
+###     (phase) Name of the phase.
+@contextlib.contextmanager
+def timePhase(run_stats, phase):
+    startPhase(run_stats, phase)
+    try:
+        yield
+    finally:
+        endPhase(run_stats)
+
+
+### Time how long is spent waiting on each directory searched, as the search is done while the
+### discs already found are being grouped.
+###     (disc_file_batches) The disc image files found in each directory (see "scanDirectoryTree").
+###     (run_stats) RunStats to add the time spent to.
+###     --> Yields a [Tuple] of a directory path and a [List] of parsed disc image files.
+def timeDirectoryTree(disc_file_batches, run_stats):
+    disc_file_batches = iter(disc_file_batches)
+    while True:
+        with timePhase(run_stats, 'scan'):
+            disc_file_batch = next(disc_file_batches, None)
+        if disc_file_batch is None:
+            return
+        yield disc_file_batch
+
+
+### Save the profiles of each phase (see "profile_phases") next to this script.
+###     --> Returns a [List] of the Paths saved.
+def saveProfiles():
+    profile_file_paths = []
+    for phase, profile in phase_profiles.items():
+        profile_file_path = Path(__file__).with_name(f'{Path(__file__).stem}__profile_{phase}.prof')
+        profile.dump_stats(profile_file_path)
+        profile_file_paths.append(profile_file_path)
+    
+    for phase, snapshot in phase_memory_snapshots.items():
+        profile_file_path = Path(__file__).with_name(f'{Path(__file__).stem}__memory_{phase}.txt')
+        top_stats = snapshot.statistics('lineno')[:25]
+        profile_file_path.write_text('\n'.join(str(stat) for stat in top_stats), encoding='utf-8')
+        profile_file_paths.append(profile_file_path)
+    
+    return profile_file_paths
+
+
+### Get the time spent in each phase and the totals counted during a run.
+###     (run_stats) RunStats of the run.
+###     --> Returns a [List] of lines
+def getPhaseSummaryLines(run_stats):
+    text_lines = []
+    if run_stats.phase_times:
+        text_lines.append(f'- Time Spent: {sum(run_stats.phase_times.values()):.3f}s')
+    for phase, phase_time in sorted(run_stats.phase_times.items(), key=lambda phase_time: -phase_time[1]):
+        phase_memory = run_stats.phase_memory.get(phase)
+        phase_memory = f' (Peak Memory: {phase_memory / 1048576:.1f} MB)' if phase_memory else ''
+        text_lines.append(f'--{PHASE_NAMES.get(phase, phase)}: {phase_time:.3f}s{phase_memory}')
+    if run_stats.dirs_searched:
+        text_lines.append(f'- Directories Searched: {run_stats.dirs_searched}')
+        text_lines.append(f'- Files Found: {run_stats.files_found} ({run_stats.disc_files_found} Disc Images)')
+        text_lines.append(f'- File Names Read: {run_stats.names_parsed} (Others Already Read Before)')
+    if run_stats.cue_sheets_checked:
+        text_lines.append(f'- CUE Sheets Checked: {run_stats.cue_sheets_checked}')
+    if dat_index:
+        text_lines.append(f'- Disc Images Hashed: {run_stats.discs_hashed} (Others Already Hashed Before)')
+        text_lines.append(f'- Disc Images Identified By DAT: {run_stats.discs_identified}')
+    text_lines.append(f'- Files Checked On Drive: {run_stats.files_checked}')
+    text_lines.append(f'- Playlists Read: {run_stats.playlists_read}')
+    text_lines.append(f'- Playlists Written: {run_stats.playlists_written}')
+    return text_lines
+
+
+### A single line showing the progress of a search, redrawn at most every PROGRESS_INTERVAL.
+### Only shown in the 'quiet' console output, and only in a terminal (see "show_progress").
+###     (text) What is being done, shown at the start of the line.
+class ProgressLine:
+    __slots__ = ('text', 'enabled', 'start_time', 'next_time', 'line_length')
+    
+    def __init__(self, text):
+        self.text = text
+        self.enabled = show_progress and not logger.isEnabledFor(logging.INFO) and sys.stdout.isatty()
+        self.start_time = time.monotonic()
+        self.next_time = self.start_time + PROGRESS_INTERVAL
+        self.line_length = 0
+    
+    ### Redraw the progress line, if it's time to.
+    ###     (dir_count) Directories searched so far.
+    ###     (file_count) Files found so far.
+    ###     (game_count) Games found so far.
+    ###     (final) Redraw now and end the line.
+    ###     --> Returns a [None]
+    def update(self, dir_count, file_count, game_count, final = False):
+        now = time.monotonic()
+        if not self.enabled or (now < self.next_time and not final):
+            return None
+        self.next_time = now + PROGRESS_INTERVAL
+        
+        elapsed_time = max(now - self.start_time, 0.001)
+        line = (f'{self.text}: {dir_count} Directories ({dir_count/elapsed_time:.0f}/s), '
+                f'{file_count} Files ({file_count/elapsed_time:.0f}/s), {game_count} Games Found')
+        padding = ' ' * (self.line_length - len(line)) # Clear what's left of a longer line
+        sys.stdout.write(f'\r{line}{padding}\n' if final else f'\r{line}{padding}')
+        sys.stdout.flush()
+        self.line_length = 0 if final else len(line)
+        return None
+
+
+### Find multi disc games and get their file paths and create a file name for the playlist.
+###     (dir_path) Path to a directory.
+###     (multi_disc_games_found) GameLibrary of all multi-disc games and the playlists to be
+###                              created with the paths to each disc.
+###     (disc_file_batches) The disc image files found in each directory, if the directory
+###                         has already been searched (see "scanDirectoryTree").
+###     --> Returns a [GameLibrary] and [Integer]
+def findMultiDiscGames(dir_path, multi_disc_games_found, disc_file_batches = None):
+    playlist_count = 0
+    seperate_disc_formats = False
+    
+    logger.info('\n--------------------------------------------------------------------------')
+    logger.info('Searching Directory For Multi-Disc Games: %s', dir_path)
+    logger.info('--------------------------------------------------------------------------\n')
+    
+    previous_game, game = '',''
+    previous_playlist_file_name, previous_file_ext = '',''
+    run_stats = multi_disc_games_found.stats
+    files_skipped = run_stats.files_skipped
+    names_parsed = parseDiscFileStem.cache_info().misses
+    startPhase(run_stats, 'group')
+    
+    if disc_file_batches is None:
+        disc_file_batches = scanDirectoryTree(dir_path, run_stats=run_stats)
+    disc_file_batches = timeDirectoryTree(disc_file_batches, run_stats)
+    if check_cue_sheets != CUE_SHEET_OFF:
+        disc_file_batches = checkCueSheets(disc_file_batches, run_stats)
+    if dat_index:
+        disc_file_batches = identifyDiscFiles(disc_file_batches, run_stats)
+    
+    progress = ProgressLine('Searching')
+    dir_count, disc_file_count = 0, 0
+    
+    for root, disc_files in disc_file_batches:
+        
+        dir_count += 1
+        disc_file_count += len(disc_files)
+        progress.update(dir_count, disc_file_count + multi_disc_games_found.stats.files_skipped - files_skipped,
+                        len(multi_disc_games_found))
+        previous_disc_number = 0
+        possible_compilation_disc_names = {} # Game Title : [File names] of discs without disc numbers
+        
+        for file, game_title, game_info_list, disc_number, disc_file_name, file_ext in disc_files:
+            
+            is_multidisc_game = disc_number is not None
+            
+            # Group disc paths with the same "Game Title" to later check if it could be a compilation game.
+            # This game could be: a compilation or collection of game discs (most likely),
+            #                     a multi-disc game with disc titles instead of numbers, or
+            #                     a different version of the same game (i.e. patched/hack/etc).
+            # Note: Multi-disc games with only disc titles or versions will be ordered alphabetically, which
+            #       may be the incorrect order. No way for code to detect correct order.
+            ## TODO: Detect patched or hacked games? Probably not, not enough universal standards here. However...
+            ## If one disc has an extra "Game Info" then it's likely a different version. What if there're multiple different versions?
+            if not is_multidisc_game:
+                if not ignore_compilation_discs:
+                    possible_compilation_disc_names.setdefault(game_title, []).append(file)
+                continue
+            
+            file_path = Path(PurePath().joinpath(root, file))
+            
+            # "Path" will be use to differentiate between games with the same name. Not an actual path.
+            game = Path(PurePath().joinpath(root, game_title))
+            
+            if game != previous_game:
+                seperate_disc_formats = False
+                logger.debug('--------------------------------------------------------------------------')
+                logger.debug('-Multi-Disc Game Found: %s', game.name)
+                logger.debug('--------------------------------------------------------------------------')
+            logger.debug('--File Name: "%s"', file_path.name)
+            
+            if game in multi_disc_games_found: # Existing Game
+                
+                existing_game = multi_disc_games_found.get(game)
+                game_playlists = existing_game.playlists
+                current_disc_number = disc_number
+                logger.debug('--Disc Number: %s', current_disc_number)
+                
+                if game == previous_game and file_ext != previous_file_ext and not force_combine_disc_formats:
+                    seperate_disc_formats = True
+                
+                # Make sure to create playlist_file_name using only common matching "Game Info".
+                playlist_file_name = disc_file_name
+                if (previous_playlist_file_name.find(game.name) > -1
+                    and playlist_file_name != previous_playlist_file_name
+                    and current_disc_number > previous_disc_number):
+                        
+                        # A multi-disc game with "Disc Titles" in "Game Info" detected. So changing name of playlist.
+                        current_game_info_list = game_info_list
+                        previous_game_info_list = parseDiscFileStem(previous_playlist_file_name)[GAME_INFO_LIST]
+                        matching_game_info_list = compareTwoGameInfoLists(current_game_info_list, previous_game_info_list)
+                        matching_game_info = ''.join(str(game_info) for game_info in matching_game_info_list)
+                        
+                        playlist_file_name = f'{game.name}{matching_game_info}'
+                        if seperate_disc_formats:
+                            playlist_file_name = f'{playlist_file_name} ({disc_extensions.get(file_ext, [file_ext])[FORMAT_NAME]})'
+                        
+                        playlist_file_path = Path(PurePath().joinpath(root, f'{playlist_file_name}.m3u'))
+                        
+                        previous_playlist_file_path = Path(PurePath().joinpath(root, f'{previous_playlist_file_name}.m3u'))
+                        if existing_game.movePlaylist(previous_playlist_file_path, playlist_file_path):
+                            logger.debug('---Changing Existing Playlist Name From: "%s"', previous_playlist_file_name)
+                            logger.debug('                                     To: "%s"', playlist_file_name)
+                
+                else:
+                    if seperate_disc_formats:
+                        playlist_file_name = f'{playlist_file_name} ({disc_extensions.get(file_ext, [file_ext])[FORMAT_NAME]})'
+                    playlist_file_path = Path(PurePath().joinpath(root, f'{playlist_file_name}.m3u'))
+                
+                # Now that playlist are being seperated, rename previous playlist using previous file extension.
+                if seperate_disc_formats:
+                    previous_playlist_file_name_rename = f'{previous_playlist_file_name} ({disc_extensions.get(previous_file_ext, [previous_file_ext])[FORMAT_NAME]})'
+                    previous_playlist_file_path_rename = Path(PurePath().joinpath(root, f'{previous_playlist_file_name_rename}.m3u'))
+                    previous_playlist_file_path = Path(PurePath().joinpath(root, f'{previous_playlist_file_name}.m3u'))
+                    if (playlist_file_path not in game_playlists
+                        and existing_game.movePlaylist(previous_playlist_file_path, previous_playlist_file_path_rename)):
+                            logger.debug('---Changing Existing Playlist Name From: "%s"', previous_playlist_file_name)
+                            logger.debug('                                     To: "%s"', previous_playlist_file_name_rename)
+                
+                # Check if playlist name has already been added and make sure it uses the same playlist path.
+                existing_playlist = existing_game.getPlaylistNamed(playlist_file_path.name)
+                
+                if existing_playlist:
+                    playlist_file_path = existing_playlist.path
+                    if existing_playlist.addDiscPath(file_path):
+                        logger.debug('---Adding File Path To Existing Playlist Named: "%s"', playlist_file_name)
+                    else:
+                        logger.debug('---File Path Already In Existing Playlist Named: "%s"', playlist_file_name)
+                        
+                        # Now check to see if a playlist had a name change (a Disc Title removed) and was re-added.
+                        # If so now remove that playlist... again.
+                        if previous_game == game and previous_playlist_file_name != playlist_file_name:
+                            previous_playlist_file_path = Path(PurePath().joinpath(
+                                root, f'{previous_playlist_file_name}.m3u'
+                            ))
+                            if (previous_playlist_file_path in game_playlists
+                                and current_disc_number > previous_disc_number
+                                and file_ext == previous_file_ext): # not seperate_disc_formats?
+                                    logger.debug('---Deleting Playlist: "%s"', previous_playlist_file_path)
+                                    existing_game.removePlaylist(previous_playlist_file_path)
+                                    playlist_count -= 1
+                
+                else:
+                    existing_game.addPlaylist(playlist_file_path, [file_path])
+                    logger.debug('---Adding File Path To New Playlist Named: "%s"', playlist_file_name)
+                    playlist_count += 1
+            
+            else: # New Game Found
+                current_disc_number = disc_number
+                logger.debug('--Disc Number: %s', current_disc_number)
+                
+                playlist_file_name = disc_file_name
+                previous_playlist_file_name = playlist_file_name
+                logger.debug('---Adding File Path To New Playlist Named: "%s"', playlist_file_name)
+                playlist_file_path = Path(PurePath().joinpath(root, f'{playlist_file_name}.m3u'))
+                
+                new_game = multi_disc_games_found.addGame(game, MULTI_DISC)
+                new_game.addPlaylist(playlist_file_path, [file_path])
+                playlist_count += 1
+            
+            previous_game = game
+            previous_disc_number = current_disc_number
+            previous_playlist_file_name = playlist_file_name
+            previous_file_ext = file_ext
+        
+        # Each "Game Title" is checked once all discs in the directory are grouped, in name order, so
+        # the order the files were found in doesn't matter.
+        if possible_compilation_disc_names:
+            with timePhase(run_stats, 'compilation_check'):
+                for game_title in sorted(possible_compilation_disc_names):
+                    compilation_file_names = possible_compilation_disc_names[game_title]
+                    if len(compilation_file_names) > 1:
+                        multi_disc_games_found, playlist_count = checkForCompilationGame(
+                            multi_disc_games_found, Path(PurePath().joinpath(root, game_title)),
+                            [Path(PurePath().joinpath(root, file)) for file in sorted(compilation_file_names)],
+                            playlist_count
+                        )
+
+    # Final multi-disc game checks and fixes.
+    with timePhase(run_stats, 'dupe_merge'):
+        multi_disc_games_found, playlist_count = checkForDupeGames(multi_disc_games_found, playlist_count)
+    multi_disc_games_found, playlist_count = checkForSingleDiscPlaylists(multi_disc_games_found, playlist_count)
+    
+    endPhase(run_stats)
+    run_stats.names_parsed += max(0, parseDiscFileStem.cache_info().misses - names_parsed)
+    
+    files_skipped = run_stats.files_skipped - files_skipped
+    progress.update(dir_count, disc_file_count + files_skipped, len(multi_disc_games_found), final=True)
+    if files_skipped:
+        logger.info('\nFiles Skipped (Not Disc Images): %s', files_skipped)
+    
+    saveScanCache()
+    
+    return multi_disc_games_found, playlist_count
+
+
+### Check for compilation games with disc titles instead of disk numbers.
+###     (multi_disc_games_found) GameLibrary of all multi-disc games and the playlists to be
+###                              created with the paths to each disc.
+###     (possible_compilation_game) The game that was last detected as a possible compilation.
+###     (possible_compilation_disc_paths) A list of compilation disc paths.
+###     (playlist_count) Amount of new playlists to be created.
+###     --> Returns a [GameLibrary] and [Integer]
+def checkForCompilationGame(multi_disc_games_found, possible_compilation_game, possible_compilation_disc_paths, playlist_count):
+    
+    if len(possible_compilation_disc_paths) > 1:
+        all_game_info_list = []
+        matching_game_info_list = []
+        disc_count = len(possible_compilation_disc_paths)
+        disc_paths = []
+        disc_exts = []
+        seperate_disc_formats = False
+        
+        for disc_path in possible_compilation_disc_paths:
+            all_game_info_list.extend(parseDiscFileStem(disc_path.stem)[GAME_INFO_LIST])
+            disc_paths.append(disc_path) # copy
+            if disc_path.suffix not in disc_exts:
+                disc_exts.append(disc_path.suffix)
+        
+        if force_combine_disc_formats:
+            format_count = 1
+        else:
+            format_count = len(disc_exts)
+            if format_count > 1:
+                seperate_disc_formats = True
+                #disc_count /= len(disc_exts)
+        
+        # Get only matching Game Info
+        for gi, gi_count in collections.Counter(all_game_info_list).items():
+            if gi_count >= disc_count / format_count:
+                matching_game_info_list.append(gi)
+        game_info = ''.join(matching_game_info_list)
+        
+        # If there's no matching Game Info then it's very likely this is the same game from different regions.
+        ## TODO: Games with a mixture of different regions, disc titles, and/or different versions will be cought in this.
+        ## TODO: Should there be an option to add all regions to a sigle compilation playlist?
+        if not game_info:
+            return multi_disc_games_found, playlist_count
+        
+        logger.debug('--------------------------------------------------------------------------')
+        logger.debug('-Compilation Game Found: %s', possible_compilation_game.name)
+        logger.debug('--------------------------------------------------------------------------')
+        
+        # Create New Playlist (split if different disc formats)
+        playlists = {}
+        playlist_file_name = f'{possible_compilation_game.name}{game_info}'
+        for path in disc_paths:
+            if seperate_disc_formats:
+                playlist_file_name = f'{possible_compilation_game.name}{game_info} ({disc_extensions.get(path.suffix, [path.suffix])[FORMAT_NAME]})'
+            
+            playlist_file_path = Path(PurePath().joinpath(possible_compilation_game.parent, f'{playlist_file_name}.m3u'))
+            if playlist_file_path in playlists.keys():
+                playlists[playlist_file_path].append(path)
+            else:
+                playlists[playlist_file_path] = [path]
+        
+        file_names = '"\n              "'.join(disc.name for disc in disc_paths)
+        logger.debug('--File Names: "%s"', file_names)
+        if seperate_disc_formats:
+            logger.debug('--Disc Count: %s Discs Per Format', int(disc_count/format_count))
+        else:
+            logger.debug('--Disc Count: %s Discs', disc_count)
+        
+        # Add New Game
+        compilation_game = multi_disc_games_found.get(possible_compilation_game)
+        if not compilation_game:
+            compilation_game = multi_disc_games_found.addGame(possible_compilation_game, COMPILATION)
+        
+        for playlist_path, disc_paths in playlists.items():
+            
+            # Add New Playlist
+            if not compilation_game.getPlaylistNamed(playlist_path.name):
+                playlist_count += 1
+            playlist = compilation_game.addPlaylist(playlist_path)
+            
+            # Add New Disc Paths To Playlist
+            new_disc_paths_added = False
+            for path in disc_paths:
+                if playlist.addDiscPath(path):
+                    new_disc_paths_added = True
+            
+            if new_disc_paths_added:
+                logger.debug('---Adding File Paths To New Playlist Named: "%s"', playlist_path.name)
+            else:
+                logger.debug('---File Paths Already In Existing Playlist Named: "%s"', playlist_path.name)
+                
+        compilation_game.game_type = COMPILATION
+    
+    return multi_disc_games_found, playlist_count
+
+
+### Check for duplicate games found in different directories that should be placed in one
+### compilation playlist.
+###     (multi_disc_games_found) GameLibrary of all multi-disc games and the playlists to be
+###                              created with the paths to each disc.
+###     (playlist_count) Amount of new playlists to be created.
+###     --> Returns a [GameLibrary] and [Integer]
+def checkForDupeGames(multi_disc_games_found, playlist_count):
+    
+    if ignore_compilation_discs:
+        return multi_disc_games_found, playlist_count
+    
+    dupe_games_to_remove = []
+    
+    # Only game names found in more than one directory need to be checked.
+    for same_name_games in multi_disc_games_found.games_by_name.values():
+        if len(same_name_games) < 2: continue
+        
+        # The first game found with a playlist name will hold the combined playlist.
+        playlists_by_name = {}
+        
+        for game_two in same_name_games:
+            for playlist_two in list(game_two.playlists.values()):
+                
+                if playlist_two.path.name not in playlists_by_name:
+                    playlists_by_name[playlist_two.path.name] = (game_two, playlist_two)
+                    continue
+                
+                # If playlist names are the same then this is very likely a compilation game
+                game_one, playlist_one = playlists_by_name[playlist_two.path.name]
+                
+                # Combine playlists, but only paths that are new/different.
+                playlist_one_saved = playlist_one.creation is not None
+                disc_paths_combined = False
+                for disc_path in playlist_two.disc_paths:
+                    if playlist_one.addDiscPath(disc_path):
+                        disc_paths_combined = True
+                
+                # And since two playlist merged into one... Unless the playlist already saved (from
+                # an earlier directory searched) now has new discs, then it has to be saved again.
+                game_two.removePlaylist(playlist_two.path)
+                if game_two not in dupe_games_to_remove:
+                    dupe_games_to_remove.append(game_two)
+                if not (playlist_one_saved and disc_paths_combined):
+                    playlist_count -= 1
+                
+                game_file_paths = '\n              '.join(
+                    [f'"{str(path)}"' for path in playlist_one.disc_paths]
+                )
+                
+                if save_playlists_in_common_directory:
+                    common_root_path = findCommonDirectoryPath(playlist_one.path, playlist_two.path)
+                    compilation_playlist_file_path = Path(PurePath().joinpath(
+                        common_root_path, playlist_one.path.name
+                    ))
+                    game_one.movePlaylist(playlist_one.path, compilation_playlist_file_path)
+                    game_one.game_type = COMPILATION_UP_ONE
+                
+                else:
+                    game_one.game_type = COMPILATION
+                
+                logger.debug('--------------------------------------------------------------------------')
+                logger.debug('-Multi-Disc Game Found To Be Compilation Game: %s', game_one.name)
+                logger.debug('--------------------------------------------------------------------------')
+                #print(f'--File Names: "{game_file_names}"')
+                logger.debug('--File Paths: %s', game_file_paths)
+                if disc_paths_combined:
+                    logger.debug('---Combining Playlists Into One Named: "%s"', playlist_one.path.name)
+                else:
+                    logger.debug('---File Paths Already In Existing Playlist Named: "%s"', playlist_one.path.name)
+    
+    # Only remove games that had all their playlists combined into another game's playlists.
+    for game in dupe_games_to_remove:
+        if not game.playlists:
+            multi_disc_games_found.removeGame(game.path)
+    
+    return multi_disc_games_found, playlist_count
+
+
+### Delete single game playlists that only have one disc. In some cases when searching
+### multiple times and formats are being separated there may be playlists that are re-added
+### with only one disc. So delete them now as they may cause issues later.
+###     (multi_disc_games_found) GameLibrary of all multi-disc games and the playlists to be
+###                              created with the paths to each disc.
+###     (playlist_count) Amount of new playlists to be created.
+###     --> Returns a [GameLibrary] and [Integer]
+def checkForSingleDiscPlaylists(multi_disc_games_found, playlist_count):
+    start_count = playlist_count
+    for game in multi_disc_games_found.gamesInMemory():
+        for playlist_path, playlist in list(game.playlists.items()):
+            
+            if len(playlist.disc_paths) <= 1:
+                if start_count == playlist_count:
+                    logger.debug('--------------------------------------------------------------------------')
+                    logger.debug('-Cleaning Up Single Disc Playlists:')
+                    logger.debug('--------------------------------------------------------------------------')
+                logger.debug('--Game Title: "%s"', game.name)
+                logger.debug('---Deleting Playlist: "%s"', playlist_path)
+                game.removePlaylist(playlist_path)
+                playlist_count -= 1
+    
+    return multi_disc_games_found, playlist_count
+
+
+### Compare two list and return the common items in a new list.
+###     (game_info_list_one) Fist "Game Info" list.
+###     (game_info_list_two) Second "Game Info" list.
+###     --> Returns a [List]
+def compareTwoGameInfoLists(game_info_list_one, game_info_list_two):
+    all_game_info_list = []
+    matching_game_info_list = []
+    
+    for game_info_list in [game_info_list_one,game_info_list_two]:
+        for game_info in game_info_list:
+            # To prevent dupe (extension) in game info when separating playlist when ran 2+ times.
+            ext_in_game_info = game_info.replace('(','').replace(')','').strip()
+            if game_info not in all_game_info_list or ext_in_game_info in disc_extensions.keys():
+                all_game_info_list.append(game_info)
+            else:
+                if game_info not in matching_game_info_list:
+                    matching_game_info_list.append(game_info)
+    
+    return matching_game_info_list
+
+
+### Split a directory path into its parts. Remembered, so the parts of a directory shared by
+### many discs and playlists (and all its parent directories) are only ever split once.
+###     (dir_path) Path string to a directory.
+###     --> Returns a [Tuple] of Strings
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def getDirectoryParts(dir_path):
+    return PurePath(dir_path).parts
+
+
+### Count how many parts two paths have in common from the start.
+###     (parts_one) First Tuple of path parts.
+###     (parts_two) Second Tuple of path parts.
+###     --> Returns an [Integer]
+def countCommonParts(parts_one, parts_two):
+    common_length = 0
+    for part_one, part_two in zip(parts_one, parts_two):
+        if part_one != part_two:
+            break
+        common_length += 1
+    return common_length
+
+
+### Compare two file paths and return the common directory path between them.
+###     (path_one) First Path
+###     (path_two) Second Path
+###     --> Returns a [Path] or [None] if there is no common directory (different drives).
+def findCommonDirectoryPath(path_one, path_two):
+    dir_parts_one = getDirectoryParts(str(path_one.parent))
+    dir_parts_two = getDirectoryParts(str(path_two.parent))
+    common_length = countCommonParts(dir_parts_one, dir_parts_two)
+    
+    if common_length:
+        return Path(*dir_parts_one[:common_length])
+    if not path_one.anchor and not path_two.anchor:
+        return Path('.') # Both relative to the same working directory
+    return None
 
 
 ### If all playlist are to be placed into a single directory, check if the directory
@@ -591,38 +2444,43 @@ def setMultDiscGameType(multi_disc_games_found, game, game_type = MULTI_DISC):
 ###     --> Returns a [Boolean] and [Path]
 def samePlaylistDirectoryCheck(playlist_path):
     if save_all_playlists_in:
-        if Path(save_all_playlists_in).exists():
-            all_playlist_dir = Path(save_all_playlists_in)
-        else: # possible relative path?
-            all_playlist_dir = Path(PurePath.joinpath(Path(__file__).parent, save_all_playlists_in))
-        if all_playlist_dir.exists():
+        all_playlist_dir = getAllPlaylistsDirectory(save_all_playlists_in)
+        if all_playlist_dir:
             playlist_path = Path(PurePath.joinpath(all_playlist_dir, playlist_path.name))
     
     return playlist_path
 
 
-### Return a List of disc file Paths that are relative to it's playlist file Path.
+### Find the directory to save all playlists in, only checked on the drive once.
+###     (all_playlist_dir) The "save_all_playlists_in" setting.
+###     --> Returns a [Path] or None if the directory doesn't exist.
+@functools.lru_cache(maxsize=4)
+def getAllPlaylistsDirectory(all_playlist_dir):
+    if Path(all_playlist_dir).exists():
+        all_playlist_dir = Path(all_playlist_dir)
+    else: # possible relative path?
+        all_playlist_dir = Path(PurePath.joinpath(Path(__file__).parent, all_playlist_dir))
+    if all_playlist_dir.exists():
+        return all_playlist_dir
+    return None
+
+
+### Return a List of disc file Paths that are relative to it's playlist file Path. Discs that
+### have no directory in common with the playlist (on a different drive) keep their absolute path.
 ###     (playlist_path) Path to a playlist file.
 ###     (game_disc_paths) A List of Paths to disc files.
 ###     --> Returns a [List]
 def getRelativeDiscPaths(playlist_path, game_disc_paths):
     relative_disc_paths = []
+    playlist_dir_parts = getDirectoryParts(str(playlist_path.parent))
     
     for disc_path in game_disc_paths:
+        disc_dir_parts = getDirectoryParts(str(disc_path.parent))
+        common_length = countCommonParts(playlist_dir_parts, disc_dir_parts)
         
-        common_root_path = findCommonDirectoryPath(playlist_path, disc_path)
-        if common_root_path:
-            levels_up = len(playlist_path.parts) - len(common_root_path.parts)
-            levels_up_str = ''
-            i, up = 0,1
-            while up < levels_up:
-                levels_up_str += '../'
-                up += 1
-            relative_disc_path = Path(levels_up_str)
-            for disc_part in disc_path.parts:
-                if i >= len(common_root_path.parts) or disc_part != common_root_path.parts[i]:
-                    relative_disc_path = Path(PurePath.joinpath(relative_disc_path, disc_part))
-                i += 1
+        if common_length or (not playlist_path.anchor and not disc_path.anchor):
+            levels_up = ('..',) * (len(playlist_dir_parts) - common_length)
+            relative_disc_path = Path(*levels_up, *disc_dir_parts[common_length:], disc_path.name)
         else: # Can't use relative path, sticking with the absolute disc path
             relative_disc_path = disc_path
         
@@ -632,397 +2490,1339 @@ def getRelativeDiscPaths(playlist_path, game_disc_paths):
 
 
 ### Create playlists for all multi-disc games found.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     --> Returns a [Dictionary]
+###     (multi_disc_games_found) GameLibrary of all multi-disc games and the playlists to be
+###                              created with the paths to each disc.
+###     --> Returns a [GameLibrary]
 def createPlaylists(multi_disc_games_found):
-    playlists_not_overwritten, playlists_not_updated, new_playlists_created = 0,0,0
-    playlists_updated, playlist_save_errors = 0,0
+    run_stats = multi_disc_games_found.stats
+    files_checked = run_stats.files_checked
     playlist_creation = NOT_UPDATED
+    playlist_writes = {} # Playlists waiting to be saved {Path: (Playlist, Bytes)}
+    playlists_handled = [] # (Game, Playlist) in the order they were handled, to be logged
+    startPhase(run_stats, 'create_playlists')
     
-    multi_disc_games_found_copy = multi_disc_games_found.copy()
-    
-    if LOG_DATA not in multi_disc_games_found.keys():
-        multi_disc_games_found[LOG_DATA] = [0,0,0,0,0]
+    logger.info('\n--------------------------------------------------------------------------')
+    logger.info('Now creating M3U Playlists For All Multi-Disc Games Found')
+    logger.info('--------------------------------------------------------------------------\n')
     
-    print('\n--------------------------------------------------------------------------')
-    print('Now creating M3U Playlists For All Multi-Disc Games Found')
-    print('--------------------------------------------------------------------------\n')
-    
-    for game, playlists in multi_disc_games_found_copy.items():
-        if game == LOG_DATA:
-            continue
+    with getIOPool(scan_worker_count) as io_pool:
+        playlist_reads = readExistingPlaylists(multi_disc_games_found, io_pool, run_stats)
         
-        playlist_number = 0
-        force_absolute_paths = False
-        for playlist_path, game_disc_paths in playlists.copy().items():
+        for game in multi_disc_games_found.gamesInMemory():
             
-            if playlist_path != LOG_DATA and len(game_disc_paths) > 1:
-                
-                playlist_number += 1
-                
-                if len(multi_disc_games_found[game][LOG_DATA]) > playlist_number:
-                    continue # This playlist creation already attempted, no need to retry.
+            game_title_printed = False
+            force_absolute_paths = False
+            for playlist_path, playlist in game.playlists.items():
                 
-                if playlist_number == 1:
-                    print('--------------------------------------------------------------------------')
-                    if multi_disc_games_found[game].get(LOG_DATA, [[MULTI_DISC]][GAME_TYPE])[GAME_INFO][GAME_TYPE] > MULTI_DISC:
-                        print(f'-Compilation Game Title: {game.name}')
-                    else:
-                        print(f'-Multi-Disc Game Title: {game.name}')
-                    print('--------------------------------------------------------------------------')
-                
-                org_playlist_path = playlist_path
-                playlist_path = samePlaylistDirectoryCheck(playlist_path)
-                print(f'--Playlist Path: {playlist_path}')
-                
-                game_disc_paths_removed = []
-                
-                if Path.exists(playlist_path) and overwrite_playlists:
+                if len(playlist.disc_paths) > 1:
+                    
+                    if playlist.creation is not None:
+                        continue # This playlist creation already attempted, no need to retry.
+                    
+                    if not game_title_printed:
+                        game_title_printed = True
+                        logger.debug('--------------------------------------------------------------------------')
+                        if game.game_type > MULTI_DISC:
+                            logger.debug('-Compilation Game Title: %s', game.name)
+                        else:
+                            logger.debug('-Multi-Disc Game Title: %s', game.name)
+                        logger.debug('--------------------------------------------------------------------------')
+                    
+                    game_disc_paths = playlist.disc_paths
+                    playlist_path = samePlaylistDirectoryCheck(playlist_path)
+                    logger.debug('--Playlist Path: %s', playlist_path)
                     
-                    ## TODO: Record removed disc paths to show in log?
+                    # Another game's playlist is waiting to be saved to this same path, save it first.
+                    if playlist_path in playlist_writes:
+                        writePlaylistFiles(playlist_writes, run_stats)
                     
-                    # Read existing playlist file and get the disc paths.
-                    existing_playlist_discs = playlist_path.read_text().split('\n')
+                    game_disc_paths_removed = []
+                    existing_playlist_bytes = None
+                    playlist_read = playlist_reads.pop(playlist_path, None)
+                    if playlist_read is not None: # Already being read
+                        with timePhase(run_stats, 'read_playlists'):
+                            existing_playlist_bytes = playlist_read.result()
+                        playlist_exists = existing_playlist_bytes is not None
+                    else:
+                        playlist_exists = pathExists(playlist_path, run_stats)
                     
-                    # Create absolute disc paths of the strings
-                    existing_playlist_disc_paths = []
-                    existing_relative_disc_paths_found = False
-                    for existing_disc in existing_playlist_discs:
+                    if playlist_exists and overwrite_playlists:
                         
-                        existing_disc_path = Path(existing_disc)
-                        if PurePath.is_absolute(existing_disc_path):
-                            existing_playlist_disc_paths.append(existing_disc_path)
-                            
-                            # Don't update existing playlists if not needed when relative paths are in use, but
-                            # absolute paths are forced because playlist and discs are on different roots/drives.
-                            if playlist_path.parts[0] != existing_disc_path.parts[0]:
-                                force_absolute_paths = True
+                        ## TODO: Record removed disc paths to show in log?
                         
-                        else:
-                            existing_relative_disc_paths_found = True
-                            if existing_disc_path.parts[0] == '..':
-                                existing_disc_path = Path(PurePath.joinpath(playlist_path.parent, existing_disc_path)).resolve()
+                        # Read existing playlist file and get the disc paths.
+                        if existing_playlist_bytes is None:
+                            with timePhase(run_stats, 'read_playlists'):
+                                existing_playlist_bytes = playlist_path.read_bytes()
+                        run_stats.playlists_read += 1
+                        existing_playlist_discs = existing_playlist_bytes.decode('utf-8', errors='replace').splitlines()
+                        
+                        # Create absolute disc paths of the strings
+                        existing_playlist_disc_paths = []
+                        existing_relative_disc_paths_found = False
+                        for existing_disc in existing_playlist_discs:
+                            
+                            existing_disc_path = Path(existing_disc)
+                            if PurePath.is_absolute(existing_disc_path):
+                                existing_playlist_disc_paths.append(existing_disc_path)
+                                
+                                # Don't update existing playlists if not needed when relative paths are in use, but
+                                # absolute paths are forced because playlist and discs are on different roots/drives.
+                                if playlist_path.parts[0] != existing_disc_path.parts[0]:
+                                    force_absolute_paths = True
+                            
                             else:
-                                levels_up = len(existing_disc_path.parts)-1
-                                existing_disc_path = Path(PurePath.joinpath(game.parents[levels_up], existing_disc_path))
-                            existing_playlist_disc_paths.append(existing_disc_path)
-                    
-                    # Check if any new disc paths are to be added to already existing playlist.
-                    new_playlist_disc_paths = []
-                    for disc_path in game_disc_paths:
-                        if disc_path not in existing_playlist_disc_paths:
-                            new_playlist_disc_paths.append(disc_path)
-                    
-                    # Only overwrite/update a playlist if there are new disc paths to add.
-                    ## TODO: check all playlist later for disc paths that no longer exists and remove them.
-                    ##       Delete playlist if all paths no long exists, user option?
-                    if new_playlist_disc_paths:
+                                existing_relative_disc_paths_found = True
+                                if existing_disc_path.parts[0] == '..':
+                                    existing_disc_path = Path(os.path.abspath(PurePath.joinpath(playlist_path.parent, existing_disc_path)))
+                                else:
+                                    levels_up = len(existing_disc_path.parts)-1
+                                    existing_disc_path = Path(PurePath.joinpath(game.path.parents[levels_up], existing_disc_path))
+                                existing_playlist_disc_paths.append(existing_disc_path)
                         
-                        existing_playlist_disc_paths.extend(new_playlist_disc_paths)
-                        if not keep_existing_playlist_disc_order:
-                            existing_playlist_disc_paths.sort() ## TODO: discs after 9 will not order correctly 1, 10, 2,... custom sorter?
+                        # Check if any new disc paths are to be added to already existing playlist.
+                        new_playlist_disc_paths = []
+                        for disc_path in game_disc_paths:
+                            if disc_path not in existing_playlist_disc_paths:
+                                new_playlist_disc_paths.append(disc_path)
                         
-                        game_disc_paths = []
-                        for existing_disc_path in existing_playlist_disc_paths:
-                            if Path.exists(existing_disc_path):
-                                game_disc_paths.append(existing_disc_path)
-                            else:
-                                if existing_relative_disc_paths_found:
-                                    # Add the relative string path instead (lists won't line up if sorted, so must use "find")
-                                    for existing_disc_str in existing_playlist_discs:
-                                        if existing_disc_str.find(existing_disc_path.name) > -1:
-                                            break
-                                    game_disc_paths_removed.append(existing_disc_str)
+                        # Only overwrite/update a playlist if there are new disc paths to add.
+                        ## TODO: check all playlist later for disc paths that no longer exists and remove them.
+                        ##       Delete playlist if all paths no long exists, user option?
+                        if new_playlist_disc_paths:
+                            
+                            existing_playlist_disc_paths.extend(new_playlist_disc_paths)
+                            if not keep_existing_playlist_disc_order:
+                                existing_playlist_disc_paths.sort() ## TODO: discs after 9 will not order correctly 1, 10, 2,... custom sorter?
+                            
+                            game_disc_paths = []
+                            for existing_disc_path in existing_playlist_disc_paths:
+                                if pathExists(existing_disc_path, run_stats):
+                                    game_disc_paths.append(existing_disc_path)
                                 else:
-                                    game_disc_paths_removed.append(existing_disc_path)
+                                    if existing_relative_disc_paths_found:
+                                        # Add the relative string path instead (lists won't line up if sorted, so must use "find")
+                                        for existing_disc_str in existing_playlist_discs:
+                                            if existing_disc_str.find(existing_disc_path.name) > -1:
+                                                break
+                                        game_disc_paths_removed.append(existing_disc_str)
+                                    else:
+                                        game_disc_paths_removed.append(existing_disc_path)
+                            
+                            playlist.disc_paths = game_disc_paths # Updated
+                            
+                            run_stats.updated += 1
+                            playlist_creation = UPDATED
                         
-                        multi_disc_games_found[game][org_playlist_path] = game_disc_paths # Updated
+                        # Disc paths are changeing from relative to absolute
+                        elif existing_relative_disc_paths_found and not use_relative_paths and not force_absolute_paths:
+                            run_stats.updated += 1
+                            playlist_creation = UPDATED
                         
-                        playlists_updated += 1
-                        playlist_creation = UPDATED
-                    
-                    # Disc paths are changeing from relative to absolute
-                    elif existing_relative_disc_paths_found and not use_relative_paths and not force_absolute_paths:
-                        playlists_updated += 1
-                        playlist_creation = UPDATED
+                        # Disc paths are changeing from absolute to relative
+                        elif not existing_relative_disc_paths_found and use_relative_paths and not force_absolute_paths:
+                            run_stats.updated += 1
+                            playlist_creation = UPDATED
+                        
+                        # Nothing new to add to playlist, so no need to overwrite.
+                        else:
+                            run_stats.not_updated += 1
+                            playlist_creation = NOT_UPDATED
                     
-                    # Disc paths are changeing from absolute to relative
-                    elif not existing_relative_disc_paths_found and use_relative_paths and not force_absolute_paths:
-                        playlists_updated += 1
-                        playlist_creation = UPDATED
+                    elif playlist_exists and not overwrite_playlists:
+                        run_stats.not_overwritten += 1
+                        playlist_creation = NOT_OVERWRITTEN
                     
-                    # Nothing new to add to playlist, so no need to overwrite.
                     else:
-                        playlists_not_updated += 1
-                        playlist_creation = NOT_UPDATED
-                
-                elif Path.exists(playlist_path) and not overwrite_playlists:
-                    playlists_not_overwritten += 1
-                    playlist_creation = NOT_OVERWRITTEN
-                
-                else:
-                    new_playlists_created += 1
-                    playlist_creation = SAVED
-                
-                # Get relative disc paths if needed
-                if use_relative_paths and not force_absolute_paths:
-                    relative_disc_paths = getRelativeDiscPaths(playlist_path, game_disc_paths)
-                
-                disc_number = 0
-                for disc_path in game_disc_paths:
-                    disc_number += 1
+                        run_stats.saved += 1
+                        playlist_creation = SAVED
                     
-                    # Second check to force absolute paths
-                    force_absolute_paths = False if playlist_path.parts[0] == disc_path.parts[0] else True
+                    # Get relative disc paths if needed, these are the paths saved in the playlist file.
+                    if use_relative_paths:
+                        output_disc_paths = getRelativeDiscPaths(playlist_path, game_disc_paths)
+                    else:
+                        output_disc_paths = game_disc_paths
+                    playlist.output_path = playlist_path
+                    playlist.output_disc_paths = output_disc_paths
                     
-                    if use_relative_paths and not force_absolute_paths:
+                    disc_number = 0
+                    for disc_path, output_disc_path in zip(game_disc_paths, output_disc_paths):
+                        disc_number += 1
                         
-                        print(f'---Disc #{disc_number} Relative Path: {relative_disc_paths[disc_number-1]}')
-                        '''
-                        elif multi_disc_games_found[game][LOG_DATA][GAME_INFO][GAME_TYPE] == COMPILATION_UP_ONE:
-                            relative_disc_path = Path(PurePath().joinpath(disc_path.parts[-2],
-                                                                          disc_path.parts[-1]))
-                            print(f'---Disc #{disc_number} Relative Path: {relative_disc_path}')
-                            input('COMPILATION_UP_ONE')
+                        if output_disc_path is not disc_path:
+                            logger.debug('---Disc #%s Relative Path: %s', disc_number, output_disc_path)
                         else:
-                            print(f'---Disc #{disc_number} Relative Path: {disc_path.name}')'''
-                    else:
-                        print(f'---Disc #{disc_number} Path: {disc_path}')
-                
-                for removed_disc_path in game_disc_paths_removed:
-                    if existing_relative_disc_paths_found:
-                        if str(removed_disc_path) in existing_playlist_discs:
-                            print(f'---Relative Disc Path REMOVED: {removed_disc_path}')
-                        else:
-                            print(f'---Relative Disc Path REMOVED: {removed_disc_path.name}')
-                    else:
-                        print(f'---Disc Path REMOVED: {removed_disc_path}')
-                
-                if playlist_creation > NOT_UPDATED:
+                            logger.debug('---Disc #%s Path: %s', disc_number, disc_path)
                     
-                    try: # Writing the disc path to the playlist file.
-                        if use_relative_paths and not force_absolute_paths:
-                            
-                            playlist_path.write_text('\n'.join([str(path) for path in relative_disc_paths]),
-                                                     encoding='utf-8', errors='strict', newline=None)
-                            '''
-                            elif multi_disc_games_found[game][LOG_DATA][GAME_INFO][GAME_TYPE] == COMPILATION_UP_ONE:
-                                relative_disc_paths = []
-                                for disc_path in game_disc_paths:
-                                    relative_disc_paths.append(Path(PurePath().joinpath(disc_path.parts[-2],
-                                                                                        disc_path.parts[-1])))
-                                playlist_path.write_text('\n'.join([str(path) for path in relative_disc_paths]),
-                                                         encoding='utf-8', errors='strict', newline=None)
+                    for removed_disc_path in game_disc_paths_removed:
+                        if existing_relative_disc_paths_found:
+                            if str(removed_disc_path) in existing_playlist_discs:
+                                logger.debug('---Relative Disc Path REMOVED: %s', removed_disc_path)
                             else:
-                                playlist_path.write_text('\n'.join([str(path.name) for path in game_disc_paths]),
-                                                         encoding='utf-8', errors='strict', newline=None)'''
-                        
+                                logger.debug('---Relative Disc Path REMOVED: %s', removed_disc_path.name)
                         else:
-                            playlist_path.write_text('\n'.join([str(path) for path in game_disc_paths]),
-                                                     encoding='utf-8', errors='strict', newline=None)
+                            logger.debug('---Disc Path REMOVED: %s', removed_disc_path)
                     
-                    except Exception as error:
-                        print(f'\nCouldn\'t save playlist file due to {type(error).__name__}: {type(error).__doc__}')
-                        print(f'{error}\n')
-                        if playlist_creation == UPDATED:
-                            playlists_updated -= 1
-                        elif playlist_creation == SAVED:
-                            new_playlists_created -= 1
-                        playlist_save_errors += 1
-                        playlist_creation = f'{type(error).__name__}: {type(error).__doc__}'
-                
-                multi_disc_games_found[game][LOG_DATA].append(playlist_creation)
-                #multi_disc_games_found[game][LOG_DATA][GAME_INFO][GAME_PATH_RELATIVE] = use_relative_paths if not force_absolute_paths else False
+                    if playlist_creation > NOT_UPDATED:
+                        try: # The disc paths as they will be saved in the playlist file.
+                            playlist_bytes = os.linesep.join([str(path) for path in output_disc_paths]).encode('utf-8')
+                        except Exception as error:
+                            playlist_creation = recordPlaylistSaveError(playlist_creation, error, run_stats)
+                        else:
+                            # Nothing would actually change in the existing playlist, so leave it be.
+                            if playlist_bytes == existing_playlist_bytes:
+                                run_stats.updated -= 1
+                                run_stats.not_updated += 1
+                                playlist_creation = NOT_UPDATED
+                            else:
+                                playlist_writes[playlist_path] = (playlist, playlist_bytes)
+                    
+                    playlist.creation = playlist_creation
+                    playlist.existing_bytes = existing_playlist_bytes if playlist_creation == NOT_UPDATED else None
+                    playlists_handled.append((game, playlist))
+        
+        writePlaylistFiles(playlist_writes, run_stats)
+        for playlist_read in playlist_reads.values():
+            playlist_read.cancel()
     
-    multi_disc_games_found[LOG_DATA][NOT_OVERWRITTEN] += playlists_not_overwritten
-    multi_disc_games_found[LOG_DATA][NOT_UPDATED] += playlists_not_updated
-    multi_disc_games_found[LOG_DATA][SAVED] += new_playlists_created
-    multi_disc_games_found[LOG_DATA][UPDATED] += playlists_updated
-    multi_disc_games_found[LOG_DATA][ERROR_NOT_SAVED] += playlist_save_errors
+    if create_log_file:
+        run_log = getRunLog()
+        for game, playlist in playlists_handled:
+            # The text log only lists playlists saved or not saved due to errors.
+            if run_log.file_format == LOG_JSONL or playlist.creation not in (NOT_OVERWRITTEN, NOT_UPDATED):
+                run_log.addPlaylist(game, playlist)
+        run_log.flush()
+    
+    endPhase(run_stats)
+    logger.info('\nFiles Checked On Drive: %s', run_stats.files_checked - files_checked)
     
     return multi_disc_games_found
 
 
-### Create log file for all playlists created.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     (log_file_path) Path of a log file.
-###     --> Returns a [Boolean]
-def createLogFile(multi_disc_games_found, log_file_path = None):
-    log_file_created = False
+### Start reading every existing playlist that may be updated, so they are all read at the same
+### time instead of one after another.
+###     (multi_disc_games_found) GameLibrary of the playlists to be created.
+###     (pool) A pool to read the playlists with (see "getIOPool").
+###     (run_stats) RunStats to count the checks made on the drive.
+###     --> Returns a [Dictionary] of playlist Paths and a Future of the existing playlist's [Bytes]
+###         (None if it doesn't exist).
+def readExistingPlaylists(multi_disc_games_found, pool, run_stats):
+    playlist_reads = {}
+    if not overwrite_playlists:
+        return playlist_reads
+    
+    for game in multi_disc_games_found.gamesInMemory():
+        for playlist_path, playlist in game.playlists.items():
+            if len(playlist.disc_paths) > 1 and playlist.creation is None:
+                playlist_path = samePlaylistDirectoryCheck(playlist_path)
+                if playlist_path in playlist_reads:
+                    continue
+                exists = isListedPath(os.path.abspath(playlist_path))
+                if exists is None:
+                    run_stats.files_checked += 1 # Read instead of checking if it exists first
+                if exists is not False:
+                    playlist_reads[playlist_path] = pool.submit(readPlaylistBytes, playlist_path)
+    
+    return playlist_reads
+
+
+### Read a playlist file.
+###     (playlist_path) Path of the playlist file.
+###     --> Returns the file's [Bytes] or None if it doesn't exist.
+def readPlaylistBytes(playlist_path):
+    try:
+        return playlist_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+### Save a playlist file by first writing to a temporary file and then replacing the playlist with it.
+###     (playlist_path) Path of the playlist file.
+###     (playlist_bytes) The Bytes to save in the playlist file.
+###     --> Returns a [None]
+def writePlaylistFile(playlist_path, playlist_bytes):
+    temp_file_path = playlist_path.with_name(f'{playlist_path.name}.tmp')
+    try:
+        temp_file_path.write_bytes(playlist_bytes)
+        os.replace(temp_file_path, playlist_path)
+    except BaseException:
+        try:
+            temp_file_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+### Save all playlists waiting to be saved, "playlist_write_workers" at a time.
+###     (playlist_writes) A Dictionary of playlists waiting to be saved {Path: (Playlist, Bytes)}.
+###                       Will be emptied once all have been saved.
+###     (run_stats) RunStats of the playlists saved.
+###     --> Returns a [None]
+def writePlaylistFiles(playlist_writes, run_stats):
+    if not playlist_writes:
+        return
+    
+    with timePhase(run_stats, 'write_playlists'), \
+         getIOPool(min(playlist_write_workers, len(playlist_writes))) as pool:
+        futures = [ (playlist_path, playlist, pool.submit(writePlaylistFile, playlist_path, playlist_bytes))
+                    for playlist_path, (playlist, playlist_bytes) in playlist_writes.items() ]
+        
+        for playlist_path, playlist, future in futures:
+            error = future.exception()
+            if error is None:
+                updateDirectoryListing(playlist_path)
+                run_stats.playlists_written += 1
+            else:
+                logger.error('\nPlaylist: %s', playlist_path)
+                playlist.creation = recordPlaylistSaveError(playlist.creation, error, run_stats)
+    
+    playlist_writes.clear()
+
+
+### Print why a playlist couldn't be saved and move it from the saved/updated count to the errors.
+###     (playlist_creation) How the playlist was to be saved, SAVED or UPDATED.
+###     (error) The Exception raised.
+###     (run_stats) RunStats of the playlists saved.
+###     --> Returns a [String] error message
+def recordPlaylistSaveError(playlist_creation, error, run_stats):
+    logger.error('\nCouldn\'t save playlist file due to %s: %s', type(error).__name__, type(error).__doc__)
+    logger.error('%s\n', error)
+    if playlist_creation == UPDATED:
+        run_stats.updated -= 1
+    elif playlist_creation == SAVED:
+        run_stats.saved -= 1
+    run_stats.save_errors += 1
+    return f'{type(error).__name__}: {type(error).__doc__}'
+
+
+### Read the disc paths saved in an existing playlist file.
+###     (playlist_path) Path string of a playlist file.
+###     --> Returns a [List] of each line in the playlist and the absolute path String of the disc
+###         (see "parsePlaylistEntries"), or [None] if the playlist couldn't be read.
+def readPlaylistEntries(playlist_path):
+    try:
+        playlist_bytes = Path(playlist_path).read_bytes()
+    except OSError:
+        return None
+    return parsePlaylistEntries(playlist_path, playlist_bytes)
+
+
+### Get the disc paths saved in a playlist. Only lines ending with a disc extension are disc
+### paths, anything else (URLs, music files, etc) is left as it is.
+###     (playlist_path) Path string of the playlist file.
+###     (playlist_bytes) The Bytes of the playlist file.
+###     --> Returns a [List] of each line in the playlist and the absolute path String of the disc
+###         (None if the line isn't a disc path).
+def parsePlaylistEntries(playlist_path, playlist_bytes):
+    playlist_dir_path = os.path.dirname(playlist_path)
+    playlist_entries = []
+    for line in playlist_bytes.decode('utf-8', errors='surrogateescape').splitlines():
+        entry = line.strip()
+        if (not entry or entry.startswith('#') # Blank or extended M3U info
+            or '://' in entry or not isSearchableDiscFile(entry)):
+                playlist_entries.append((line, None))
+        else: # Relative disc paths are relative to the playlist's directory
+            playlist_entries.append((line, os.path.abspath(os.path.join(playlist_dir_path, entry))))
     
-    if type(multi_disc_games_found) == dict and multi_disc_games_found.get(LOG_DATA):
-        playlists_not_overwritten = multi_disc_games_found[LOG_DATA][NOT_OVERWRITTEN]
-        playlists_not_updated = multi_disc_games_found[LOG_DATA][NOT_UPDATED]
-        new_playlists_created = multi_disc_games_found[LOG_DATA][SAVED]
-        playlists_updated = multi_disc_games_found[LOG_DATA][UPDATED]
-        playlist_save_errors = multi_disc_games_found[LOG_DATA][ERROR_NOT_SAVED]
+    return playlist_entries
+
+
+### Get the disc image and playlist file names in a directory not already searched this run.
+###     (dir_path) Absolute path string to a directory.
+###     --> Returns a [Set] of file names (empty if the directory doesn't exist), or [None] if the
+###         directory couldn't be read.
+def listDirectory(dir_path):
+    try:
+        with os.scandir(dir_path) as entries:
+            return set(entry.name for entry in entries
+                       if isSearchableDiscFile(entry.name) or isPlaylistFile(entry.name))
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+    except OSError:
+        return None
+
+
+### Save an existing playlist again with only the lines given, or delete it if nothing is left.
+###     (playlist_path) Path string of a playlist file.
+###     (playlist_lines) A List of lines to save in the playlist, None to delete it.
+###     --> Returns a [None]
+def repairPlaylistFile(playlist_path, playlist_lines):
+    if playlist_lines is None:
+        os.remove(playlist_path)
     else:
-        print('\nNo playlist log data found.')
+        writePlaylistFile(Path(playlist_path), os.linesep.join(playlist_lines).encode('utf-8', errors='surrogateescape'))
+    return None
+
+
+### Check every existing playlist in the directories searched (and "save_all_playlists_in") for
+### disc paths that no longer link to an existing file and remove them. Playlists left without
+### any disc paths or other entries are deleted. Playlists are read, directories not searched
+### are listed and playlists are saved "scan_worker_count" at a time. Directories already
+### searched and playlists already read this run are never looked at again.
+###     (dir_paths) A List of root directory paths searched.
+###     (multi_disc_games_found) GameLibrary to record the playlists changed in.
+###     (include_all_playlists_dir) Also check the playlists in "save_all_playlists_in".
+###     --> Returns a [GameLibrary]
+def verifyPlaylists(dir_paths, multi_disc_games_found, include_all_playlists_dir = True):
+    run_stats = multi_disc_games_found.stats
+    files_checked = run_stats.files_checked
+    startPhase(run_stats, 'verify')
+    
+    playlist_dir_paths = [os.path.abspath(dir_path) for dir_path in dir_paths]
+    if save_all_playlists_in and include_all_playlists_dir:
+        all_playlists_dir_path = os.path.abspath(save_all_playlists_in)
+        playlist_dir_paths.append(all_playlists_dir_path)
+        if all_playlists_dir_path not in directory_listings:
+            file_names = listDirectory(all_playlists_dir_path)
+            if file_names is not None:
+                directory_listings[all_playlists_dir_path] = file_names
+    
+    # Playlists just saved this run only have disc paths that were found, so no need to check them
+    # again. Playlists that didn't need updating may still have disc paths that no longer exist.
+    playlists_saved = set(
+        os.path.abspath(playlist.output_path)
+        for game in multi_disc_games_found.allGames() for playlist in game.playlists.values()
+        if playlist.output_path and playlist.creation in (SAVED, UPDATED)
+    )
+    
+    playlist_paths = sorted(set(
+        os.path.join(dir_path, file_name)
+        for dir_path, file_names in directory_listings.items()
+        if any(isInRootDirectory(dir_path, root_path) for root_path in playlist_dir_paths)
+        for file_name in file_names if isPlaylistFile(file_name)
+    ).difference(playlists_saved))
+    
+    # Playlists left as they were have already been read while being created, so use those bytes.
+    playlists_already_read = {
+        os.path.abspath(playlist.output_path) : playlist.existing_bytes
+        for game in multi_disc_games_found.allGames() for playlist in game.playlists.values()
+        if playlist.existing_bytes is not None
+    }
+    
+    repaired = run_stats.repaired + run_stats.deleted
+    
+    logger.info('\n--------------------------------------------------------------------------')
+    logger.info('Now Verifying %s Existing Playlists For Missing Discs', len(playlist_paths))
+    logger.info('--------------------------------------------------------------------------\n')
+    
+    unreadable_dir_paths = set()
+    with getIOPool(scan_worker_count) as pool:
+        
+        playlist_paths_to_read = [path for path in playlist_paths if path not in playlists_already_read]
+        playlist_reads = dict(zip(playlist_paths_to_read, pool.map(readPlaylistEntries, playlist_paths_to_read)))
+        run_stats.playlists_read += sum(1 for playlist_entries in playlist_reads.values() if playlist_entries is not None)
+        all_playlist_entries = [
+            playlist_reads[playlist_path] if playlist_path in playlist_reads
+            else parsePlaylistEntries(playlist_path, playlists_already_read[playlist_path])
+            for playlist_path in playlist_paths
+        ]
+        
+        # List every directory with discs in it that wasn't searched, one look per directory
+        # instead of one per disc.
+        unlisted_dir_paths = sorted(set(
+            os.path.dirname(disc_path)
+            for playlist_entries in all_playlist_entries if playlist_entries
+            for line, disc_path in playlist_entries if disc_path
+        ).difference(directory_listings))
+        for dir_path, file_names in zip(unlisted_dir_paths, pool.map(listDirectory, unlisted_dir_paths)):
+            if file_names is None:
+                unreadable_dir_paths.add(dir_path) # Unknown, so leave those disc paths be
+            else:
+                directory_listings[dir_path] = file_names
+        
+        playlist_repairs = []
+        for playlist_path, playlist_entries in zip(playlist_paths, all_playlist_entries):
+            if playlist_entries is None:
+                continue
+            run_stats.verified += 1
+            
+            playlist_lines = []
+            entries_kept = 0
+            disc_paths_removed = []
+            for line, disc_path in playlist_entries:
+                if (disc_path is None or os.path.dirname(disc_path) in unreadable_dir_paths
+                    or pathExists(disc_path, run_stats)):
+                        playlist_lines.append(line)
+                        entries_kept += 1 if line.strip() and not line.lstrip().startswith('#') else 0
+                else:
+                    disc_paths_removed.append(line)
+            
+            # Playlists without any disc paths are never changed.
+            if disc_paths_removed:
+                if not entries_kept:
+                    playlist_lines = None
+                playlist_repairs.append((playlist_path, playlist_lines, disc_paths_removed,
+                                         pool.submit(repairPlaylistFile, playlist_path, playlist_lines)))
+        
+        for playlist_path, playlist_lines, disc_paths_removed, playlist_repair in playlist_repairs:
+            logger.debug('--Playlist Path: %s', playlist_path)
+            for disc_path_removed in disc_paths_removed:
+                logger.debug('---Disc Path REMOVED: %s', disc_path_removed)
+            
+            error = playlist_repair.exception()
+            if error:
+                logger.error('\nCouldn\'t save playlist file due to %s: %s', type(error).__name__, type(error).__doc__)
+                logger.error('%s\n', error)
+                run_stats.save_errors += 1
+                playlist_repair = f'{type(error).__name__}: {type(error).__doc__}'
+            elif playlist_lines is None:
+                logger.debug('---Deleted Playlist (No Existing Disc Paths Left)')
+                updateDirectoryListing(playlist_path, exists=False)
+                run_stats.deleted += 1
+                playlist_repair = 'deleted'
+            else:
+                run_stats.repaired += 1
+                playlist_repair = 'repaired'
+            
+            if create_log_file:
+                getRunLog().addVerifiedPlaylist(playlist_path, disc_paths_removed, playlist_repair)
+    
+    if create_log_file and playlist_repairs:
+        getRunLog().flush()
+    
+    run_stats.playlists_written += run_stats.repaired + run_stats.deleted - repaired
+    endPhase(run_stats)
+    
+    logger.info('\nPlaylists Verified: %s', run_stats.verified)
+    logger.info('Files Checked On Drive: %s', run_stats.files_checked - files_checked)
+    
+    return multi_disc_games_found
+
+
+### The log file of a run. Records are added as each playlist is saved (or not) and written
+### straight to the log file, in either the text or JSON Lines "log_file_format".
+###     (path) Path of the log file.
+###     (file_format) LOG_TEXT or LOG_JSONL
+class RunLog:
+    __slots__ = ('path', 'file_format', 'file', 'last_game_path', 'error')
+    
+    def __init__(self, path, file_format = None):
+        self.path = Path(path)
+        self.file_format = file_format or log_file_format
+        self.file = None # Opened (and any old log file overwritten) once the first record is added
+        self.last_game_path = None
+        self.error = None
+    
+    ### Start a new log file.
+    ###     --> Returns a [None]
+    def open(self):
+        self.file = self.path.open('w', encoding='utf-8', errors='backslashreplace', newline=None)
+        self.last_game_path = None
+        if self.file_format != LOG_JSONL:
+            self.file.write('===================================\n'
+                            '= Auto M3U Playlist Generator Log =\n'
+                            '===================================\n')
+        return None
+    
+    ### Rename the log file (and older log files) to make room for a new log file.
+    ###     --> Returns a [None]
+    def rotate(self):
+        self.file.close()
+        path = os.fspath(self.path)
+        if log_file_backup_count > 0:
+            for backup_number in range(log_file_backup_count - 1, 0, -1):
+                if os.path.exists(f'{path}.{backup_number}'):
+                    os.replace(f'{path}.{backup_number}', f'{path}.{backup_number + 1}')
+            os.replace(path, f'{path}.1')
+        self.open()
+        return None
+    
+    ### Write a record to the log file.
+    ###     (record) A Dictionary saved as one JSON line.
+    ###     (text_lines) A List of lines saved instead in the text format.
+    ###     --> Returns a [None]
+    def write(self, record, text_lines):
+        if self.error:
+            return None
+        try:
+            if self.file is None:
+                self.open()
+            elif log_file_max_size > 0 and self.file.tell() >= log_file_max_size:
+                self.rotate()
+            
+            if self.file_format == LOG_JSONL:
+                record = dict(time=time.strftime('%Y-%m-%dT%H:%M:%S'), **record)
+                self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            else:
+                self.file.write('\n'.join(text_lines) + '\n')
+        
+        except Exception as error:
+            logger.error('\nCouldn\'t save log file due to %s: %s', type(error).__name__, type(error).__doc__)
+            logger.error('%s\n', error)
+            self.error = error
+        return None
+    
+    ### Add a playlist that was attempted to be saved.
+    ###     (game) The Game the playlist belongs to.
+    ###     (playlist) The Playlist.
+    ###     --> Returns a [None]
+    def addPlaylist(self, game, playlist):
+        playlist_creation = ['  << Not Overwritten >>', # NOT_OVERWRITTEN
+                             '  << No New Discs To Add/Remove (Not Updated) >>', # NOT_UPDATED
+                             '  << NEW PLAYLIST >>', # SAVED
+                             '  << New Disc Paths Added/Removed (Updated) >>', # UPDATED
+                             '  << Not Saved Due To'] # ERROR_NOT_SAVED
+        
+        if type(playlist.creation) == int:
+            outcome, error = PLAYLIST_CREATION_NAMES[playlist.creation], None
+            save_info = playlist_creation[playlist.creation]
+        else: # Error
+            outcome, error = 'error', playlist.creation
+            save_info = f'{playlist_creation[ERROR_NOT_SAVED]} {playlist.creation} >>'
+        
+        # The playlist and disc paths as they were saved
+        text_lines = []
+        if game.path != self.last_game_path:
+            self.last_game_path = game.path
+            text_lines.append(f'\n-{GAME_TYPE_TITLES.get(game.game_type, GAME_TYPE_TITLES[UNKNOWN])}: {game.name}')
+        text_lines.append(f'--Playlist Path: {playlist.output_path}')
+        text_lines.append(f'---File Contents Below:{save_info}')
+        for output_disc_path in playlist.output_disc_paths:
+            text_lines.append(f'   {output_disc_path}')
+        
+        self.write({ 'record' : 'playlist',
+                     'game' : game.name,
+                     'game_type' : GAME_TYPE_NAMES.get(game.game_type, GAME_TYPE_NAMES[UNKNOWN]),
+                     'playlist' : str(playlist.output_path),
+                     'outcome' : outcome,
+                     'error' : error,
+                     'discs' : [str(path) for path in playlist.output_disc_paths] }, text_lines)
+        return None
+    
+    ### Add an existing playlist that had disc paths removed (see "verifyPlaylists").
+    ###     (playlist_path) Path string of the playlist.
+    ###     (disc_paths_removed) A List of the disc paths removed, as saved in the playlist.
+    ###     (outcome) 'repaired', 'deleted' or an error message.
+    ###     --> Returns a [None]
+    def addVerifiedPlaylist(self, playlist_path, disc_paths_removed, outcome):
+        self.last_game_path = None
+        text_lines = [f'\n--Existing Playlist Path: {playlist_path}']
+        for disc_path_removed in disc_paths_removed:
+            text_lines.append(f'---Disc Path REMOVED: {disc_path_removed}')
+        if outcome == 'deleted':
+            text_lines.append('---Deleted Playlist (No Existing Disc Paths Left)')
+        elif outcome != 'repaired':
+            text_lines.append(f'---  << Not Saved Due To {outcome} >>')
+        
+        self.write({ 'record' : 'verified_playlist',
+                     'playlist' : playlist_path,
+                     'outcome' : outcome if outcome in ('repaired', 'deleted') else 'error',
+                     'error' : None if outcome in ('repaired', 'deleted') else outcome,
+                     'removed' : disc_paths_removed }, text_lines)
+        return None
+    
+    ### Add a CUE sheet with missing track files (see "checkCueSheets").
+    ###     (cue_sheet_path) Path string of the CUE sheet.
+    ###     (missing_track_names) A List of the missing track file names, as written in the CUE sheet.
+    ###     (excluded) If the CUE sheet was left out of playlists.
+    ###     --> Returns a [None]
+    def addCueSheet(self, cue_sheet_path, missing_track_names, excluded):
+        self.last_game_path = None
+        text_lines = [f'\n--CUE Sheet Missing Track Files: {cue_sheet_path}']
+        for track_name in missing_track_names:
+            text_lines.append(f'---Missing: {track_name}')
+        if excluded:
+            text_lines.append('---  << Left Out Of Playlists >>')
+        
+        self.write({ 'record' : 'cue_sheet',
+                     'cue_sheet' : cue_sheet_path,
+                     'missing' : missing_track_names,
+                     'excluded' : excluded }, text_lines)
+        return None
+    
+    ### Add the totals of a run.
+    ###     (run_stats) RunStats of the run.
+    ###     (text_lines) A List of the totals as printed.
+    ###     --> Returns a [None]
+    def addSummary(self, run_stats, text_lines):
+        self.last_game_path = None
+        record = { 'record' : 'summary' }
+        record.update((stat, getattr(run_stats, stat)) for stat in RunStats.__slots__)
+        self.write(record, ['\n==================================='] + text_lines[3:] + ['==================================='])
+        return None
+    
+    ### Make sure everything added so far is saved to the log file.
+    ###     --> Returns a [None]
+    def flush(self):
+        if self.file and not self.error:
+            self.file.flush()
+        return None
+    
+    ### Close the log file, once nothing more will be added to it.
+    ###     --> Returns a [None]
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+        return None
+
+
+### Get the log of this run, starting it if needed.
+###     (log_file_path) Path of the log file, only used when starting the log.
+###     --> Returns a [RunLog]
+def getRunLog(log_file_path = None):
+    global run_log
+    if run_log is None:
+        if not log_file_path:
+            root_path = Path(__file__).parent
+            log_file_name = f'{Path(__file__).stem}__log.{"jsonl" if log_file_format == LOG_JSONL else "txt"}'
+            log_file_path = Path(PurePath().joinpath(root_path, log_file_name))
+        run_log = RunLog(log_file_path)
+    return run_log
+
+
+### Finish the log file for all playlists created by adding the totals. Each playlist has
+### already been added to the log as it was saved.
+###     (multi_disc_games_found) GameLibrary of all multi-disc games and the playlists to be
+###                              created with the paths to each disc.
+###     (log_file_path) Path of a log file, only used if the log hasn't been started yet.
+###     (show_summary) Print the totals and the time spent in each phase.
+###     --> Returns a [Path] of the log file or [False] if there's no log file.
+def createLogFile(multi_disc_games_found, log_file_path = None, show_summary = True):
+    log_file_created = False
+    
+    if type(multi_disc_games_found) != GameLibrary:
+        if show_summary: print('\nNo playlist log data found.')
         return False
+    run_stats = multi_disc_games_found.stats
     
     # Print general details of playlist creation
     text_lines = []
     text_lines.append('===================================')
     text_lines.append('= Auto M3U Playlist Generator Log =')
     text_lines.append('===================================')
-    text_lines.append(f'- Playlists Newly Created: {new_playlists_created}')
+    text_lines.append(f'- Playlists Newly Created: {run_stats.saved}')
     if overwrite_playlists:
-        text_lines.append(f'- Playlists Updated: {playlists_updated}')
-    if playlists_not_updated:
-        text_lines.append(f'- Playlists Not Updated: {playlists_not_updated}')
-    if playlists_not_overwritten:
-        text_lines.append(f'- Playlists Not Overwritten: {playlists_not_overwritten}')
-    if playlist_save_errors:
-        text_lines.append(f'- Playlist Save Errors: {playlist_save_errors}')
-    
-    print_text_lines = text_lines.copy()
-    print('\n'+'\n'.join(print_text_lines))
-    
-    # Only create a log file when playlists are actually created/overwritten or there are errors.
-    if new_playlists_created + playlists_updated + playlist_save_errors == 0:
+        text_lines.append(f'- Playlists Updated: {run_stats.updated}')
+    if run_stats.not_updated:
+        text_lines.append(f'- Playlists Not Updated: {run_stats.not_updated}')
+    if run_stats.not_overwritten:
+        text_lines.append(f'- Playlists Not Overwritten: {run_stats.not_overwritten}')
+    if run_stats.verified:
+        text_lines.append(f'- Playlists Verified: {run_stats.verified}')
+    if run_stats.repaired:
+        text_lines.append(f'- Playlists With Missing Discs Removed: {run_stats.repaired}')
+    if run_stats.deleted:
+        text_lines.append(f'- Playlists Deleted (No Existing Discs): {run_stats.deleted}')
+    if run_stats.cue_sheets_broken:
+        text_lines.append(f'- CUE Sheets Missing Track Files: {run_stats.cue_sheets_broken}')
+    if run_stats.save_errors:
+        text_lines.append(f'- Playlist Save Errors: {run_stats.save_errors}')
+    
+    phase_summary_lines = getPhaseSummaryLines(run_stats)
+    if show_summary:
+        print('\n'+'\n'.join(text_lines))
+        print('\n'.join(phase_summary_lines))
+    if profile_phases:
+        for profile_file_path in saveProfiles():
+            if show_summary: print(f'--> Profile Saved: {profile_file_path}')
+    
+    # Only create a text log file when playlists are actually created/overwritten or there are errors.
+    if log_file_format != LOG_JSONL and (run_stats.saved + run_stats.updated + run_stats.repaired + run_stats.deleted
+                                         + run_stats.save_errors + run_stats.cue_sheets_broken == 0):
         return False
     
     if create_log_file:
+        run_log = getRunLog(log_file_path)
+        run_log.addSummary(run_stats, text_lines + phase_summary_lines)
+        run_log.flush()
+        if not run_log.error:
+            log_file_created = run_log.path # return log file path
+    
+    elif show_summary:
+        print('Log file creation turned off.')
+    
+    return log_file_created
+
+
+### Open a log file for viewing.
+###     (log_file_path) Path to a log file.
+###     --> Returns a [None]
+def openLogFile(log_file_path):
+    if OpenFile:
+        OpenFile(log_file_path)
+    else:
+        print(f'--> Log File: {log_file_path}')
+    return None
+
+
+### The disc image files found in each directory of the watched directory trees, and the games
+### that were changed in them and are waiting for their playlists to be updated.
+class WatchedDirectories:
+    __slots__ = ('roots', 'disc_files', 'sub_dir_paths', 'dir_mtimes', 'game_dirs', 'pending_games')
+    
+    def __init__(self, roots):
+        self.roots = roots
+        self.disc_files = {} # Directory Path : [Disc image files] (see "parseDiscFileName")
+        self.sub_dir_paths = {} # Directory Path : {Sub-directory paths}
+        self.dir_mtimes = {} # Directory Path : Modified time when searched, or None if it may still be changing
+        self.game_dirs = {} # Game Name : {Directory paths with disc images of the game}
+        self.pending_games = {} # Game Name : [Time of last change, {Directory paths discs were removed from}]
         
-        if not log_file_path:
-            root_path = Path(__file__).parent
-            log_file_name = f'{Path(__file__).stem}__log.txt'
-            log_file_path = Path(PurePath().joinpath(root_path, log_file_name))
-        
-        # Separate by game type
-        multi_disc_games = []
-        compilation_games = []
-        diff_version_games = []
-        #unknown_games = []
-        for game, playlists in multi_disc_games_found.items():
-            if game == LOG_DATA: continue
-            game_log_data = playlists.get(LOG_DATA)
+        for root in roots:
+            for dir_path, disc_files in scanDirectoryTree(root):
+                self.disc_files[dir_path] = disc_files
+                self.sub_dir_paths[dir_path] = set()
+                cached_dir = scan_cache['directories'].get(dir_path)
+                self.dir_mtimes[dir_path] = cached_dir[DIR_MTIME] if cached_dir else None
+                for disc_file in disc_files:
+                    self.game_dirs.setdefault(disc_file[1], set()).add(dir_path)
+        for dir_path in self.disc_files:
+            if dir_path not in roots:
+                self.sub_dir_paths[os.path.dirname(dir_path)].add(dir_path)
+    
+    ### Search a directory again and mark the games with disc images added or removed as changed.
+    ### New sub-directories are searched too and removed ones are forgotten.
+    ###     (dir_path) Path string to a directory already being watched.
+    ###     --> Returns a [None]
+    def searchDirectory(self, dir_path):
+        dir_paths = [dir_path] if dir_path in self.disc_files else []
+        while dir_paths:
+            dir_path = dir_paths.pop()
+            try:
+                dir_stat = os.stat(dir_path)
+                # Same as the scan cache, a directory modified in the last few seconds is searched again.
+                self.dir_mtimes[dir_path] = dir_stat.st_mtime_ns if time.time() - dir_stat.st_mtime > 2 else None
+            except OSError:
+                self.dir_mtimes[dir_path] = None
             
-            for playlist_path, game_disc_paths in playlists.items():
-                if playlist_path == LOG_DATA: continue
-                
-                if game_log_data:
-                    if game_log_data[GAME_INFO][GAME_TYPE] == MULTI_DISC:
-                        if game not in multi_disc_games:
-                            multi_disc_games.append(game)
-                    
-                    elif (game_log_data[GAME_INFO][GAME_TYPE] == COMPILATION
-                       or game_log_data[GAME_INFO][GAME_TYPE] == COMPILATION_UP_ONE):
-                            if game not in compilation_games:
-                                compilation_games.append(game)
-                    
-                    elif game_log_data[GAME_INFO][GAME_TYPE] == DIFF_VERSION:
-                        if game not in diff_version_games:
-                            diff_version_games.append(game)
-        
-        # Print out playlist sorted by game type
-        if multi_disc_games:
-            text_lines.append('\n---------------------------------')
-            text_lines.append('Multi-Disc Game Playlists Created')
-            text_lines.append('---------------------------------')
-        for game in multi_disc_games:
-            text_lines = printGamePlaylistDetails(multi_disc_games_found, game, text_lines)
-        
-        if compilation_games:
-            text_lines.append('\n----------------------------------')
-            text_lines.append('Compilation Game Playlists Created')
-            text_lines.append('----------------------------------')
-        for game in compilation_games:
-            text_lines = printGamePlaylistDetails(multi_disc_games_found, game, text_lines)
+            root, sub_dir_paths, disc_files, files_skipped = scanDirectory(dir_path)
+            self.updateDiscFiles(dir_path, disc_files)
+            
+            sub_dir_paths = set(sub_dir_paths)
+            for sub_dir_path in self.sub_dir_paths[dir_path] - sub_dir_paths:
+                self.forgetDirectory(sub_dir_path)
+            for sub_dir_path in sub_dir_paths - self.sub_dir_paths[dir_path]:
+                self.disc_files[sub_dir_path] = []
+                self.sub_dir_paths[sub_dir_path] = set()
+                dir_paths.append(sub_dir_path)
+            self.sub_dir_paths[dir_path] = sub_dir_paths
+        return None
+    
+    ### Search the directories that were modified since they were last searched.
+    ###     --> Returns a [None]
+    def searchModifiedDirectories(self):
+        for dir_path, dir_mtime in list(self.dir_mtimes.items()):
+            if dir_path not in self.dir_mtimes:
+                continue # Removed with its parent directory
+            try:
+                if os.stat(dir_path).st_mtime_ns == dir_mtime:
+                    continue
+            except OSError:
+                pass
+            self.searchDirectory(dir_path)
+        return None
+    
+    ### Stop watching a removed directory and everything in it.
+    ###     (dir_path) Path string to the directory.
+    ###     --> Returns a [None]
+    def forgetDirectory(self, dir_path):
+        self.updateDiscFiles(dir_path, [])
+        for sub_dir_path in self.sub_dir_paths.pop(dir_path, ()):
+            self.forgetDirectory(sub_dir_path)
+        self.disc_files.pop(dir_path, None)
+        self.dir_mtimes.pop(dir_path, None)
+        return None
+    
+    ### Replace the disc image files found in a directory, marking the games of any disc image
+    ### files added or removed as changed.
+    ###     (dir_path) Path string to the directory.
+    ###     (disc_files) The disc image files now found in the directory.
+    ###     --> Returns a [None]
+    def updateDiscFiles(self, dir_path, disc_files):
+        old_disc_files = { disc_file[0] : disc_file[1] for disc_file in self.disc_files.get(dir_path, ()) }
+        new_disc_files = { disc_file[0] : disc_file[1] for disc_file in disc_files }
+        self.disc_files[dir_path] = disc_files
         
-        if diff_version_games: ## TODO:
-            text_lines.append('\n-----------------------------------------')
-            text_lines.append('Different Game Versions Playlists Created')
-            text_lines.append('-----------------------------------------')
-        for game in diff_version_games:
-            text_lines = printGamePlaylistDetails(multi_disc_games_found, game, text_lines)
+        for file_name in old_disc_files.keys() - new_disc_files.keys():
+            self.markGameChanged(old_disc_files[file_name], dir_path)
+        for file_name in new_disc_files.keys() - old_disc_files.keys():
+            self.markGameChanged(new_disc_files[file_name])
         
-        # Write Log File
-        try:
-            log_file_path.write_text('\n'.join(text_lines), encoding='utf-8', errors='strict', newline=None)
-            log_file_created = log_file_path # return log file path
-        except Exception as error:
-            print(f'\nCouldn\'t save log file due to {type(error).__name__}: {type(error).__doc__}')
-            print(f'{error}\n')
+        old_game_names, new_game_names = set(old_disc_files.values()), set(new_disc_files.values())
+        for game_name in old_game_names - new_game_names:
+            self.game_dirs[game_name].discard(dir_path)
+            if not self.game_dirs[game_name]:
+                del self.game_dirs[game_name]
+        for game_name in new_game_names - old_game_names:
+            self.game_dirs.setdefault(game_name, set()).add(dir_path)
+        return None
     
-    else:
-        print('Log file creation turned off.')
+    ### Mark a game as changed, so its playlists are updated once it stops changing.
+    ###     (game_name) The "Game Title" of the game.
+    ###     (removed_from_dir_path) Path string to a directory a disc image was removed from.
+    ###     --> Returns a [None]
+    def markGameChanged(self, game_name, removed_from_dir_path = None):
+        pending_game = self.pending_games.setdefault(game_name, [0, set()])
+        pending_game[0] = time.monotonic()
+        if removed_from_dir_path:
+            pending_game[1].add(removed_from_dir_path)
+        return None
     
-    return log_file_created
+    ### Get how long until the next changed game is ready to be updated.
+    ###     --> Returns a [Float] of seconds, or [None] if no games have changed
+    def getWaitTime(self):
+        if not self.pending_games:
+            return None
+        last_change_time = min(pending_game[0] for pending_game in self.pending_games.values())
+        return max(0, last_change_time + watch_delay - time.monotonic())
+    
+    ### Take the changed games that haven't changed again for "watch_delay" seconds.
+    ###     --> Returns a [Dictionary] of game names and a [Set] of directory paths discs were removed from
+    def popReadyGames(self):
+        ready_time = time.monotonic() - watch_delay
+        ready_games = { game_name : pending_game[1] for game_name, pending_game in self.pending_games.items()
+                        if pending_game[0] <= ready_time }
+        for game_name in ready_games:
+            del self.pending_games[game_name]
+        return ready_games
+    
+    ### Get the disc image files found in each directory with discs of some games, in the same
+    ### order they were found in.
+    ###     (game_names) The names of the games.
+    ###     (root) Path string to the root directory the directories must be in.
+    ###     --> Returns a [List] of directory path strings and a [List] of disc image files
+    def getGameDiscFileBatches(self, game_names, root):
+        game_dir_paths = set()
+        for game_name in game_names:
+            game_dir_paths.update(self.game_dirs.get(game_name, ()))
+        return [
+            (dir_path, disc_files) for dir_path, disc_files in self.disc_files.items()
+            if dir_path in game_dir_paths and self.getRoot(dir_path) == root
+        ]
+    
+    ### Get the watched root directory a directory is in.
+    ###     (dir_path) Path string to the directory.
+    ###     --> Returns a [String] or [None]
+    def getRoot(self, dir_path):
+        for root in self.roots:
+            if isInRootDirectory(dir_path, root):
+                return root
+        return None
 
 
-### This will print out each playlist a game has for use in the creation of a log file.
-###     (multi_disc_games_found) Dictionary of all multi-disc games and the file paths of
-###                              the playlist to be created with the paths to each disc.
-###     (game) The game to have its playlists printed out.
-###     (text_lines) A list of lines to be printed.
-###     --> Returns a [List]
-def printGamePlaylistDetails(multi_disc_games_found, game, text_lines = []):
-    playlist_creation = ['  << Not Overwritten >>', # NOT_OVERWRITTEN
-                         '  << No New Discs To Add/Remove (Not Updated) >>', # NOT_UPDATED
-                         '  << NEW PLAYLIST >>', # SAVED
-                         '  << New Disc Paths Added/Removed (Updated) >>', # UPDATED
-                         '  << Not Saved Due To'] # ERROR_NOT_SAVED
-    game_log_data = multi_disc_games_found[game].get(LOG_DATA, [[0,False],0,0,0,0,0])
-    
-    playlist_number = 1
-    for playlist_path, game_disc_paths in multi_disc_games_found[game].items():
-        if playlist_path == LOG_DATA: continue
-        
-        # Check if modifications should be made to playlist and disc paths before printing
-        playlist_path = samePlaylistDirectoryCheck(playlist_path)
-        if use_relative_paths:
-            relative_disc_paths = getRelativeDiscPaths(playlist_path, game_disc_paths)
+### Start watching directories for changes using inotify (Linux only).
+###     (dir_paths) A List of directory path strings to watch.
+###     --> Returns a [List] of the inotify file descriptor and a [Dictionary] of watch
+###         descriptors and the directory paths they watch, or [None] if inotify can't be used.
+def startInotifyWatch(dir_paths):
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        inotify_fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if inotify_fd < 0:
+        return None
+    
+    inotify_watch = [inotify_fd, {}, libc]
+    if not addInotifyWatches(inotify_watch, dir_paths):
+        # Most likely the max amount of user watches has been reached, check by polling instead.
+        os.close(inotify_fd)
+        return None
+    
+    return inotify_watch
+
+
+### Add more directories to be watched by inotify.
+###     (inotify_watch) The inotify watch data (see "startInotifyWatch").
+###     (dir_paths) A List of directory path strings to watch.
+###     --> Returns a [Boolean]
+def addInotifyWatches(inotify_watch, dir_paths):
+    inotify_fd, watched_dirs, libc = inotify_watch
+    for dir_path in dir_paths:
+        watch_descriptor = libc.inotify_add_watch(inotify_fd, os.fsencode(dir_path), IN_WATCH_MASK)
+        if watch_descriptor < 0:
+            if ctypes.get_errno() == 28: # ENOSPC
+                return False
+            continue # Directory removed before it could be watched.
+        watched_dirs[watch_descriptor] = dir_path
+    return True
+
+
+### Wait for inotify to have changes to report.
+###     (inotify_watch) The inotify watch data (see "startInotifyWatch").
+###     (timeout) Seconds to wait for a change, or None to wait until something changes.
+###     --> Returns a [Boolean]
+def waitForInotifyChanges(inotify_watch, timeout = None):
+    readable, _, _ = select.select([inotify_watch[0]], [], [], timeout)
+    return bool(readable)
+
+
+### Read the changes to disc images or directories inotify has reported, without waiting.
+###     (inotify_watch) The inotify watch data (see "startInotifyWatch").
+###     --> Returns a [Dictionary] of the changed directory path strings and a [Set] of the disc
+###         image file names changed in each, or [True] if too many changes were made to keep track of.
+def readInotifyChanges(inotify_watch):
+    inotify_fd, watched_dirs, libc = inotify_watch
+    changed_dirs = {}
+    
+    try:
+        data = os.read(inotify_fd, 65536)
+    except BlockingIOError:
+        return changed_dirs
+    
+    offset = 0
+    while offset < len(data):
+        watch_descriptor, mask, cookie, name_length = INOTIFY_EVENT.unpack_from(data, offset)
+        offset += INOTIFY_EVENT.size
+        name = os.fsdecode(data[offset:offset+name_length].rstrip(b'\0'))
+        offset += name_length
         
-        if playlist_number == 1:
-            text_lines.append(f'\n-Game Title: {game.name}')
+        if mask & IN_Q_OVERFLOW:
+            return True
+        if mask & IN_IGNORED:
+            watched_dirs.pop(watch_descriptor, None)
+            continue
         
-        if type(game_log_data[playlist_number]) == int:
-            save_info = playlist_creation[game_log_data[playlist_number]]
-        else: # Error
-            save_info = f'{playlist_creation[ERROR_NOT_SAVED]} {game_log_data[playlist_number]} >>'
+        dir_path = watched_dirs.get(watch_descriptor)
+        if dir_path is None:
+            continue
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            changed_dirs.setdefault(os.path.dirname(dir_path), set())
+        elif mask & IN_ISDIR:
+            changed_dirs.setdefault(dir_path, set())
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                new_dir_path = os.path.join(dir_path, name)
+                addInotifyWatches(inotify_watch, [root for root, sub_dirs, files in os.walk(new_dir_path)])
+        # Ignore everything that isn't a disc image, like the playlists being saved.
+        elif isSearchableDiscFile(name):
+            changed_dirs.setdefault(dir_path, set()).add(name)
+    
+    return changed_dirs
+
+
+### Update the playlists of games that had disc images added, renamed or removed. Only the
+### directories with discs of those games are grouped again.
+###     (watched_dirs) The WatchedDirectories the games were changed in.
+###     (changed_games) Dictionary of the changed game names and a Set of directory paths discs
+###                     were removed from (see "WatchedDirectories.popReadyGames").
+###     --> Returns a [GameLibrary] of the games updated.
+def updateWatchedPlaylists(watched_dirs, changed_games):
+    multi_disc_games_found = GameLibrary()
+    for root in watched_dirs.roots:
+        disc_file_batches = watched_dirs.getGameDiscFileBatches(changed_games, root)
+        if disc_file_batches:
+            multi_disc_games_found, playlist_count = findMultiDiscGames(root, multi_disc_games_found,
+                                                                        disc_file_batches)
+    
+    # Only keep games that were changed. Games identified by a DAT may have a different name than
+    # their disc image files, so also keep games with any disc named after a changed game.
+    games_to_update = GameLibrary()
+    for game in multi_disc_games_found:
+        if game.name in changed_games or any(
+            parseDiscFileName(disc_path.name)[1] in changed_games
+            for playlist in game.playlists.values() for disc_path in playlist.disc_paths):
+                updated_game = games_to_update.addGame(game.path, game.game_type)
+                updated_game.playlists = game.playlists
+                updated_game.playlists_by_name = game.playlists_by_name
+    
+    if games_to_update:
+        games_to_update = createPlaylists(games_to_update)
+    
+    # Removed discs may also be linked in playlists of games that didn't change.
+    removed_from_dir_paths = set().union(*changed_games.values())
+    if removed_from_dir_paths and verify_all_playlists and overwrite_playlists:
+        verify_roots = [root for root in watched_dirs.roots
+                        if any(isInRootDirectory(dir_path, root) for dir_path in removed_from_dir_paths)]
+        games_to_update = verifyPlaylists(verify_roots, games_to_update)
+    
+    return games_to_update
+
+
+### Keep watching directory trees for any changes to disc images and update their playlists.
+### Each game is updated on its own once its disc images stop changing. This will run until
+### stopped (Ctrl+C).
+###     (dir_paths) A List of root directory paths to watch.
+###     --> Returns a [None]
+def watchDirectories(dir_paths):
+    global scan_cache
+    roots = [os.path.abspath(dir_path) for dir_path in dir_paths]
+    
+    # The settings of this script are only used while holding "generator_lock", so other runs can
+    # still be made while waiting for changes.
+    with generator_lock:
         
-        text_lines.append(f'--Playlist Path: {playlist_path}')#{save_info}')
-        playlist_number += 1
+        # Checking for changes relies on the scan cache so that only modified directories are
+        # searched again. It's only kept in memory if it's not being saved.
+        if scan_cache is None:
+            scan_cache = { 'version' : getScanCacheVersion(), 'directories' : {} }
         
-        text_lines.append(f'---File Contents Below:{save_info}')
+        watched_dirs = WatchedDirectories(roots)
+        inotify_watch = startInotifyWatch(list(watched_dirs.disc_files))
+        wait_time = None if inotify_watch else watch_poll_interval
         
-        disc_number = 1
-        while disc_number <= len(game_disc_paths):
+        print('\n--------------------------------------------------------------------------')
+        if inotify_watch:
+            print('Watching Directories For Changes (inotify), Press [Ctrl+C] To Stop:')
+        else:
+            print(f'Watching Directories For Changes (every {watch_poll_interval} seconds), Press [Ctrl+C] To Stop:')
+        print('\n'.join(roots))
+        print('--------------------------------------------------------------------------')
+    
+    try:
+        while True:
             
-            force_absolute_paths = False if playlist_path.parts[0] == game_disc_paths[disc_number-1].parts[0] else True
+            if inotify_watch:
+                waitForInotifyChanges(inotify_watch, wait_time)
+            else:
+                time.sleep(wait_time)
             
-            if use_relative_paths and not force_absolute_paths:# and game_log_data[GAME_INFO][GAME_PATH_RELATIVE]:
-                
-                #text_lines.append(f'---Disc #{disc_number} Relative Path: {relative_disc_paths[disc_number-1]}')
-                text_lines.append(f'   {relative_disc_paths[disc_number-1]}')
-                '''
-                elif game_log_data[GAME_INFO][GAME_TYPE] == COMPILATION_UP_ONE:
-                    relative_disc_path = Path(PurePath().joinpath(game_disc_paths[disc_number-1].parts[-2],
-                                                                  game_disc_paths[disc_number-1].parts[-1]))
-                    text_lines.append(f'---Disc #{disc_number} Relative Path: {relative_disc_path}')
+            with generator_lock:
+                if inotify_watch:
+                    changed_dirs = readInotifyChanges(inotify_watch)
+                    if changed_dirs is True:
+                        changed_dirs = dict.fromkeys(watched_dirs.disc_files, ())
+                    for dir_path, disc_file_names in changed_dirs.items():
+                        watched_dirs.searchDirectory(dir_path)
+                        # Disc images still being written to keep their game from being updated.
+                        for disc_file_name in disc_file_names:
+                            watched_dirs.markGameChanged(parseDiscFileName(disc_file_name)[1])
                 else:
-                    text_lines.append(f'---Disc #{disc_number} Relative Path: {game_disc_paths[disc_number-1].name}')'''
-            else:
-                #text_lines.append(f'---Disc #{disc_number} Path: {game_disc_paths[disc_number-1]}')
-                text_lines.append(f'   {game_disc_paths[disc_number-1]}')
-            disc_number += 1
+                    watched_dirs.searchModifiedDirectories()
+                
+                changed_games = watched_dirs.popReadyGames()
+                if changed_games:
+                    games_updated = updateWatchedPlaylists(watched_dirs, changed_games)
+                    if games_updated or games_updated.stats.verified:
+                        createLogFile(games_updated)
+                
+                wait_time = watched_dirs.getWaitTime()
+                if not inotify_watch:
+                    wait_time = watch_poll_interval if wait_time is None else min(watch_poll_interval, wait_time)
+                    
+    except KeyboardInterrupt:
+        print('\nStopped watching directories.')
+    finally:
+        if inotify_watch:
+            os.close(inotify_watch[0])
     
-    return text_lines
+    return None
 
 
-### Open a log file for viewing.
-###     (log_file_path) Path to a log file.
+### Start getting the disc image files in each root directory ahead of searching them, either
+### from a manifest or by searching them in other processes (see "root_process_count"). Otherwise
+### "findMultiDiscGames" searches each root directory itself.
+###     (dir_paths) A List of Paths to root directories, in the order they're searched.
+###     (run_stats) RunStats to add the amount of files skipped to.
+###     --> Returns an [Iterator] of the disc image files found in each directory of each root
+###         directory, one per root directory, or [None]
+def getRootScans(dir_paths, run_stats):
+    if manifest_file_path:
+        return readManifestRoots(manifest_file_path, dir_paths, run_stats)
+    if root_process_count > 1 and len(dir_paths) > 1:
+        return scanRootDirectories(dir_paths, run_stats)
+    return None
+
+
+### A directory's playlists are done, so only keep what's needed for the directories still to
+### come (see "evict_finished_roots").
+###     (dir_path) Path to a root directory.
+###     (multi_disc_games_found) GameLibrary of all multi-disc games found.
+###     --> Returns a [GameLibrary]
+def evictFinishedDirectory(dir_path, multi_disc_games_found):
+    if verify_all_playlists and overwrite_playlists:
+        multi_disc_games_found = verifyPlaylists([dir_path], multi_disc_games_found,
+                                                 include_all_playlists_dir=False)
+        if not watch_directories:
+            removeDirectoryListings(dir_path)
+    multi_disc_games_found.evictGames()
+    return multi_disc_games_found
+
+
+### Verify the existing playlists in all the directories searched, once all playlists are created.
+###     (dir_paths) A List of root directory paths searched.
+###     (multi_disc_games_found) GameLibrary of all multi-disc games found.
+###     --> Returns a [GameLibrary]
+def verifySearchedDirectories(dir_paths, multi_disc_games_found):
+    if verify_all_playlists and overwrite_playlists and dir_paths:
+        if not evict_finished_roots:
+            multi_disc_games_found = verifyPlaylists(dir_paths, multi_disc_games_found)
+        elif save_all_playlists_in: # Each directory has already been verified
+            multi_disc_games_found = verifyPlaylists([], multi_disc_games_found)
+    return multi_disc_games_found
+
+
+# The settings of a "PlaylistGenerator". Any not given are the same as the settings at the top of
+# this script. It can't be changed once made, use "_replace" to get a changed copy.
+GeneratorConfig = collections.namedtuple('GeneratorConfig', GENERATOR_SETTINGS,
+                                         defaults=[globals()[setting] for setting in GENERATOR_SETTINGS])
+
+
+### Create playlists from another Python program, with its own settings instead of the settings at
+### the top of this script. Nothing is printed or asked, the games found are returned instead.
+### What takes time to set up (compiled patterns, parsed file names, the scan cache, DAT files and
+### hash cache) is kept between runs, so each run after the first only searches the directories
+### that have changed since.
+### Note: Only one run is made at a time, even from different threads, PlaylistGenerators or a
+###       command line run of this script (see "generator_lock"). Other runs wait for it to finish.
+###     (config) GeneratorConfig, None to use the settings at the top of this script.
+###     (log_file_path) Path of the log file of each run (default: next to this script).
+class PlaylistGenerator:
+    __slots__ = ('config', 'log_file_path', 'warm_state')
+    
+    def __init__(self, config = None, log_file_path = None):
+        config = config or GeneratorConfig()
+        # Copied, so changing what was given afterwards doesn't change this generator's settings.
+        self.config = config._replace(
+            disc_extensions={ ext : list(ext_info) for ext, ext_info in config.disc_extensions.items() },
+            dat_file_paths=tuple(config.dat_file_paths)
+        )
+        self.log_file_path = log_file_path
+        self.warm_state = { 'scan_cache' : None, 'dat_index' : {}, 'hash_cache' : None }
+    
+    def __repr__(self):
+        return f'PlaylistGenerator({self.config!r})'
+    
+    ### Swap in this generator's settings and what it kept from its last run, for the length of a run.
+    ### The settings of this script are put back afterwards.
+    @contextlib.contextmanager
+    def useSettings(self):
+        with generator_lock:
+            script_globals = { name : globals()[name] for name in
+                               GENERATOR_SETTINGS + GENERATOR_WARM_STATE + GENERATOR_RUN_STATE + ('show_progress',) }
+            globals().update(self.config._asdict())
+            globals().update(self.warm_state)
+            globals().update(directory_listings={}, cue_sheet_tracks={}, manifest_file_stats={}, run_log=None,
+                             phase_stack=[], phase_profiles={}, phase_memory_snapshots={}, show_progress=False)
+            try:
+                if getPatternSettings() != compiled_pattern_settings:
+                    compileRE()
+                yield self
+            finally:
+                self.warm_state = { name : globals()[name] for name in GENERATOR_WARM_STATE }
+                globals().update(script_globals)
+                if compiled_pattern_settings is not None and getPatternSettings() != compiled_pattern_settings:
+                    compileRE()
+    
+    ### Search directories and save the playlists of all multi-disc games found, the same as running
+    ### this script with "--headless".
+    ###     (dir_paths) A List of Paths to directories.
+    ###     --> Returns a [GameLibrary] of all games found and their playlists, with the totals of the
+    ###         run in "stats". Call "close" on it when done if "evict_finished_roots" is used.
+    def run(self, dir_paths):
+        with self.useSettings():
+            if use_scan_cache and scan_cache is None:
+                loadScanCache()
+            if dat_file_paths and not dat_index:
+                loadDatIndex(dat_file_paths)
+            if dat_file_paths and hash_cache is None:
+                loadHashCache()
+            if create_log_file and self.log_file_path:
+                getRunLog(self.log_file_path)
+            
+            dir_paths = [os.path.abspath(dir_path) for dir_path in dir_paths]
+            multi_disc_games_found = GameLibrary()
+            root_scans = getRootScans(dir_paths, multi_disc_games_found.stats)
+            
+            for dir_path in dir_paths:
+                disc_file_batches = next(root_scans) if root_scans else None
+                multi_disc_games_found, playlist_count = findMultiDiscGames(dir_path, multi_disc_games_found, disc_file_batches)
+                if playlist_count:
+                    multi_disc_games_found = createPlaylists(multi_disc_games_found)
+                if evict_finished_roots:
+                    multi_disc_games_found = evictFinishedDirectory(dir_path, multi_disc_games_found)
+            
+            multi_disc_games_found = verifySearchedDirectories(dir_paths, multi_disc_games_found)
+            createLogFile(multi_disc_games_found, show_summary=False)
+            if run_log:
+                run_log.close()
+        
+        return multi_disc_games_found
+
+
+### Show messages in the console, as much as the "console_output" setting allows.
 ###     --> Returns a [None]
-def openLogFile(log_file_path):
-    OpenFile(log_file_path)
+def setupConsoleOutput():
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(CONSOLE_OUTPUT_LEVELS.get(console_output, logging.WARNING))
     return None
 
 
-### Script Starts Here
-if __name__ == '__main__':
+### Get the command line arguments. Settings are only included if given on the command line.
+###     (argv) A List of argument Strings, defaults to "sys.argv[1:]".
+###     --> Returns an [argparse.Namespace]
+def getArguments(argv = None):
+    parser = argparse.ArgumentParser(
+        description='Automatically create .m3u playlists for all your multi-disc games.',
+        argument_default=argparse.SUPPRESS)
+    parser.add_argument('dir_paths', nargs='*', metavar='DIRECTORY',
+                        help='directories to search (default: the directory of this script)')
+    parser.add_argument('--headless', action='store_true', default=False,
+                        help='run without any prompts and exit when done, for scheduled runs')
+    
+    for setting, setting_help in COMMAND_LINE_SETTINGS.items():
+        option = setting.replace('_', '-')
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument(f'--{option}', dest=setting, action='store_true',
+                           help=f'{setting_help} (default: {globals()[setting]})')
+        group.add_argument(f'--no-{option}', dest=setting, action='store_false')
+    
+    parser.add_argument('--console-output', dest='console_output', choices=tuple(CONSOLE_OUTPUT_LEVELS),
+                        help=f'how much is shown while running (default: {console_output})')
+    parser.add_argument('--check-cue-sheets', dest='check_cue_sheets', choices=CUE_SHEET_CHECKS,
+                        help=f'what to do with CUE sheets missing track files (default: {check_cue_sheets})')
+    parser.add_argument('--profile-phases', dest='profile_phases', choices=(PROFILE_CPROFILE, PROFILE_TRACEMALLOC),
+                        help='profile each phase of the run and save the profiles next to this script')
+    parser.add_argument('--save-all-playlists-in', dest='save_all_playlists_in', metavar='DIRECTORY',
+                        help='save all playlists in this existing directory')
+    parser.add_argument('--manifest', dest='manifest_file_path', metavar='FILE',
+                        help='read the files in each directory from this list instead of searching it, '
+                             f'\'{MANIFEST_STDIN}\' for stdin')
+    parser.add_argument('--scan-worker-count', dest='scan_worker_count', type=int, metavar='N',
+                        help=f'number of directories searched at the same time (default: {scan_worker_count})')
+    parser.add_argument('--root-process-count', dest='root_process_count', type=int, metavar='N',
+                        help=f'number of directories given searched at the same time (default: {root_process_count})')
+    parser.add_argument('--playlist-write-workers', dest='playlist_write_workers', type=int, metavar='N',
+                        help=f'number of playlists saved at the same time (default: {playlist_write_workers})')
+    parser.add_argument('--dat-file', dest='dat_file_paths', type=Path, action='append', metavar='FILE',
+                        help='identify disc images by hash using this Redump/No-Intro DAT file (can be repeated)')
+    parser.add_argument('--hash-process-count', dest='hash_process_count', type=int, metavar='N',
+                        help=f'number of disc images hashed at the same time (default: {hash_process_count})')
+    parser.add_argument('--io-backend', dest='io_backend', choices=(IO_THREADS, IO_ASYNCIO),
+                        help=f'how files are read and written, asyncio for network shares (default: {io_backend})')
+    parser.add_argument('--io-concurrency', dest='io_concurrency', type=int, metavar='N',
+                        help=f'most file calls made at the same time with asyncio (default: {io_concurrency})')
+    parser.add_argument('--log-file', dest='log_file_path', type=Path, metavar='FILE',
+                        help='path of the log file (default: next to this script)')
+    parser.add_argument('--log-file-format', dest='log_file_format', choices=(LOG_TEXT, LOG_JSONL),
+                        help=f'format of the log file (default: {log_file_format})')
+    parser.add_argument('--log-file-max-size', dest='log_file_max_size', type=int, metavar='BYTES',
+                        help='start a new log file once it grows past this size, 0 to never (default: '
+                             f'{log_file_max_size})')
+    
+    return parser.parse_args(argv)
+
+
+### Run this script from the command line. Watching directories starts once everything else is done.
+###     (argv) A List of argument Strings, defaults to "sys.argv[1:]".
+###     --> Returns an [Integer] exit code
+def main(argv = None):
+    # This run changes the settings of this script, so no PlaylistGenerator can run until it's done.
+    with generator_lock:
+        exit_code, watched_dir_paths = runScript(argv)
+    
+    if watched_dir_paths:
+        watchDirectories(watched_dir_paths)
+    
+    return exit_code
+
+
+### Search the directories given on the command line (or asked for) and create their playlists.
+###     (argv) A List of argument Strings, defaults to "sys.argv[1:]".
+###     --> Returns an [Integer] exit code and a [List] of the directory paths to watch (see
+###         "watch_directories").
+def runScript(argv = None):
+    global loop_script
+    
+    arguments = getArguments(argv)
+    headless = arguments.headless
+    log_file_path = getattr(arguments, 'log_file_path', None)
+    
     print(sys.version)
     print('\n=======================================')
     print('Auto M3U Playlist Generator by JDHatten')
@@ -1031,32 +3831,72 @@ if __name__ == '__main__':
     MIN_VERSION_STR = '.'.join([str(n) for n in MIN_VERSION])
     assert sys.version_info >= MIN_VERSION, f'This Script Requires Python v{MIN_VERSION_STR} or Newer'
     
+    # Overwrite the settings at the top of this script with any given on the command line.
+    for setting, value in vars(arguments).items():
+        if setting not in ('dir_paths', 'headless', 'log_file_path'):
+            globals()[setting] = value
+    if manifest_file_path == MANIFEST_STDIN:
+        headless = True # The manifest is read from stdin, so there's no one to answer prompts
+    if headless:
+        loop_script = False
+    
+    if save_all_playlists_in and not Path(save_all_playlists_in).is_dir():
+        print(f'\nThis is not an existing directory path: "{save_all_playlists_in}"')
+        return EXIT_USAGE, []
+    
+    setupConsoleOutput()
     compileRE()
+    if use_scan_cache:
+        loadScanCache()
+    if dat_file_paths:
+        loadDatIndex(dat_file_paths)
+        loadHashCache()
+    if create_log_file and log_file_path:
+        getRunLog(log_file_path) # Start the log file here instead of next to this script
     
-    dir_paths = sys.argv[1:]
+    # Disc paths are saved as found, so search from full paths not paths relative to where this
+    # script was started.
+    dir_paths = [os.path.abspath(dir_path) for dir_path in arguments.dir_paths]
     if not dir_paths:
         dir_paths = [Path(__file__).parent]
     
-    multi_disc_games_found = {}
+    # No one to ask for a different directory, so skip any that don't exist. Directories listed
+    # in a manifest aren't searched, so they don't have to exist here.
+    exit_code = EXIT_SUCCESS
+    if headless and not manifest_file_path:
+        for dir_path in dir_paths:
+            if not Path(dir_path).is_dir():
+                print(f'\nThis is not an existing directory path: "{dir_path}"')
+                exit_code = EXIT_ERRORS
+        dir_paths = [dir_path for dir_path in dir_paths if Path(dir_path).is_dir()]
+    
+    multi_disc_games_found = GameLibrary()
+    watched_dir_paths = []
     new_playlists_created, playlists_updated, n = 0,0,0
-    loop = True
+    loop = bool(dir_paths)
     while loop:
         i = 0
+        root_scans = getRootScans(dir_paths, multi_disc_games_found.stats)
+        
         for dir_path in dir_paths:
             
-            multi_disc_games_found, playlist_count = findMultiDiscGames(dir_path, multi_disc_games_found)
+            disc_file_batches = next(root_scans) if root_scans else None
+            multi_disc_games_found, playlist_count = findMultiDiscGames(dir_path, multi_disc_games_found, disc_file_batches)
+            watched_dir_paths.append(dir_path)
             
             if playlist_count:
                 s = 's' if playlist_count > 1 else ''
-                input(f'\nAll data retrieved and ready to create playlists for {playlist_count} multi-disc game{s}. Press [ENTER] to start...')
+                if not watch_directories and not headless:
+                    input(f'\nAll data retrieved and ready to create playlists for {playlist_count} multi-disc game{s}. Press [ENTER] to start...')
                 
                 multi_disc_games_found = createPlaylists(multi_disc_games_found)
                 
-                playlists_not_overwritten = multi_disc_games_found[LOG_DATA][NOT_OVERWRITTEN]
-                playlists_not_updated = multi_disc_games_found[LOG_DATA][NOT_UPDATED]
-                new_playlists_created = multi_disc_games_found[LOG_DATA][SAVED]
-                playlists_updated = multi_disc_games_found[LOG_DATA][UPDATED]
-                playlist_save_errors = multi_disc_games_found[LOG_DATA][ERROR_NOT_SAVED]
+                run_stats = multi_disc_games_found.stats
+                playlists_not_overwritten = run_stats.not_overwritten
+                playlists_not_updated = run_stats.not_updated
+                new_playlists_created = run_stats.saved
+                playlists_updated = run_stats.updated
+                playlist_save_errors = run_stats.save_errors
                 
                 #if new_playlists_created or playlists_updated or playlists_not_updated:
                 print(f'\nPlaylists Newly Created: {new_playlists_created}')
@@ -1072,13 +3912,17 @@ if __name__ == '__main__':
             else:
                 print('\nNo multi-disc games found.')
             
+            if evict_finished_roots:
+                multi_disc_games_found = evictFinishedDirectory(dir_path, multi_disc_games_found)
+            
             n += 1
             i += 1
             if len(dir_paths) > i:
-                input(f'\nPress [Enter] to continue with next directory... {dir_paths[i]}')
+                if not watch_directories and not headless:
+                    input(f'\nPress [Enter] to continue with next directory... {dir_paths[i]}')
             else:
-                try_again = loop_script
-                loop = loop_script
+                try_again = loop_script and not watch_directories
+                loop = try_again
                 while try_again:
                     dir = input('\nDrop another directory here to keep searching or press [Enter] to close and create a log file now: ')
                     dir = dir.replace('"', '')
@@ -1088,14 +3932,28 @@ if __name__ == '__main__':
                         loop = False
                         try_again = False
                     elif Path.exists(dir_path):
-                        dir_paths = [dir_path]
+                        dir_paths = [Path(os.path.abspath(dir_path))]
                         try_again = False
                     else:
                         print(f'This is not an existing directory path: "{dir}"')
     
-    log_file_created = createLogFile(multi_disc_games_found)
+    multi_disc_games_found = verifySearchedDirectories(watched_dir_paths, multi_disc_games_found)
+    
+    log_file_created = createLogFile(multi_disc_games_found, log_file_path)
+    multi_disc_games_found.close()
     if log_file_created:
         print('--> Check log for more details.')
-        openLogFile(log_file_created)
+        if not watch_directories and not headless:
+            openLogFile(log_file_created)
     else:
         print('No log file necessary.')
+    
+    if multi_disc_games_found.stats.save_errors:
+        exit_code = EXIT_ERRORS
+    
+    return exit_code, watched_dir_paths if watch_directories else []
+
+
+### Script Starts Here
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,360 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''
+Auto M3U Playlist Generator Benchmark by JDHatten
+
+    Creates synthetic game libraries (empty disc image files) in a temporary directory and
+    times each step of the Auto M3U Playlist Generator on them separately.
+
+How To Use:
+    Run this script from the same directory as "auto_m3u_playlist_generator.py". Results are
+    printed (and optionally saved) as JSON so runs can be compared.
+    
+    python benchmark.py --disc-counts 1000 10000 --output results.json
+    
+    To see how a network share (SMB/NFS) would do, add a delay to every file call and compare
+    the I/O backends:
+    
+    python benchmark.py --disc-counts 1000 --latency 2 --io-backend threads asyncio
+
+'''
+
+# Number of disc images in each synthetic library, one benchmark per library.
+disc_counts = [1000, 10000, 100000]
+
+# Number of discs each multi-disc game has (a random amount between these two).
+discs_per_game = (2, 4)
+
+# How often each disc format is used, a disc format is picked per game.
+format_mix = { '.chd' : 5, '.cue' : 3, '.iso' : 2 }
+
+# Out of all the games, how many are...
+compilation_game_ratio = 0.05 # Compilation discs with disc titles instead of numbers
+split_game_ratio = 0.05 # Multi-disc games with their discs in different directories
+single_disc_game_ratio = 0.30 # Single disc games (no playlist needed)
+
+# How many directories deep games are placed and how many games in each directory.
+directory_depth = 3
+games_per_directory = 20
+
+# Files that aren't disc images (bin, saves, images, etc) added per game.
+noise_files_per_game = 2
+
+# Times each benchmark is ran, only the fastest time of each step is kept.
+repeat_count = 1
+
+# Random seed used to create the libraries, so the same library is created every time.
+random_seed = 1
+
+# Milliseconds added to every file call (directory listings, file checks, reads and writes) to
+# act like a high-latency network share.
+latency_ms = 0
+
+# Each I/O backend ("io_backend" in the generator) to benchmark.
+io_backends = ['threads']
+
+
+### Don't Edit Below This Line ###
+
+from pathlib import Path
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import pathlib
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import auto_m3u_playlist_generator as generator
+
+REGIONS = ['(USA)', '(Europe)', '(Japan)', '(USA) (Rev 1)', '(En,Fr,De)']
+DISC_TITLES = ['(Arcade Disc)', '(Story Disc)', '(Bonus Disc)', '(Versus Disc)']
+NOISE_EXTENSIONS = ['.bin', '.sav', '.png', '.txt', '.sbi']
+DISC_INFO_FORMATS = ['(Disc {})', '(Disc {} of {})', '[CD{}]']
+
+
+### Create a synthetic game library of empty files.
+###     (root_path) Path to an empty directory to create the library in.
+###     (disc_count) Number of disc images to create.
+###     (seed) Random seed.
+###     --> Returns a [Dictionary] of the number of files and directories created.
+def createSyntheticLibrary(root_path, disc_count, seed = None):
+    rnd = random.Random(random_seed if seed is None else seed)
+    formats = list(format_mix.keys())
+    format_weights = list(format_mix.values())
+    dir_paths = []
+    files_created = 0
+    discs_created = 0
+    game_number = 0
+    
+    ### Get a directory for the next game, "games_per_directory" games per directory.
+    def getGameDirectory():
+        if not dir_paths or game_number % games_per_directory == 0:
+            parts = [f'Dir {rnd.randrange(10)}' for depth in range(rnd.randint(1, max(1, directory_depth)))]
+            dir_path = Path(root_path, *parts, f'Games {len(dir_paths):05}')
+            dir_path.mkdir(parents=True, exist_ok=True)
+            dir_paths.append(dir_path)
+        return dir_paths[-1]
+    
+    while discs_created < disc_count:
+        game_number += 1
+        game_dir_path = getGameDirectory()
+        game_name = f'Game {game_number:06} {rnd.choice(REGIONS)}'
+        disc_ext = rnd.choices(formats, format_weights)[0]
+        game_kind = rnd.random()
+        file_names = []
+        
+        if game_kind < single_disc_game_ratio:
+            file_names.append((game_dir_path, f'{game_name}{disc_ext}'))
+        
+        elif game_kind < single_disc_game_ratio + compilation_game_ratio:
+            for disc_title in rnd.sample(DISC_TITLES, rnd.randint(*discs_per_game)):
+                file_names.append((game_dir_path, f'{game_name} {disc_title}{disc_ext}'))
+        
+        else:
+            disc_info_format = rnd.choice(DISC_INFO_FORMATS)
+            game_disc_count = rnd.randint(*discs_per_game)
+            split_game = game_kind < single_disc_game_ratio + compilation_game_ratio + split_game_ratio
+            for disc_number in range(1, game_disc_count + 1):
+                disc_dir_path = game_dir_path
+                if split_game:
+                    disc_dir_path = Path(game_dir_path, f'Disc {disc_number}')
+                    disc_dir_path.mkdir(exist_ok=True)
+                disc_info = disc_info_format.format(disc_number, game_disc_count)
+                file_names.append((disc_dir_path, f'{game_name} {disc_info}{disc_ext}'))
+        
+        for noise_number in range(noise_files_per_game):
+            file_names.append((game_dir_path, f'{game_name} ({noise_number}){rnd.choice(NOISE_EXTENSIONS)}'))
+        
+        for dir_path, file_name in file_names:
+            Path(dir_path, file_name).touch()
+            files_created += 1
+            if os.path.splitext(file_name)[1] in format_mix:
+                discs_created += 1
+    
+    return { 'files' : files_created, 'discs' : discs_created, 'games' : game_number, 'directories' : len(dir_paths) }
+
+
+### List every file in a library in a manifest, the same as "find . -type f" would.
+###     (root_path) Path to the library.
+###     (manifest_path) Path of the manifest file to create.
+###     --> Returns a [None]
+def createManifest(root_path, manifest_path):
+    with open(manifest_path, 'w', encoding='utf-8') as manifest:
+        for dir_path, dir_names, file_names in os.walk(root_path):
+            for file_name in file_names:
+                manifest.write(f'{os.path.relpath(os.path.join(dir_path, file_name), root_path)}\n')
+    return None
+
+
+### Wrap a function in the generator so the time spent in it is added up, even when it's
+### called from inside another function.
+###     (function_name) Name of the function in the generator.
+###     (timings) A Dictionary of timings to add to.
+###     --> Returns the original [Function]
+def timeFunctionCalls(function_name, timings):
+    function = getattr(generator, function_name)
+    
+    def timedFunction(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings[function_name] = timings.get(function_name, 0) + time.perf_counter() - start_time
+    
+    setattr(generator, function_name, timedFunction)
+    return function
+
+
+### Add a delay to every file call the generator makes, the same as a network share would.
+###     (seconds) Delay added to each call.
+###     --> Returns a [List] of the original [Tuples] (object, attribute name, function)
+def injectLatency(seconds):
+    original_functions = []
+    for owner, function_name in ((os, 'scandir'), (os, 'stat'), (os, 'replace'), (os.path, 'exists'),
+                                 (pathlib.Path, 'read_bytes'), (pathlib.Path, 'write_bytes')):
+        function = getattr(owner, function_name)
+        
+        def delayedFunction(*args, function = function, **kwargs):
+            time.sleep(seconds)
+            return function(*args, **kwargs)
+        
+        setattr(owner, function_name, delayedFunction)
+        original_functions.append((owner, function_name, function))
+    return original_functions
+
+
+### Remove the delay added to file calls (see "injectLatency").
+###     (original_functions) A List of the original functions.
+###     --> Returns a [None]
+def removeLatency(original_functions):
+    for owner, function_name, function in original_functions:
+        setattr(owner, function_name, function)
+    return None
+
+
+### Give the generator the state of a new run, with its own settings and an empty scan cache. The
+### generator's settings and state are put back afterwards (see "PlaylistGenerator.useSettings").
+###     (log_file_path) Path of the log file.
+###     (io_backend) I/O backend the generator uses.
+@contextlib.contextmanager
+def resetGenerator(log_file_path, io_backend = generator.IO_THREADS):
+    config = generator.GeneratorConfig(use_scan_cache=False, create_log_file=True, io_backend=io_backend)
+    log_level = generator.logger.level
+    generator.logger.setLevel(logging.WARNING)
+    try:
+        with generator.PlaylistGenerator(config, log_file_path).useSettings():
+            run_log = generator.getRunLog(log_file_path)
+            try:
+                yield
+            finally:
+                run_log.close()
+    finally:
+        generator.logger.setLevel(log_level)
+
+
+### Time each step of the generator once on a library. Existing playlists are deleted first.
+###     (root_path) Path to the library.
+###     (log_file_path) Path of the log file.
+###     (latency) Seconds added to every file call.
+###     (manifest_path) Path to a manifest of the library, to also time reading it instead of searching.
+###     (io_backend) I/O backend the generator uses.
+###     --> Returns a [Dictionary] of step names and seconds, and the [Integer] playlists created.
+def runBenchmark(root_path, log_file_path, latency = 0, manifest_path = None, io_backend = generator.IO_THREADS):
+    for dir_path, dir_names, file_names in os.walk(root_path):
+        for file_name in file_names:
+            if file_name.endswith('.m3u'):
+                os.remove(os.path.join(dir_path, file_name))
+    
+    timings = {}
+    original_functions = { function_name : timeFunctionCalls(function_name, timings)
+                           for function_name in ('checkForCompilationGame', 'checkForDupeGames') }
+    original_file_functions = injectLatency(latency) if latency else []
+    try:
+        with resetGenerator(log_file_path, io_backend), contextlib.redirect_stdout(io.StringIO()):
+            
+            start_time = time.perf_counter()
+            disc_file_batches = list(generator.scanDirectoryTree(root_path))
+            timings['scan'] = time.perf_counter() - start_time
+            
+            if manifest_path:
+                start_time = time.perf_counter()
+                list(generator.readManifest(manifest_path, root_path))
+                timings['manifest_scan'] = time.perf_counter() - start_time
+            
+            start_time = time.perf_counter()
+            multi_disc_games_found, playlist_count = generator.findMultiDiscGames(
+                root_path, generator.GameLibrary(), disc_file_batches)
+            timings['group'] = time.perf_counter() - start_time
+            
+            start_time = time.perf_counter()
+            multi_disc_games_found = generator.createPlaylists(multi_disc_games_found)
+            timings['create_playlists'] = time.perf_counter() - start_time
+            
+            start_time = time.perf_counter()
+            generator.createLogFile(multi_disc_games_found)
+            timings['create_log_file'] = time.perf_counter() - start_time
+            
+            # Second run, every playlist already exists and is read back.
+            for game in multi_disc_games_found:
+                for playlist in game.playlists.values():
+                    playlist.creation = None
+            start_time = time.perf_counter()
+            generator.createPlaylists(multi_disc_games_found)
+            timings['update_playlists'] = time.perf_counter() - start_time
+    
+    finally:
+        removeLatency(original_file_functions)
+        for function_name, function in original_functions.items():
+            setattr(generator, function_name, function)
+    
+    return timings, multi_disc_games_found.stats.saved
+
+
+### Get the command line arguments.
+###     (argv) A List of argument Strings, defaults to "sys.argv[1:]".
+###     --> Returns an [argparse.Namespace]
+def getArguments(argv = None):
+    parser = argparse.ArgumentParser(description='Benchmark the Auto M3U Playlist Generator on synthetic libraries.')
+    parser.add_argument('--disc-counts', type=int, nargs='+', default=disc_counts, metavar='N',
+                        help=f'disc images in each library (default: {disc_counts})')
+    parser.add_argument('--repeat', type=int, default=repeat_count, metavar='N',
+                        help=f'times each benchmark is ran, fastest kept (default: {repeat_count})')
+    parser.add_argument('--seed', type=int, default=random_seed, help=f'random seed (default: {random_seed})')
+    parser.add_argument('--latency', type=float, default=latency_ms, metavar='MS',
+                        help=f'milliseconds added to every file call (default: {latency_ms})')
+    parser.add_argument('--io-backend', dest='io_backends', nargs='+', default=io_backends,
+                        choices=(generator.IO_THREADS, generator.IO_ASYNCIO),
+                        help=f'I/O backends to benchmark (default: {io_backends})')
+    parser.add_argument('--directory', type=Path, metavar='DIRECTORY',
+                        help='create the libraries here instead of a temporary directory (on the drive to test)')
+    parser.add_argument('--output', type=Path, metavar='FILE', help='also save the results to this JSON file')
+    return parser.parse_args(argv)
+
+
+### Run the benchmarks.
+###     (argv) A List of argument Strings, defaults to "sys.argv[1:]".
+###     --> Returns an [Integer] exit code
+def main(argv = None):
+    arguments = getArguments(argv)
+    results = {
+        'python' : sys.version.split()[0],
+        'platform' : platform.platform(),
+        'settings' : { 'discs_per_game' : discs_per_game, 'format_mix' : format_mix,
+                       'compilation_game_ratio' : compilation_game_ratio, 'split_game_ratio' : split_game_ratio,
+                       'single_disc_game_ratio' : single_disc_game_ratio, 'directory_depth' : directory_depth,
+                       'games_per_directory' : games_per_directory, 'noise_files_per_game' : noise_files_per_game,
+                       'scan_worker_count' : generator.scan_worker_count,
+                       'playlist_write_workers' : generator.playlist_write_workers,
+                       'io_concurrency' : generator.io_concurrency,
+                       'latency_ms' : arguments.latency, 'seed' : arguments.seed },
+        'benchmarks' : [],
+    }
+    
+    for disc_count in arguments.disc_counts:
+        temp_dir_path = tempfile.mkdtemp(prefix='m3u_benchmark_', dir=arguments.directory)
+        try:
+            root_path = os.path.join(temp_dir_path, 'library')
+            os.mkdir(root_path)
+            start_time = time.perf_counter()
+            library = createSyntheticLibrary(root_path, disc_count, arguments.seed)
+            print(f'Created library of {library["discs"]} discs ({library["files"]} files) in '
+                  f'{time.perf_counter() - start_time:.2f}s', file=sys.stderr)
+            manifest_path = os.path.join(temp_dir_path, 'manifest.txt')
+            createManifest(root_path, manifest_path)
+            
+            for io_backend in arguments.io_backends:
+                best_timings = {}
+                for repeat in range(max(1, arguments.repeat)):
+                    timings, playlists_created = runBenchmark(root_path, os.path.join(temp_dir_path, 'log.txt'),
+                                                              arguments.latency / 1000, manifest_path, io_backend)
+                    for step, seconds in timings.items():
+                        best_timings[step] = min(seconds, best_timings.get(step, seconds))
+                
+                benchmark = { 'disc_count' : disc_count, 'io_backend' : io_backend, 'library' : library,
+                              'playlists_created' : playlists_created,
+                              'seconds' : { step : round(seconds, 6) for step, seconds in best_timings.items() } }
+                results['benchmarks'].append(benchmark)
+                print(json.dumps(benchmark), file=sys.stderr)
+        finally:
+            shutil.rmtree(temp_dir_path, ignore_errors=True)
+    
+    results_json = json.dumps(results, indent=2)
+    print(results_json)
+    if arguments.output:
+        arguments.output.write_text(results_json, encoding='utf-8')
+    
+    return 0
+
+
+### Script Starts Here
+if __name__ == '__main__':
+    sys.exit(main())
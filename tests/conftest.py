@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import auto_m3u_playlist_generator as generator
+
+
+@pytest.fixture
+def m3u(monkeypatch):
+    '''The generator module with the state of a new run, restored after each test.'''
+    for name, value in (('use_scan_cache', False), ('scan_cache', None), ('create_log_file', False),
+                        ('run_log', None), ('directory_listings', {}), ('cue_sheet_tracks', {}),
+                        ('manifest_file_stats', {}), ('dat_index', {}), ('hash_cache', None)):
+        monkeypatch.setattr(generator, name, value)
+    generator.compileRE()
+    yield generator
+    generator.compileRE()
@@ -0,0 +1,72 @@
+import os
+import threading
+import time
+
+import pytest
+
+import benchmark
+
+
+@pytest.fixture
+def io_loop(m3u, monkeypatch):
+    '''An event loop of its own with at most 3 file I/O calls at the same time.'''
+    io_loop = m3u.AsyncIOLoop(3)
+    monkeypatch.setattr(m3u, 'async_io_loop', io_loop)
+    monkeypatch.setattr(m3u, 'io_backend', m3u.IO_ASYNCIO)
+    yield io_loop
+    io_loop.loop.call_soon_threadsafe(io_loop.loop.stop)
+
+
+def test_calls_are_limited_to_io_concurrency(m3u, io_loop):
+    calls = []
+    lock = threading.Lock()
+    def call(number):
+        with lock:
+            calls.append(1)
+            most_calls = len(calls)
+        time.sleep(0.01)
+        with lock:
+            calls.pop()
+        return number, most_calls
+    
+    # Two pools at once, from different threads, still share the one limit.
+    with m3u.getIOPool(1) as pool, m3u.getIOPool(1) as other_pool:
+        other_results = []
+        other_thread = threading.Thread(target=lambda: other_results.extend(other_pool.map(call, range(12))))
+        other_thread.start()
+        results = list(pool.map(call, range(12)))
+        other_thread.join()
+    
+    assert [number for number, most_calls in results] == list(range(12))
+    assert 1 < max(most_calls for number, most_calls in results + other_results) <= 3
+
+
+def test_errors_are_raised_when_results_are_read(m3u, io_loop):
+    def call(number):
+        if number == 2:
+            raise OSError('Drive went away')
+        return number
+    
+    with m3u.getIOPool(1) as pool:
+        results = pool.map(call, range(4))
+        assert next(results) == 0 and next(results) == 1
+        with pytest.raises(OSError, match='Drive went away'):
+            next(results)
+
+
+def test_playlists_are_the_same_with_asyncio(m3u, tmp_path):
+    library_path = tmp_path / 'library'
+    library_path.mkdir()
+    benchmark.createSyntheticLibrary(library_path, 100, seed=1)
+    config = m3u.GeneratorConfig(use_scan_cache=False, create_log_file=False, io_backend=m3u.IO_ASYNCIO)
+    
+    multi_disc_games_found = m3u.PlaylistGenerator(config).run([library_path])
+    playlists = { playlist.output_path : playlist.output_path.read_bytes()
+                  for game in multi_disc_games_found for playlist in game.playlists.values() }
+    for playlist_path in playlists:
+        os.remove(playlist_path)
+    multi_disc_games_found = m3u.PlaylistGenerator(config._replace(io_backend=m3u.IO_THREADS)).run([library_path])
+    
+    assert multi_disc_games_found.stats.saved == len(playlists) > 0
+    assert { playlist.output_path : playlist.output_path.read_bytes()
+             for game in multi_disc_games_found for playlist in game.playlists.values() } == playlists
@@ -0,0 +1,46 @@
+import os
+
+import benchmark
+
+
+def test_synthetic_library_counts(tmp_path):
+    library = benchmark.createSyntheticLibrary(tmp_path, 200, seed=1)
+    
+    file_names = [file_name for dir_path, dir_names, file_names in os.walk(tmp_path) for file_name in file_names]
+    game_dir_names = [dir_name for dir_path, dir_names, file_names in os.walk(tmp_path)
+                      for dir_name in dir_names if dir_name.startswith('Games ')]
+    assert library['files'] == len(file_names)
+    assert library['discs'] == sum(1 for file_name in file_names
+                                   if os.path.splitext(file_name)[1] in benchmark.format_mix)
+    assert library['discs'] >= 200
+    assert library['directories'] == len(game_dir_names)
+    assert library['games'] == len(set(file_name.split(' (')[0] for file_name in file_names))
+
+
+def test_generator_is_reset_between_runs(m3u, tmp_path):
+    m3u.directory_listings['/library'] = {'Game (Disc 1).cue'}
+    m3u.cue_sheet_tracks['/library'] = {'Game (Disc 1).cue' : ['Game (Disc 1).bin']}
+    m3u.manifest_file_stats['/library.txt'] = [0, 0]
+    
+    with benchmark.resetGenerator(tmp_path / 'log.txt', m3u.IO_ASYNCIO):
+        assert not m3u.directory_listings and not m3u.cue_sheet_tracks and not m3u.manifest_file_stats
+        assert m3u.create_log_file and m3u.io_backend == m3u.IO_ASYNCIO
+    
+    assert m3u.directory_listings == {'/library' : {'Game (Disc 1).cue'}}
+    assert m3u.manifest_file_stats == {'/library.txt' : [0, 0]}
+    assert not m3u.create_log_file and m3u.io_backend == m3u.IO_THREADS
+    assert m3u.run_log is None
+
+
+def test_benchmark_leaves_generator_settings_alone(m3u, tmp_path):
+    library_path = tmp_path / 'library'
+    library_path.mkdir()
+    benchmark.createSyntheticLibrary(library_path, 50, seed=1)
+    log_level = m3u.logger.level
+    
+    timings, playlists_created = benchmark.runBenchmark(str(library_path), tmp_path / 'log.txt',
+                                                        io_backend=m3u.IO_ASYNCIO)
+    
+    assert playlists_created and 'create_playlists' in timings
+    assert m3u.io_backend == m3u.IO_THREADS and not m3u.create_log_file and m3u.run_log is None
+    assert m3u.logger.level == log_level
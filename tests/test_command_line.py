@@ -0,0 +1,55 @@
+import pytest
+
+
+@pytest.fixture
+def cli(m3u, monkeypatch):
+    '''Run this script from the command line, putting back every setting it changes afterwards.'''
+    for name in set(m3u.GENERATOR_SETTINGS).union(m3u.COMMAND_LINE_SETTINGS, ('console_output',)):
+        monkeypatch.setattr(m3u, name, getattr(m3u, name))
+    for name in ('handlers', 'propagate', 'level'):
+        monkeypatch.setattr(m3u.logger, name, getattr(m3u.logger, name))
+    
+    def main(*argv):
+        return m3u.main(['--headless', '--no-use-scan-cache', '--no-create-log-file', '--no-watch-directories',
+                         *map(str, argv)])
+    return main
+
+
+def createGame(games_path):
+    games_path.mkdir()
+    (games_path / 'Game (Disc 1).iso').touch()
+    (games_path / 'Game (Disc 2).iso').touch()
+
+
+def test_playlists_created(m3u, cli, tmp_path):
+    createGame(tmp_path / 'games')
+    
+    assert cli(tmp_path / 'games') == m3u.EXIT_SUCCESS
+    assert (tmp_path / 'games' / 'Game.m3u').is_file()
+
+
+def test_missing_directory_is_skipped(m3u, cli, tmp_path):
+    createGame(tmp_path / 'games')
+    
+    assert cli(tmp_path / 'missing', tmp_path / 'games') == m3u.EXIT_ERRORS
+    assert (tmp_path / 'games' / 'Game.m3u').is_file()
+
+
+def test_playlist_not_saved(m3u, cli, tmp_path):
+    createGame(tmp_path / 'games')
+    (tmp_path / 'games' / 'Game.m3u').mkdir() # In the way of the playlist
+    
+    assert cli(tmp_path / 'games') == m3u.EXIT_ERRORS
+
+
+def test_missing_save_all_playlists_in_directory(m3u, cli, tmp_path):
+    createGame(tmp_path / 'games')
+    
+    assert cli('--save-all-playlists-in', tmp_path / 'missing', tmp_path / 'games') == m3u.EXIT_USAGE
+    assert not (tmp_path / 'games' / 'Game.m3u').exists()
+
+
+def test_unknown_option(m3u, cli, tmp_path):
+    with pytest.raises(SystemExit) as exit_info:
+        cli('--no-such-option', tmp_path)
+    assert exit_info.value.code == m3u.EXIT_USAGE
@@ -0,0 +1,21 @@
+import hashlib
+
+
+def test_cue_sheet_is_identified_by_its_tracks(m3u, tmp_path, monkeypatch):
+    monkeypatch.setattr(m3u, 'hash_process_count', 1)
+    monkeypatch.setattr(m3u, 'getHashCacheFilePath', lambda: tmp_path / 'hash_cache.json')
+    m3u.loadHashCache()
+    (tmp_path / 'Badly Named.cue').write_text('FILE "Badly Named (Track 1).bin" BINARY\nFILE "Badly Named (Track 2).bin" BINARY\n')
+    (tmp_path / 'Badly Named (Track 1).bin').write_bytes(b'data track')
+    (tmp_path / 'Badly Named (Track 2).bin').write_bytes(b'audio track')
+    m3u.dat_index[hashlib.sha1(b'audio track').hexdigest()] = 'Real Game (USA) (Disc 2)'
+    
+    run_stats = m3u.RunStats()
+    disc_file_batches = list(m3u.identifyDiscFiles(m3u.scanDirectoryTree(str(tmp_path), worker_count=1), run_stats))
+    
+    (root, disc_files), = disc_file_batches
+    assert disc_files[0][:4] == ['Badly Named.cue', 'Real Game', [' (USA)'], 2]
+    assert run_stats.discs_hashed == 1 and run_stats.discs_identified == 1
+    assert set(m3u.hash_cache['files']) == {
+        str(tmp_path / 'Badly Named (Track 1).bin'), str(tmp_path / 'Badly Named (Track 2).bin')
+    }
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+
+
+def addGames(library, dir_name, names):
+    for name in names:
+        game = library.addGame(Path(dir_name, name))
+        game.addPlaylist(Path(dir_name, f'{name}.m3u'), [Path(dir_name, f'{name} (Disc 1).iso')])
+
+
+def getFileSize(library):
+    return library.evicted_games_file.seek(0, os.SEEK_END)
+
+
+def test_evicted_games_are_still_counted_and_iterated(m3u):
+    library = m3u.GameLibrary()
+    addGames(library, 'A', ['Game 1', 'Game 2'])
+    library.evictGames()
+    addGames(library, 'B', ['Game 3'])
+    
+    assert len(library) == 3
+    assert sorted(game.name for game in library) == ['Game 1', 'Game 2', 'Game 3']
+    assert [game.name for game in library.gamesInMemory()] == ['Game 3']
+    library.close()
+
+
+def test_evicted_games_file_is_emptied_once_all_games_are_back(m3u):
+    library = m3u.GameLibrary()
+    addGames(library, 'A', ['Game 1', 'Game 2'])
+    library.evictGames()
+    
+    library.restoreGames('Game 1')
+    assert getFileSize(library) > 0
+    library.restoreGames('Game 2')
+    
+    assert getFileSize(library) == 0
+    assert len(library) == 2 and not library.evicted_names
+    library.close()
+
+
+def test_evicted_games_file_is_compacted(m3u):
+    library = m3u.GameLibrary()
+    names = [f'Game {number}' for number in range(10)]
+    addGames(library, 'A', names)
+    library.evictGames()
+    file_size = getFileSize(library)
+    
+    for name in names[:6]:
+        library.restoreGames(name)
+    
+    assert getFileSize(library) < file_size / 2
+    assert library.get(Path('A', 'Game 9')).name == 'Game 9'
+    assert len(library) == 10
+    library.close()
+
+
+def runRoots(m3u, library_path, evict_finished_roots):
+    import benchmark
+    root_paths = []
+    for root_number, seed in enumerate((1, 1, 2)): # The first two have games of the same names
+        root_path = library_path / f'root {root_number}'
+        root_path.mkdir(parents=True)
+        benchmark.createSyntheticLibrary(root_path, 60, seed=seed)
+        (root_path / 'Stale.m3u').write_text(f'{root_path / "Stale (Disc 1).iso"}\n')
+        root_paths.append(str(root_path))
+    
+    config = m3u.GeneratorConfig(use_scan_cache=False, create_log_file=False, evict_finished_roots=evict_finished_roots)
+    multi_disc_games_found = m3u.PlaylistGenerator(config).run(root_paths)
+    playlists = { os.path.relpath(playlist.output_path, library_path) :
+                  Path(playlist.output_path).read_text().replace(str(library_path), '')
+                  for game in multi_disc_games_found for playlist in game.playlists.values() }
+    run_stats = multi_disc_games_found.stats
+    multi_disc_games_found.close()
+    
+    assert not any(Path(root_path, 'Stale.m3u').exists() for root_path in root_paths)
+    return playlists, run_stats
+
+
+def test_evicting_finished_roots_gives_the_same_playlists(m3u, tmp_path):
+    evicted_playlists, evicted_stats = runRoots(m3u, tmp_path / 'evicted', True)
+    playlists, run_stats = runRoots(m3u, tmp_path / 'kept', False)
+    
+    assert evicted_playlists == playlists and len(playlists) > 0
+    assert evicted_stats.saved == run_stats.saved and evicted_stats.deleted == run_stats.deleted == 3
+    
+    # Games in both of the first two directories are combined into one playlist above them.
+    assert playlists['Game 000001 (USA).m3u'].count('(Disc 1 of 3)') == 2
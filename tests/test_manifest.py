@@ -0,0 +1,75 @@
+import io
+import os
+
+import benchmark
+
+
+def getDiscFiles(disc_file_batches):
+    return { dir_path : sorted(disc_files, key=lambda disc_file: disc_file[0])
+             for dir_path, disc_files in disc_file_batches if disc_files }
+
+
+def getListings(m3u):
+    return { dir_path : file_names for dir_path, file_names in m3u.directory_listings.items() if file_names }
+
+
+def test_manifest_finds_the_same_as_searching(m3u, tmp_path):
+    library_path = tmp_path / 'library'
+    library_path.mkdir()
+    benchmark.createSyntheticLibrary(library_path, 100, seed=1)
+    manifest_path = tmp_path / 'manifest.txt'
+    benchmark.createManifest(library_path, manifest_path)
+    
+    searched = getDiscFiles(m3u.scanDirectoryTree(str(library_path), worker_count=1))
+    searched_listings, searched_cue_sheets = getListings(m3u), dict(m3u.cue_sheet_tracks)
+    m3u.directory_listings.clear()
+    m3u.cue_sheet_tracks.clear()
+    listed = getDiscFiles(m3u.readManifest(manifest_path, library_path))
+    
+    assert searched and listed == searched
+    assert getListings(m3u) == searched_listings
+    assert m3u.cue_sheet_tracks == searched_cue_sheets
+
+
+def test_manifest_separated_by_nul(m3u, tmp_path):
+    manifest_path = tmp_path / 'manifest.txt'
+    manifest_path.write_bytes(b'A/Game (Disc 1).iso\0A/Game (Disc 2).iso\0A/Line\nBreak (Disc 1).iso\0')
+    
+    listed = getDiscFiles(m3u.readManifest(manifest_path, tmp_path))
+    
+    assert [disc_file[0] for disc_file in listed[str(tmp_path / 'A')]] == [
+        'Game (Disc 1).iso', 'Game (Disc 2).iso', 'Line\nBreak (Disc 1).iso'
+    ]
+
+
+def test_manifest_sizes_and_modified_times(m3u, tmp_path, monkeypatch):
+    monkeypatch.setattr(m3u, 'dat_index', { '0' * 40 : 'Game' })
+    manifest_path = tmp_path / 'manifest.txt'
+    manifest_path.write_text('A/Game (Disc 1).iso\t1024\t1700000000.25\r\n'
+                             'A/Game (Disc 2).iso\t2048\t1700000001\n'
+                             'A/Tab\tIn Name (Disc 1).iso\n')
+    
+    listed = getDiscFiles(m3u.readManifest(manifest_path, tmp_path))
+    
+    assert [disc_file[0] for disc_file in listed[str(tmp_path / 'A')]] == [
+        'Game (Disc 1).iso', 'Game (Disc 2).iso', 'Tab\tIn Name (Disc 1).iso'
+    ]
+    assert m3u.manifest_file_stats == {
+        str(tmp_path / 'A' / 'Game (Disc 1).iso') : (1024, 1700000000250000000),
+        str(tmp_path / 'A' / 'Game (Disc 2).iso') : (2048, 1700000001000000000),
+    }
+
+
+def test_manifest_is_read_once_for_every_root_directory(m3u, tmp_path, monkeypatch):
+    manifest_text = ''.join(f'{tmp_path / root_name / "Game (Disc 1).iso"}\n{tmp_path / root_name / "Game (Disc 2).iso"}\n'
+                            for root_name in ('A', 'B', 'C'))
+    stdin = io.TextIOWrapper(io.BytesIO(manifest_text.encode()))
+    monkeypatch.setattr(m3u.sys, 'stdin', stdin)
+    
+    root_scans = m3u.readManifestRoots(m3u.MANIFEST_STDIN, [tmp_path / 'C', tmp_path / 'A', tmp_path], m3u.RunStats())
+    listed = [getDiscFiles(disc_file_batches) for disc_file_batches in root_scans]
+    
+    assert [sorted(root_listed) for root_listed in listed] == [
+        [str(tmp_path / 'C')], [str(tmp_path / 'A')], [str(tmp_path / root_name) for root_name in ('A', 'B', 'C')]
+    ]
+    assert all(len(disc_files) == 2 for root_listed in listed for disc_files in root_listed.values())
@@ -0,0 +1,19 @@
+import cProfile
+
+
+def test_phase_profile_is_created_once(m3u, monkeypatch):
+    profiles_created = []
+    class Profile(cProfile.Profile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            profiles_created.append(self)
+    monkeypatch.setattr(m3u.cProfile, 'Profile', Profile)
+    monkeypatch.setattr(m3u, 'profile_phases', m3u.PROFILE_CPROFILE)
+    monkeypatch.setattr(m3u, 'phase_profiles', {})
+    run_stats = m3u.GameLibrary().stats
+    
+    for i in range(3):
+        with m3u.timePhase(run_stats, 'scan'):
+            pass
+    
+    assert profiles_created == [m3u.phase_profiles['scan']]
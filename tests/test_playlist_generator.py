@@ -0,0 +1,67 @@
+import io
+
+
+def createGames(games_path):
+    games_path.mkdir()
+    for disc_number in (1, 2):
+        (games_path / f'Game (Disc {disc_number}).mds').touch()
+        (games_path / f'Other (Disc {disc_number}).iso').touch()
+
+
+def getGenerator(m3u, use_scan_cache = False):
+    disc_extensions = dict(m3u.disc_extensions, **{ '.mds' : ['MDS', True] })
+    return m3u.PlaylistGenerator(m3u.GeneratorConfig(disc_extensions=disc_extensions, create_log_file=False,
+                                                     use_scan_cache=use_scan_cache))
+
+
+def test_parsed_file_names_are_kept_between_runs(m3u, tmp_path):
+    createGames(tmp_path / 'games')
+    script_pattern_settings = m3u.getPatternSettings()
+    m3u.parseDiscFileStem('Script Game (Disc 1)')
+    script_parse_cache = m3u.parseDiscFileStem.cache_info()
+    playlist_generator = getGenerator(m3u)
+    
+    first_run = playlist_generator.run([tmp_path / 'games'])
+    (tmp_path / 'games' / 'Game.m3u').unlink()
+    second_run = playlist_generator.run([tmp_path / 'games'])
+    
+    assert first_run.stats.saved == 2 and second_run.stats.saved == 1
+    assert first_run.stats.names_parsed == 4 and second_run.stats.names_parsed == 0
+    with playlist_generator.useSettings():
+        generator_parse_cache = m3u.parseDiscFileStem.cache_info()
+    assert generator_parse_cache.currsize == 4 and generator_parse_cache.hits > 0
+    
+    # The settings of the script are put back, without forgetting what the script already read.
+    assert m3u.compiled_pattern_settings == script_pattern_settings
+    assert m3u.parseDiscFileStem.cache_info() == script_parse_cache
+    assert not m3u.isSearchableDiscFile('Game (Disc 1).mds')
+
+
+def test_scan_cache_is_kept_between_runs(m3u, tmp_path, monkeypatch):
+    monkeypatch.setattr(m3u, 'getScanCacheFilePath', lambda: tmp_path / 'scan_cache.json')
+    createGames(tmp_path / 'games')
+    playlist_generator = getGenerator(m3u, use_scan_cache=True)
+    
+    playlist_generator.run([tmp_path / 'games'])
+    scan_cache = playlist_generator.warm_state['scan_cache']
+    playlist_generator.run([tmp_path / 'games'])
+    
+    assert scan_cache is not None and playlist_generator.warm_state['scan_cache'] is scan_cache
+    assert m3u.scan_cache is None and not m3u.use_scan_cache
+    assert not m3u.directory_listings
+
+
+def test_nothing_is_printed_while_running(m3u, tmp_path, monkeypatch):
+    class Terminal(io.StringIO):
+        def isatty(self):
+            return True
+    terminal = Terminal()
+    monkeypatch.setattr(m3u.sys, 'stdout', terminal)
+    monkeypatch.setattr(m3u.logger, 'level', m3u.logging.WARNING)
+    createGames(tmp_path / 'games')
+    
+    multi_disc_games_found = getGenerator(m3u).run([tmp_path / 'games'])
+    
+    assert multi_disc_games_found.stats.saved == 2
+    assert terminal.getvalue() == ''
+    assert m3u.ProgressLine('Searching').enabled # Still shown when ran from the command line
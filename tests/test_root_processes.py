@@ -0,0 +1,62 @@
+import os
+
+import benchmark
+
+
+def createRoots(tmp_path):
+    root_paths = []
+    for seed in (1, 2, 3):
+        root_path = tmp_path / f'root {seed}'
+        root_path.mkdir()
+        benchmark.createSyntheticLibrary(root_path, 40, seed=seed)
+        root_paths.append(str(root_path))
+    return root_paths
+
+
+def test_root_processes_find_the_same_as_one_process(m3u, tmp_path, monkeypatch, caplog):
+    root_paths = createRoots(tmp_path)
+    monkeypatch.setattr(m3u, 'root_process_count', 2)
+    run_stats = m3u.RunStats()
+    
+    searched = [list(m3u.scanDirectoryTree(root_path, worker_count=1)) for root_path in root_paths]
+    searched_listings, searched_cue_sheets = dict(m3u.directory_listings), dict(m3u.cue_sheet_tracks)
+    m3u.directory_listings.clear()
+    m3u.cue_sheet_tracks.clear()
+    listed = [list(disc_file_batches) for disc_file_batches in m3u.scanRootDirectories(root_paths, run_stats)]
+    
+    assert listed == searched
+    assert m3u.directory_listings == searched_listings
+    assert m3u.cue_sheet_tracks == searched_cue_sheets
+    assert run_stats.dirs_searched == sum(len(disc_file_batches) for disc_file_batches in searched)
+    assert not caplog.records # Not searched again in this process
+
+
+def test_root_processes_update_the_scan_cache(m3u, tmp_path, monkeypatch):
+    root_paths = createRoots(tmp_path)
+    for dir_path, dir_names, file_names in os.walk(tmp_path):
+        os.utime(dir_path, (1000000000, 1000000000)) # Recently modified directories aren't cached
+    m3u.scan_cache = { 'version' : m3u.getScanCacheVersion(), 'directories' : {} }
+    monkeypatch.setattr(m3u, 'root_process_count', 3)
+    
+    for disc_file_batches in m3u.scanRootDirectories(root_paths, m3u.RunStats()):
+        list(disc_file_batches)
+    
+    assert sorted(m3u.scan_cache['directories']) == sorted(
+        dir_path for dir_path, dir_names, file_names in os.walk(tmp_path) if dir_path != str(tmp_path)
+    )
+
+
+def test_playlists_are_the_same_with_root_processes(m3u, tmp_path):
+    root_paths = createRoots(tmp_path)
+    config = m3u.GeneratorConfig(use_scan_cache=False, create_log_file=False, root_process_count=3)
+    
+    multi_disc_games_found = m3u.PlaylistGenerator(config).run(root_paths)
+    playlists = { playlist.output_path : playlist.output_disc_paths
+                  for game in multi_disc_games_found for playlist in game.playlists.values() }
+    for playlist_path in playlists:
+        os.remove(playlist_path)
+    multi_disc_games_found = m3u.PlaylistGenerator(config._replace(root_process_count=1)).run(root_paths)
+    
+    assert multi_disc_games_found.stats.saved == len(playlists) > 0
+    assert { playlist.output_path : playlist.output_disc_paths
+             for game in multi_disc_games_found for playlist in game.playlists.values() } == playlists
@@ -0,0 +1,63 @@
+import json
+
+
+def createPlaylists(m3u, games_path):
+    multi_disc_games_found, playlist_count = m3u.findMultiDiscGames(str(games_path), m3u.GameLibrary())
+    multi_disc_games_found = m3u.createPlaylists(multi_disc_games_found)
+    m3u.createLogFile(multi_disc_games_found, show_summary=False)
+    return multi_disc_games_found
+
+
+def readLog(m3u, tmp_path, log_file_format, overwrite_playlists, monkeypatch):
+    games_path = tmp_path / 'games'
+    games_path.mkdir()
+    for disc_number in (1, 2):
+        (games_path / f'Game (Disc {disc_number}).iso').touch()
+        (games_path / f'Other (Disc {disc_number}).iso').touch()
+    createPlaylists(m3u, games_path)
+    (games_path / 'Other.m3u').write_text('Other (Disc 2).iso\n')
+    
+    # Second run, "Game.m3u" doesn't need updating and "Other.m3u" is updated or left alone.
+    monkeypatch.setattr(m3u, 'directory_listings', {})
+    monkeypatch.setattr(m3u, 'overwrite_playlists', overwrite_playlists)
+    monkeypatch.setattr(m3u, 'create_log_file', True)
+    monkeypatch.setattr(m3u, 'log_file_format', log_file_format)
+    log_file_path = tmp_path / f'log.{log_file_format}'
+    m3u.getRunLog(log_file_path)
+    multi_disc_games_found = createPlaylists(m3u, games_path)
+    m3u.run_log.close()
+    return multi_disc_games_found.stats, log_file_path.read_text() if log_file_path.exists() else None
+
+
+def test_jsonl_log_has_every_playlist_outcome(m3u, tmp_path, monkeypatch):
+    run_stats, log_text = readLog(m3u, tmp_path, m3u.LOG_JSONL, False, monkeypatch)
+    
+    records = [json.loads(line) for line in log_text.splitlines()]
+    assert sorted((record['playlist'].rpartition('/')[2], record['outcome'])
+                  for record in records if record['record'] == 'playlist') == [
+        ('Game.m3u', 'not_overwritten'), ('Other.m3u', 'not_overwritten')
+    ]
+    assert records[-1]['record'] == 'summary' and records[-1]['not_overwritten'] == 2
+
+
+def test_jsonl_log_has_playlists_not_updated(m3u, tmp_path, monkeypatch):
+    run_stats, log_text = readLog(m3u, tmp_path, m3u.LOG_JSONL, True, monkeypatch)
+    
+    records = [json.loads(line) for line in log_text.splitlines()]
+    assert sorted((record['playlist'].rpartition('/')[2], record['outcome'])
+                  for record in records if record['record'] == 'playlist') == [
+        ('Game.m3u', 'not_updated'), ('Other.m3u', 'updated')
+    ]
+    assert run_stats.not_updated == 1 and run_stats.updated == 1
+
+
+def test_text_log_only_has_playlists_saved(m3u, tmp_path, monkeypatch):
+    run_stats, log_text = readLog(m3u, tmp_path, m3u.LOG_TEXT, True, monkeypatch)
+    
+    assert 'Other.m3u' in log_text and 'Game.m3u' not in log_text
+
+
+def test_text_log_is_not_created_when_nothing_changed(m3u, tmp_path, monkeypatch):
+    run_stats, log_text = readLog(m3u, tmp_path, m3u.LOG_TEXT, False, monkeypatch)
+    
+    assert log_text is None
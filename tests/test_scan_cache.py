@@ -0,0 +1,28 @@
+import os
+
+
+def scanOldDirectory(m3u, dir_path):
+    # Directories modified in the last few seconds aren't cached yet.
+    os.utime(dir_path, (1000000000, 1000000000))
+    return m3u.scanDirectory(str(dir_path))
+
+
+def test_edited_cue_sheet_is_read_again(m3u, tmp_path):
+    m3u.scan_cache = { 'version' : m3u.getScanCacheVersion(), 'directories' : {} }
+    cue_sheet_path = tmp_path / 'Game (Disc 1).cue'
+    cue_sheet_path.write_text('FILE "Game (Disc 1) (Track 1).bin" BINARY\n')
+    (tmp_path / 'Game (Disc 1) (Track 1).bin').touch()
+    (tmp_path / 'Game (Disc 1) (Track 2).bin').touch()
+    
+    scanOldDirectory(m3u, tmp_path)
+    assert str(tmp_path) in m3u.scan_cache['directories']
+    
+    # Edited in place, so the directory's modified time doesn't change.
+    cue_sheet_path.write_text('FILE "Game (Disc 1) (Track 1).bin" BINARY\nFILE "Game (Disc 1) (Track 2).bin" BINARY\n')
+    m3u.directory_listings.clear()
+    m3u.cue_sheet_tracks.clear()
+    scanOldDirectory(m3u, tmp_path)
+    
+    assert m3u.cue_sheet_tracks[str(tmp_path)]['Game (Disc 1).cue'] == [
+        'Game (Disc 1) (Track 1).bin', 'Game (Disc 1) (Track 2).bin'
+    ]
@@ -0,0 +1,115 @@
+import os
+
+
+def verify(m3u, root):
+    for dir_path, disc_files in m3u.scanDirectoryTree(str(root), worker_count=1):
+        pass
+    return m3u.verifyPlaylists([str(root)], m3u.GameLibrary())
+
+
+def test_playlist_without_discs_is_left_alone(m3u, tmp_path):
+    playlist_text = '#EXTM3U\nhttp://radio.example.com/stream\nmusic/song.mp3\n'
+    (tmp_path / 'radio.m3u').write_text(playlist_text)
+    
+    run_stats = verify(m3u, tmp_path).stats
+    
+    assert (tmp_path / 'radio.m3u').read_text() == playlist_text
+    assert run_stats.repaired == 0 and run_stats.deleted == 0
+
+
+def test_only_missing_discs_are_removed_from_mixed_playlist(m3u, tmp_path):
+    (tmp_path / 'Game (Disc 1).iso').touch()
+    (tmp_path / 'mixed.m3u').write_text(
+        'Game (Disc 1).iso\nGame (Disc 2).iso\nhttp://example.com/Game (Disc 3).iso\nmusic/song.mp3\n'
+    )
+    
+    run_stats = verify(m3u, tmp_path).stats
+    
+    assert (tmp_path / 'mixed.m3u').read_text().splitlines() == [
+        'Game (Disc 1).iso', 'http://example.com/Game (Disc 3).iso', 'music/song.mp3'
+    ]
+    assert run_stats.repaired == 1
+
+
+def test_playlist_keeps_other_entries_when_all_discs_are_missing(m3u, tmp_path):
+    (tmp_path / 'mixed.m3u').write_text('Game (Disc 1).iso\nGame (Disc 2).iso\nmusic/song.mp3\n')
+    
+    run_stats = verify(m3u, tmp_path).stats
+    
+    assert (tmp_path / 'mixed.m3u').read_text().splitlines() == ['music/song.mp3']
+    assert run_stats.repaired == 1 and run_stats.deleted == 0
+
+
+def test_playlist_is_deleted_when_all_discs_are_missing(m3u, tmp_path):
+    (tmp_path / 'Game.m3u').write_text('#EXTM3U\nGame (Disc 1).iso\nGame (Disc 2).iso\n')
+    
+    run_stats = verify(m3u, tmp_path).stats
+    
+    assert not (tmp_path / 'Game.m3u').exists()
+    assert run_stats.deleted == 1
+
+
+def test_playlists_are_read_once(m3u, tmp_path):
+    for disc_number in (1, 2):
+        (tmp_path / f'Game (Disc {disc_number}).iso').touch()
+    (tmp_path / 'Game.m3u').write_text(os.linesep.join([
+        str(tmp_path / 'Game (Disc 1).iso'), str(tmp_path / 'Game (Disc 2).iso'), str(tmp_path / 'Game (Disc 3).iso')
+    ]))
+    
+    multi_disc_games_found, playlist_count = m3u.findMultiDiscGames(str(tmp_path), m3u.GameLibrary())
+    multi_disc_games_found = m3u.createPlaylists(multi_disc_games_found)
+    run_stats = m3u.verifyPlaylists([str(tmp_path)], multi_disc_games_found).stats
+    
+    assert run_stats.not_updated == 1
+    assert run_stats.verified == 1 and run_stats.repaired == 1
+    assert run_stats.playlists_read == 1
+    assert (tmp_path / 'Game.m3u').read_text().splitlines() == [
+        str(tmp_path / 'Game (Disc 1).iso'), str(tmp_path / 'Game (Disc 2).iso')
+    ]
+
+
+def ignoreCase(m3u, monkeypatch):
+    '''Make the drive look like one that ignores upper/lower case (vfat, SMB/CIFS).'''
+    real_exists = os.path.exists
+    def exists(path):
+        dir_path, file_name = os.path.split(path)
+        return real_exists(path) or real_exists(dir_path) and any(
+            name.casefold() == file_name.casefold() for name in os.listdir(dir_path)
+        )
+    monkeypatch.setattr(m3u.os.path, 'exists', exists)
+
+
+def test_discs_differing_only_in_case_are_kept(m3u, tmp_path, monkeypatch):
+    ignoreCase(m3u, monkeypatch)
+    (tmp_path / 'game (disc 1).iso').touch()
+    (tmp_path / 'game (disc 2).iso').touch()
+    (tmp_path / 'Game.m3u').write_text('Game (Disc 1).iso\nGAME (DISC 2).ISO\n')
+    
+    run_stats = verify(m3u, tmp_path).stats
+    
+    assert (tmp_path / 'Game.m3u').read_text().splitlines() == ['Game (Disc 1).iso', 'GAME (DISC 2).ISO']
+    assert run_stats.repaired == 0 and run_stats.deleted == 0
+
+
+def test_discs_differing_only_in_case_are_removed_on_drives_that_match_case(m3u, tmp_path):
+    (tmp_path / 'game (disc 1).iso').touch()
+    (tmp_path / 'Game (Disc 2).iso').touch()
+    (tmp_path / 'Game.m3u').write_text('Game (Disc 1).iso\nGame (Disc 2).iso\n')
+    
+    run_stats = verify(m3u, tmp_path).stats
+    
+    assert (tmp_path / 'Game.m3u').read_text().splitlines() == ['Game (Disc 2).iso']
+    assert run_stats.repaired == 1
+
+
+def test_cue_sheet_tracks_differing_only_in_case_are_found(m3u, tmp_path, monkeypatch):
+    ignoreCase(m3u, monkeypatch)
+    monkeypatch.setattr(m3u, 'check_cue_sheets', m3u.CUE_SHEET_EXCLUDE)
+    (tmp_path / 'Game (Disc 1).cue').write_text('FILE "GAME (DISC 1) (TRACK 1).BIN" BINARY\n')
+    (tmp_path / 'Game (Disc 1) (Track 1).bin').touch()
+    
+    run_stats = m3u.GameLibrary().stats
+    disc_file_batches = list(m3u.checkCueSheets(m3u.scanDirectoryTree(str(tmp_path), worker_count=1), run_stats))
+    
+    assert [disc_file[0] for root, disc_files in disc_file_batches for disc_file in disc_files] == ['Game (Disc 1).cue']
+    assert run_stats.cue_sheets_broken == 0
@@ -0,0 +1,73 @@
+import pytest
+
+
+@pytest.fixture
+def clock(m3u, monkeypatch):
+    '''A clock that only moves when told to, for "watch_delay".'''
+    now = [1000.0]
+    monkeypatch.setattr(m3u.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(m3u, 'watch_delay', 5)
+    return now
+
+
+def watch(m3u, root):
+    m3u.scan_cache = { 'version' : m3u.getScanCacheVersion(), 'directories' : {} }
+    return m3u.WatchedDirectories([str(root)])
+
+
+def test_game_is_updated_once_it_stops_changing(m3u, tmp_path, clock):
+    (tmp_path / 'Game (Disc 1).iso').touch()
+    watched_dirs = watch(m3u, tmp_path)
+    assert watched_dirs.getWaitTime() is None
+    
+    (tmp_path / 'Game (Disc 2).iso').touch()
+    watched_dirs.searchDirectory(str(tmp_path))
+    assert watched_dirs.getWaitTime() == 5
+    
+    clock[0] += 4
+    (tmp_path / 'Game (Disc 3).iso').touch()
+    watched_dirs.searchDirectory(str(tmp_path))
+    clock[0] += 4
+    assert watched_dirs.popReadyGames() == {} and watched_dirs.getWaitTime() == 1
+    
+    clock[0] += 1
+    assert watched_dirs.popReadyGames() == { 'Game' : set() }
+    assert watched_dirs.popReadyGames() == {} and watched_dirs.getWaitTime() is None
+
+
+def test_each_game_waits_on_its_own_changes(m3u, tmp_path, clock):
+    (tmp_path / 'Game (Disc 1).iso').touch()
+    (tmp_path / 'Other (Disc 1).iso').touch()
+    (tmp_path / 'Other (Disc 2).iso').touch()
+    watched_dirs = watch(m3u, tmp_path)
+    
+    (tmp_path / 'Game (Disc 2).iso').touch()
+    watched_dirs.searchDirectory(str(tmp_path))
+    clock[0] += 3
+    (tmp_path / 'Other (Disc 2).iso').unlink()
+    watched_dirs.searchDirectory(str(tmp_path))
+    clock[0] += 2
+    
+    assert watched_dirs.popReadyGames() == { 'Game' : set() }
+    clock[0] += 3
+    assert watched_dirs.popReadyGames() == { 'Other' : {str(tmp_path)} }
+
+
+def test_changed_games_playlists_are_updated(m3u, tmp_path, clock):
+    (tmp_path / 'Game (Disc 1).iso').touch()
+    (tmp_path / 'Game (Disc 2).iso').touch()
+    (tmp_path / 'Other (Disc 1).iso').touch()
+    watched_dirs = watch(m3u, tmp_path)
+    
+    (tmp_path / 'Other (Disc 2).iso').touch()
+    (tmp_path / 'New Sub Directory').mkdir()
+    (tmp_path / 'New Sub Directory' / 'Game (Disc 3).iso').touch()
+    watched_dirs.searchDirectory(str(tmp_path))
+    clock[0] += 5
+    games_updated = m3u.updateWatchedPlaylists(watched_dirs, watched_dirs.popReadyGames())
+    
+    assert sorted(game.name for game in games_updated) == ['Game', 'Other']
+    assert sorted((tmp_path / 'Other.m3u').read_text().splitlines()) == [
+        str(tmp_path / 'Other (Disc 1).iso'), str(tmp_path / 'Other (Disc 2).iso')
+    ]
+    assert str(tmp_path / 'New Sub Directory' / 'Game (Disc 3).iso') in (tmp_path / 'Game.m3u').read_text()